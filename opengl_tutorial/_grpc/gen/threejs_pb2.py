@@ -2,9 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: threejs.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -13,1172 +13,51 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='threejs.proto',
-  package='testservice',
-  syntax='proto3',
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\rthreejs.proto\x12\x0btestservice\"\x16\n\x14\x42\x61sicMaterialRequest\"\x16\n\x14PhongMaterialRequest\"\x19\n\x17StandardMaterialRequest\"B\n\x10MaterialResponse\x12\x15\n\rvertex_shader\x18\x01 \x01(\t\x12\x17\n\x0f\x66ragment_shader\x18\x02 \x01(\t\"O\n\x10GeometryResponse\x12\x10\n\x08position\x18\x01 \x03(\x02\x12\x0e\n\x06normal\x18\x02 \x03(\x02\x12\n\n\x02uv\x18\x03 \x03(\x02\x12\r\n\x05index\x18\x04 \x03(\x05\"\x9e\x01\n\x12\x42oxGeometryRequest\x12\r\n\x05width\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x04 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x05 \x01(\x05\x12\x16\n\x0e\x64\x65pth_segments\x18\x06 \x01(\x05\x12\x11\n\twireframe\x18\x07 \x01(\x08\"\xbd\x01\n\x15SphereGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x02 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x03 \x01(\x05\x12\x11\n\tphi_start\x18\x04 \x01(\x02\x12\x12\n\nphi_length\x18\x05 \x01(\x02\x12\x13\n\x0btheta_start\x18\x06 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x07 \x01(\x02\x12\x11\n\twireframe\x18\x08 \x01(\x08\"\xa1\x01\n\x18TorusKnotGeometryRequest\x12\x14\n\x0ctorus_radius\x18\x01 \x01(\x02\x12\x13\n\x0btube_radius\x18\x02 \x01(\x02\x12\x18\n\x10tubular_segments\x18\x03 \x01(\x05\x12\x17\n\x0fradial_segments\x18\x04 \x01(\x05\x12\t\n\x01p\x18\x05 \x01(\x05\x12\t\n\x01q\x18\x06 \x01(\x05\x12\x11\n\twireframe\x18\x07 \x01(\x08\"O\n\x1aIcosahedronGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06\x64\x65tail\x18\x02 \x01(\x05\x12\x11\n\twireframe\x18\x03 \x01(\x08\"O\n\x1aTetrahedronGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06\x64\x65tail\x18\x02 \x01(\x05\x12\x11\n\twireframe\x18\x03 \x01(\x08\"\xd8\x01\n\x17\x43ylinderGeometryRequest\x12\x12\n\nradius_top\x18\x01 \x01(\x02\x12\x15\n\rradius_bottom\x18\x02 \x01(\x02\x12\x0e\n\x06height\x18\x03 \x01(\x02\x12\x17\n\x0fradial_segments\x18\x04 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x05 \x01(\x05\x12\x12\n\nopen_ended\x18\x06 \x01(\x08\x12\x13\n\x0btheta_start\x18\x07 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x08 \x01(\x02\x12\x11\n\twireframe\x18\t \x01(\x08\"\xb9\x01\n\x13\x43oneGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\x17\n\x0fradial_segments\x18\x03 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x04 \x01(\x05\x12\x12\n\nopen_ended\x18\x05 \x01(\x08\x12\x13\n\x0btheta_start\x18\x06 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x07 \x01(\x02\x12\x11\n\twireframe\x18\x08 \x01(\x08\"w\n\x15\x43ircleGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x10\n\x08segments\x18\x02 \x01(\x05\x12\x13\n\x0btheta_start\x18\x03 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x04 \x01(\x02\x12\x11\n\twireframe\x18\x05 \x01(\x08\"y\n\x14PlaneGeometryRequest\x12\r\n\x05width\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x03 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x04 \x01(\x05\x12\x11\n\twireframe\x18\x05 \x01(\x08\"\xe1\x01\n\x16\x45xtrudeGeometryRequest\x12\x0e\n\x06points\x18\x01 \x03(\x02\x12\x14\n\x0cpath_indices\x18\x02 \x03(\x05\x12\r\n\x05steps\x18\x03 \x01(\x05\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x02\x12\x15\n\rbevel_enabled\x18\x05 \x01(\x08\x12\x17\n\x0f\x62\x65vel_thickness\x18\x06 \x01(\x02\x12\x12\n\nbevel_size\x18\x07 \x01(\x02\x12\x14\n\x0c\x62\x65vel_offset\x18\x08 \x01(\x02\x12\x16\n\x0e\x62\x65vel_segments\x18\t \x01(\x05\x12\x11\n\twireframe\x18\n \x01(\x08\x32\x8b\x07\n\x0fGeometryService\x12O\n\x0b\x42oxGeometry\x12\x1f.testservice.BoxGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12U\n\x0eSphereGeometry\x12\".testservice.SphereGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12[\n\x11TorusKnotGeometry\x12%.testservice.TorusKnotGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12_\n\x13IcosahedronGeometry\x12\'.testservice.IcosahedronGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12_\n\x13TetrahedronGeometry\x12\'.testservice.TetrahedronGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12Y\n\x10\x43ylinderGeometry\x12$.testservice.CylinderGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12Q\n\x0c\x43oneGeometry\x12 .testservice.ConeGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12U\n\x0e\x43ircleGeometry\x12\".testservice.CircleGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12S\n\rPlaneGeometry\x12!.testservice.PlaneGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12W\n\x0f\x45xtrudeGeometry\x12#.testservice.ExtrudeGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x32\x96\x02\n\x0fMaterialService\x12S\n\rBasicMaterial\x12!.testservice.BasicMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x12S\n\rPhongMaterial\x12!.testservice.PhongMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x12Y\n\x10StandardMaterial\x12$.testservice.StandardMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x62\x06proto3'
-)
-
-
-
-
-_BASICMATERIALREQUEST = _descriptor.Descriptor(
-  name='BasicMaterialRequest',
-  full_name='testservice.BasicMaterialRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=30,
-  serialized_end=52,
-)
-
-
-_PHONGMATERIALREQUEST = _descriptor.Descriptor(
-  name='PhongMaterialRequest',
-  full_name='testservice.PhongMaterialRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=54,
-  serialized_end=76,
-)
-
-
-_STANDARDMATERIALREQUEST = _descriptor.Descriptor(
-  name='StandardMaterialRequest',
-  full_name='testservice.StandardMaterialRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=78,
-  serialized_end=103,
-)
-
-
-_MATERIALRESPONSE = _descriptor.Descriptor(
-  name='MaterialResponse',
-  full_name='testservice.MaterialResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='vertex_shader', full_name='testservice.MaterialResponse.vertex_shader', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='fragment_shader', full_name='testservice.MaterialResponse.fragment_shader', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=105,
-  serialized_end=171,
-)
-
-
-_GEOMETRYRESPONSE = _descriptor.Descriptor(
-  name='GeometryResponse',
-  full_name='testservice.GeometryResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='position', full_name='testservice.GeometryResponse.position', index=0,
-      number=1, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='normal', full_name='testservice.GeometryResponse.normal', index=1,
-      number=2, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='uv', full_name='testservice.GeometryResponse.uv', index=2,
-      number=3, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='index', full_name='testservice.GeometryResponse.index', index=3,
-      number=4, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=173,
-  serialized_end=252,
-)
-
-
-_BOXGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='BoxGeometryRequest',
-  full_name='testservice.BoxGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='width', full_name='testservice.BoxGeometryRequest.width', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='testservice.BoxGeometryRequest.height', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='depth', full_name='testservice.BoxGeometryRequest.depth', index=2,
-      number=3, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='width_segments', full_name='testservice.BoxGeometryRequest.width_segments', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height_segments', full_name='testservice.BoxGeometryRequest.height_segments', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='depth_segments', full_name='testservice.BoxGeometryRequest.depth_segments', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.BoxGeometryRequest.wireframe', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=255,
-  serialized_end=413,
-)
-
-
-_SPHEREGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='SphereGeometryRequest',
-  full_name='testservice.SphereGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='testservice.SphereGeometryRequest.radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='width_segments', full_name='testservice.SphereGeometryRequest.width_segments', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height_segments', full_name='testservice.SphereGeometryRequest.height_segments', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='phi_start', full_name='testservice.SphereGeometryRequest.phi_start', index=3,
-      number=4, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='phi_length', full_name='testservice.SphereGeometryRequest.phi_length', index=4,
-      number=5, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_start', full_name='testservice.SphereGeometryRequest.theta_start', index=5,
-      number=6, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_length', full_name='testservice.SphereGeometryRequest.theta_length', index=6,
-      number=7, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.SphereGeometryRequest.wireframe', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=416,
-  serialized_end=605,
-)
-
-
-_TORUSKNOTGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='TorusKnotGeometryRequest',
-  full_name='testservice.TorusKnotGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='torus_radius', full_name='testservice.TorusKnotGeometryRequest.torus_radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tube_radius', full_name='testservice.TorusKnotGeometryRequest.tube_radius', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='tubular_segments', full_name='testservice.TorusKnotGeometryRequest.tubular_segments', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='radial_segments', full_name='testservice.TorusKnotGeometryRequest.radial_segments', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='p', full_name='testservice.TorusKnotGeometryRequest.p', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='q', full_name='testservice.TorusKnotGeometryRequest.q', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.TorusKnotGeometryRequest.wireframe', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=608,
-  serialized_end=769,
-)
-
-
-_ICOSAHEDRONGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='IcosahedronGeometryRequest',
-  full_name='testservice.IcosahedronGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='testservice.IcosahedronGeometryRequest.radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='detail', full_name='testservice.IcosahedronGeometryRequest.detail', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.IcosahedronGeometryRequest.wireframe', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=771,
-  serialized_end=850,
-)
-
-
-_TETRAHEDRONGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='TetrahedronGeometryRequest',
-  full_name='testservice.TetrahedronGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='testservice.TetrahedronGeometryRequest.radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='detail', full_name='testservice.TetrahedronGeometryRequest.detail', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.TetrahedronGeometryRequest.wireframe', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=852,
-  serialized_end=931,
-)
-
-
-_CYLINDERGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='CylinderGeometryRequest',
-  full_name='testservice.CylinderGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius_top', full_name='testservice.CylinderGeometryRequest.radius_top', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='radius_bottom', full_name='testservice.CylinderGeometryRequest.radius_bottom', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='testservice.CylinderGeometryRequest.height', index=2,
-      number=3, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='radial_segments', full_name='testservice.CylinderGeometryRequest.radial_segments', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height_segments', full_name='testservice.CylinderGeometryRequest.height_segments', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='open_ended', full_name='testservice.CylinderGeometryRequest.open_ended', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_start', full_name='testservice.CylinderGeometryRequest.theta_start', index=6,
-      number=7, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_length', full_name='testservice.CylinderGeometryRequest.theta_length', index=7,
-      number=8, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.CylinderGeometryRequest.wireframe', index=8,
-      number=9, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=934,
-  serialized_end=1150,
-)
-
-
-_CONEGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='ConeGeometryRequest',
-  full_name='testservice.ConeGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='testservice.ConeGeometryRequest.radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='testservice.ConeGeometryRequest.height', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='radial_segments', full_name='testservice.ConeGeometryRequest.radial_segments', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height_segments', full_name='testservice.ConeGeometryRequest.height_segments', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='open_ended', full_name='testservice.ConeGeometryRequest.open_ended', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_start', full_name='testservice.ConeGeometryRequest.theta_start', index=5,
-      number=6, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_length', full_name='testservice.ConeGeometryRequest.theta_length', index=6,
-      number=7, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.ConeGeometryRequest.wireframe', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1153,
-  serialized_end=1338,
-)
-
-
-_CIRCLEGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='CircleGeometryRequest',
-  full_name='testservice.CircleGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='radius', full_name='testservice.CircleGeometryRequest.radius', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='segments', full_name='testservice.CircleGeometryRequest.segments', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_start', full_name='testservice.CircleGeometryRequest.theta_start', index=2,
-      number=3, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='theta_length', full_name='testservice.CircleGeometryRequest.theta_length', index=3,
-      number=4, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.CircleGeometryRequest.wireframe', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1340,
-  serialized_end=1459,
-)
-
-
-_PLANEGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='PlaneGeometryRequest',
-  full_name='testservice.PlaneGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='width', full_name='testservice.PlaneGeometryRequest.width', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height', full_name='testservice.PlaneGeometryRequest.height', index=1,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='width_segments', full_name='testservice.PlaneGeometryRequest.width_segments', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='height_segments', full_name='testservice.PlaneGeometryRequest.height_segments', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.PlaneGeometryRequest.wireframe', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1461,
-  serialized_end=1582,
-)
-
-
-_EXTRUDEGEOMETRYREQUEST = _descriptor.Descriptor(
-  name='ExtrudeGeometryRequest',
-  full_name='testservice.ExtrudeGeometryRequest',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  create_key=_descriptor._internal_create_key,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='points', full_name='testservice.ExtrudeGeometryRequest.points', index=0,
-      number=1, type=2, cpp_type=6, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='path_indices', full_name='testservice.ExtrudeGeometryRequest.path_indices', index=1,
-      number=2, type=5, cpp_type=1, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='steps', full_name='testservice.ExtrudeGeometryRequest.steps', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='depth', full_name='testservice.ExtrudeGeometryRequest.depth', index=3,
-      number=4, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bevel_enabled', full_name='testservice.ExtrudeGeometryRequest.bevel_enabled', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bevel_thickness', full_name='testservice.ExtrudeGeometryRequest.bevel_thickness', index=5,
-      number=6, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bevel_size', full_name='testservice.ExtrudeGeometryRequest.bevel_size', index=6,
-      number=7, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bevel_offset', full_name='testservice.ExtrudeGeometryRequest.bevel_offset', index=7,
-      number=8, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='bevel_segments', full_name='testservice.ExtrudeGeometryRequest.bevel_segments', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-    _descriptor.FieldDescriptor(
-      name='wireframe', full_name='testservice.ExtrudeGeometryRequest.wireframe', index=9,
-      number=10, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1585,
-  serialized_end=1810,
-)
-
-DESCRIPTOR.message_types_by_name['BasicMaterialRequest'] = _BASICMATERIALREQUEST
-DESCRIPTOR.message_types_by_name['PhongMaterialRequest'] = _PHONGMATERIALREQUEST
-DESCRIPTOR.message_types_by_name['StandardMaterialRequest'] = _STANDARDMATERIALREQUEST
-DESCRIPTOR.message_types_by_name['MaterialResponse'] = _MATERIALRESPONSE
-DESCRIPTOR.message_types_by_name['GeometryResponse'] = _GEOMETRYRESPONSE
-DESCRIPTOR.message_types_by_name['BoxGeometryRequest'] = _BOXGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['SphereGeometryRequest'] = _SPHEREGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['TorusKnotGeometryRequest'] = _TORUSKNOTGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['IcosahedronGeometryRequest'] = _ICOSAHEDRONGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['TetrahedronGeometryRequest'] = _TETRAHEDRONGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['CylinderGeometryRequest'] = _CYLINDERGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['ConeGeometryRequest'] = _CONEGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['CircleGeometryRequest'] = _CIRCLEGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['PlaneGeometryRequest'] = _PLANEGEOMETRYREQUEST
-DESCRIPTOR.message_types_by_name['ExtrudeGeometryRequest'] = _EXTRUDEGEOMETRYREQUEST
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-BasicMaterialRequest = _reflection.GeneratedProtocolMessageType('BasicMaterialRequest', (_message.Message,), {
-  'DESCRIPTOR' : _BASICMATERIALREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.BasicMaterialRequest)
-  })
-_sym_db.RegisterMessage(BasicMaterialRequest)
-
-PhongMaterialRequest = _reflection.GeneratedProtocolMessageType('PhongMaterialRequest', (_message.Message,), {
-  'DESCRIPTOR' : _PHONGMATERIALREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.PhongMaterialRequest)
-  })
-_sym_db.RegisterMessage(PhongMaterialRequest)
-
-StandardMaterialRequest = _reflection.GeneratedProtocolMessageType('StandardMaterialRequest', (_message.Message,), {
-  'DESCRIPTOR' : _STANDARDMATERIALREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.StandardMaterialRequest)
-  })
-_sym_db.RegisterMessage(StandardMaterialRequest)
-
-MaterialResponse = _reflection.GeneratedProtocolMessageType('MaterialResponse', (_message.Message,), {
-  'DESCRIPTOR' : _MATERIALRESPONSE,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.MaterialResponse)
-  })
-_sym_db.RegisterMessage(MaterialResponse)
-
-GeometryResponse = _reflection.GeneratedProtocolMessageType('GeometryResponse', (_message.Message,), {
-  'DESCRIPTOR' : _GEOMETRYRESPONSE,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.GeometryResponse)
-  })
-_sym_db.RegisterMessage(GeometryResponse)
-
-BoxGeometryRequest = _reflection.GeneratedProtocolMessageType('BoxGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _BOXGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.BoxGeometryRequest)
-  })
-_sym_db.RegisterMessage(BoxGeometryRequest)
-
-SphereGeometryRequest = _reflection.GeneratedProtocolMessageType('SphereGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _SPHEREGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.SphereGeometryRequest)
-  })
-_sym_db.RegisterMessage(SphereGeometryRequest)
-
-TorusKnotGeometryRequest = _reflection.GeneratedProtocolMessageType('TorusKnotGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _TORUSKNOTGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.TorusKnotGeometryRequest)
-  })
-_sym_db.RegisterMessage(TorusKnotGeometryRequest)
-
-IcosahedronGeometryRequest = _reflection.GeneratedProtocolMessageType('IcosahedronGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _ICOSAHEDRONGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.IcosahedronGeometryRequest)
-  })
-_sym_db.RegisterMessage(IcosahedronGeometryRequest)
-
-TetrahedronGeometryRequest = _reflection.GeneratedProtocolMessageType('TetrahedronGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _TETRAHEDRONGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.TetrahedronGeometryRequest)
-  })
-_sym_db.RegisterMessage(TetrahedronGeometryRequest)
-
-CylinderGeometryRequest = _reflection.GeneratedProtocolMessageType('CylinderGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _CYLINDERGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.CylinderGeometryRequest)
-  })
-_sym_db.RegisterMessage(CylinderGeometryRequest)
-
-ConeGeometryRequest = _reflection.GeneratedProtocolMessageType('ConeGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _CONEGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.ConeGeometryRequest)
-  })
-_sym_db.RegisterMessage(ConeGeometryRequest)
-
-CircleGeometryRequest = _reflection.GeneratedProtocolMessageType('CircleGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _CIRCLEGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.CircleGeometryRequest)
-  })
-_sym_db.RegisterMessage(CircleGeometryRequest)
-
-PlaneGeometryRequest = _reflection.GeneratedProtocolMessageType('PlaneGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _PLANEGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.PlaneGeometryRequest)
-  })
-_sym_db.RegisterMessage(PlaneGeometryRequest)
-
-ExtrudeGeometryRequest = _reflection.GeneratedProtocolMessageType('ExtrudeGeometryRequest', (_message.Message,), {
-  'DESCRIPTOR' : _EXTRUDEGEOMETRYREQUEST,
-  '__module__' : 'threejs_pb2'
-  # @@protoc_insertion_point(class_scope:testservice.ExtrudeGeometryRequest)
-  })
-_sym_db.RegisterMessage(ExtrudeGeometryRequest)
-
-
-
-_GEOMETRYSERVICE = _descriptor.ServiceDescriptor(
-  name='GeometryService',
-  full_name='testservice.GeometryService',
-  file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_start=1813,
-  serialized_end=2720,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='BoxGeometry',
-    full_name='testservice.GeometryService.BoxGeometry',
-    index=0,
-    containing_service=None,
-    input_type=_BOXGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='SphereGeometry',
-    full_name='testservice.GeometryService.SphereGeometry',
-    index=1,
-    containing_service=None,
-    input_type=_SPHEREGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='TorusKnotGeometry',
-    full_name='testservice.GeometryService.TorusKnotGeometry',
-    index=2,
-    containing_service=None,
-    input_type=_TORUSKNOTGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='IcosahedronGeometry',
-    full_name='testservice.GeometryService.IcosahedronGeometry',
-    index=3,
-    containing_service=None,
-    input_type=_ICOSAHEDRONGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='TetrahedronGeometry',
-    full_name='testservice.GeometryService.TetrahedronGeometry',
-    index=4,
-    containing_service=None,
-    input_type=_TETRAHEDRONGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='CylinderGeometry',
-    full_name='testservice.GeometryService.CylinderGeometry',
-    index=5,
-    containing_service=None,
-    input_type=_CYLINDERGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='ConeGeometry',
-    full_name='testservice.GeometryService.ConeGeometry',
-    index=6,
-    containing_service=None,
-    input_type=_CONEGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='CircleGeometry',
-    full_name='testservice.GeometryService.CircleGeometry',
-    index=7,
-    containing_service=None,
-    input_type=_CIRCLEGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='PlaneGeometry',
-    full_name='testservice.GeometryService.PlaneGeometry',
-    index=8,
-    containing_service=None,
-    input_type=_PLANEGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='ExtrudeGeometry',
-    full_name='testservice.GeometryService.ExtrudeGeometry',
-    index=9,
-    containing_service=None,
-    input_type=_EXTRUDEGEOMETRYREQUEST,
-    output_type=_GEOMETRYRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_GEOMETRYSERVICE)
-
-DESCRIPTOR.services_by_name['GeometryService'] = _GEOMETRYSERVICE
-
-
-_MATERIALSERVICE = _descriptor.ServiceDescriptor(
-  name='MaterialService',
-  full_name='testservice.MaterialService',
-  file=DESCRIPTOR,
-  index=1,
-  serialized_options=None,
-  create_key=_descriptor._internal_create_key,
-  serialized_start=2723,
-  serialized_end=3001,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='BasicMaterial',
-    full_name='testservice.MaterialService.BasicMaterial',
-    index=0,
-    containing_service=None,
-    input_type=_BASICMATERIALREQUEST,
-    output_type=_MATERIALRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='PhongMaterial',
-    full_name='testservice.MaterialService.PhongMaterial',
-    index=1,
-    containing_service=None,
-    input_type=_PHONGMATERIALREQUEST,
-    output_type=_MATERIALRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-  _descriptor.MethodDescriptor(
-    name='StandardMaterial',
-    full_name='testservice.MaterialService.StandardMaterial',
-    index=2,
-    containing_service=None,
-    input_type=_STANDARDMATERIALREQUEST,
-    output_type=_MATERIALRESPONSE,
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_MATERIALSERVICE)
-
-DESCRIPTOR.services_by_name['MaterialService'] = _MATERIALSERVICE
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rthreejs.proto\x12\x0btestservice\"\x16\n\x14\x42\x61sicMaterialRequest\"\x16\n\x14PhongMaterialRequest\"\x19\n\x17StandardMaterialRequest\"B\n\x10MaterialResponse\x12\x15\n\rvertex_shader\x18\x01 \x01(\t\x12\x17\n\x0f\x66ragment_shader\x18\x02 \x01(\t\"\xd3\x01\n\x10GeometryResponse\x12\x10\n\x08position\x18\x01 \x03(\x02\x12\x0e\n\x06normal\x18\x02 \x03(\x02\x12\n\n\x02uv\x18\x03 \x03(\x02\x12\r\n\x05index\x18\x04 \x03(\x05\x12\x14\n\x0cvertex_count\x18\x05 \x01(\r\x12\x13\n\x0bindex_count\x18\x06 \x01(\r\x12\x17\n\x0fpacked_position\x18\x07 \x01(\x0c\x12\x15\n\rpacked_normal\x18\x08 \x01(\x0c\x12\x11\n\tpacked_uv\x18\t \x01(\x0c\x12\x14\n\x0cpacked_index\x18\n \x01(\x0c\"\x9e\x01\n\x12\x42oxGeometryRequest\x12\r\n\x05width\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x04 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x05 \x01(\x05\x12\x16\n\x0e\x64\x65pth_segments\x18\x06 \x01(\x05\x12\x11\n\twireframe\x18\x07 \x01(\x08\"\xbd\x01\n\x15SphereGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x02 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x03 \x01(\x05\x12\x11\n\tphi_start\x18\x04 \x01(\x02\x12\x12\n\nphi_length\x18\x05 \x01(\x02\x12\x13\n\x0btheta_start\x18\x06 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x07 \x01(\x02\x12\x11\n\twireframe\x18\x08 \x01(\x08\"\xa1\x01\n\x18TorusKnotGeometryRequest\x12\x14\n\x0ctorus_radius\x18\x01 \x01(\x02\x12\x13\n\x0btube_radius\x18\x02 \x01(\x02\x12\x18\n\x10tubular_segments\x18\x03 \x01(\x05\x12\x17\n\x0fradial_segments\x18\x04 \x01(\x05\x12\t\n\x01p\x18\x05 \x01(\x05\x12\t\n\x01q\x18\x06 \x01(\x05\x12\x11\n\twireframe\x18\x07 \x01(\x08\"O\n\x1aIcosahedronGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06\x64\x65tail\x18\x02 \x01(\x05\x12\x11\n\twireframe\x18\x03 \x01(\x08\"O\n\x1aTetrahedronGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06\x64\x65tail\x18\x02 \x01(\x05\x12\x11\n\twireframe\x18\x03 \x01(\x08\"\xd8\x01\n\x17\x43ylinderGeometryRequest\x12\x12\n\nradius_top\x18\x01 \x01(\x02\x12\x15\n\rradius_bottom\x18\x02 \x01(\x02\x12\x0e\n\x06height\x18\x03 \x01(\x02\x12\x17\n\x0fradial_segments\x18\x04 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x05 \x01(\x05\x12\x12\n\nopen_ended\x18\x06 \x01(\x08\x12\x13\n\x0btheta_start\x18\x07 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x08 \x01(\x02\x12\x11\n\twireframe\x18\t \x01(\x08\"\xb9\x01\n\x13\x43oneGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\x17\n\x0fradial_segments\x18\x03 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x04 \x01(\x05\x12\x12\n\nopen_ended\x18\x05 \x01(\x08\x12\x13\n\x0btheta_start\x18\x06 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x07 \x01(\x02\x12\x11\n\twireframe\x18\x08 \x01(\x08\"w\n\x15\x43ircleGeometryRequest\x12\x0e\n\x06radius\x18\x01 \x01(\x02\x12\x10\n\x08segments\x18\x02 \x01(\x05\x12\x13\n\x0btheta_start\x18\x03 \x01(\x02\x12\x14\n\x0ctheta_length\x18\x04 \x01(\x02\x12\x11\n\twireframe\x18\x05 \x01(\x08\"y\n\x14PlaneGeometryRequest\x12\r\n\x05width\x18\x01 \x01(\x02\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\x16\n\x0ewidth_segments\x18\x03 \x01(\x05\x12\x17\n\x0fheight_segments\x18\x04 \x01(\x05\x12\x11\n\twireframe\x18\x05 \x01(\x08\"\xe1\x01\n\x16\x45xtrudeGeometryRequest\x12\x0e\n\x06points\x18\x01 \x03(\x02\x12\x14\n\x0cpath_indices\x18\x02 \x03(\x05\x12\r\n\x05steps\x18\x03 \x01(\x05\x12\r\n\x05\x64\x65pth\x18\x04 \x01(\x02\x12\x15\n\rbevel_enabled\x18\x05 \x01(\x08\x12\x17\n\x0f\x62\x65vel_thickness\x18\x06 \x01(\x02\x12\x12\n\nbevel_size\x18\x07 \x01(\x02\x12\x14\n\x0c\x62\x65vel_offset\x18\x08 \x01(\x02\x12\x16\n\x0e\x62\x65vel_segments\x18\t \x01(\x05\x12\x11\n\twireframe\x18\n \x01(\x08\"\xa8\x05\n\x0fGeometryRequest\x12\x37\n\x0c\x62ox_geometry\x18\x01 \x01(\x0b\x32\x1f.testservice.BoxGeometryRequestH\x00\x12=\n\x0fsphere_geometry\x18\x02 \x01(\x0b\x32\".testservice.SphereGeometryRequestH\x00\x12\x44\n\x13torus_knot_geometry\x18\x03 \x01(\x0b\x32%.testservice.TorusKnotGeometryRequestH\x00\x12G\n\x14icosahedron_geometry\x18\x04 \x01(\x0b\x32\'.testservice.IcosahedronGeometryRequestH\x00\x12G\n\x14tetrahedron_geometry\x18\x05 \x01(\x0b\x32\'.testservice.TetrahedronGeometryRequestH\x00\x12\x41\n\x11\x63ylinder_geometry\x18\x06 \x01(\x0b\x32$.testservice.CylinderGeometryRequestH\x00\x12\x39\n\rcone_geometry\x18\x07 \x01(\x0b\x32 .testservice.ConeGeometryRequestH\x00\x12=\n\x0f\x63ircle_geometry\x18\x08 \x01(\x0b\x32\".testservice.CircleGeometryRequestH\x00\x12;\n\x0eplane_geometry\x18\t \x01(\x0b\x32!.testservice.PlaneGeometryRequestH\x00\x12?\n\x10\x65xtrude_geometry\x18\n \x01(\x0b\x32#.testservice.ExtrudeGeometryRequestH\x00\x42\n\n\x08geometry\"F\n\x14\x42\x61tchGeometryRequest\x12.\n\x08requests\x18\x01 \x03(\x0b\x32\x1c.testservice.GeometryRequest\"I\n\x15\x42\x61tchGeometryResponse\x12\x30\n\tresponses\x18\x01 \x03(\x0b\x32\x1d.testservice.GeometryResponse2\xe5\x07\n\x0fGeometryService\x12O\n\x0b\x42oxGeometry\x12\x1f.testservice.BoxGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12U\n\x0eSphereGeometry\x12\".testservice.SphereGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12[\n\x11TorusKnotGeometry\x12%.testservice.TorusKnotGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12_\n\x13IcosahedronGeometry\x12\'.testservice.IcosahedronGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12_\n\x13TetrahedronGeometry\x12\'.testservice.TetrahedronGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12Y\n\x10\x43ylinderGeometry\x12$.testservice.CylinderGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12Q\n\x0c\x43oneGeometry\x12 .testservice.ConeGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12U\n\x0e\x43ircleGeometry\x12\".testservice.CircleGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12S\n\rPlaneGeometry\x12!.testservice.PlaneGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12W\n\x0f\x45xtrudeGeometry\x12#.testservice.ExtrudeGeometryRequest\x1a\x1d.testservice.GeometryResponse\"\x00\x12X\n\rBatchGeometry\x12!.testservice.BatchGeometryRequest\x1a\".testservice.BatchGeometryResponse\"\x00\x32\x96\x02\n\x0fMaterialService\x12S\n\rBasicMaterial\x12!.testservice.BasicMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x12S\n\rPhongMaterial\x12!.testservice.PhongMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x12Y\n\x10StandardMaterial\x12$.testservice.StandardMaterialRequest\x1a\x1d.testservice.MaterialResponse\"\x00\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'threejs_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _BASICMATERIALREQUEST._serialized_start=30
+  _BASICMATERIALREQUEST._serialized_end=52
+  _PHONGMATERIALREQUEST._serialized_start=54
+  _PHONGMATERIALREQUEST._serialized_end=76
+  _STANDARDMATERIALREQUEST._serialized_start=78
+  _STANDARDMATERIALREQUEST._serialized_end=103
+  _MATERIALRESPONSE._serialized_start=105
+  _MATERIALRESPONSE._serialized_end=171
+  _GEOMETRYRESPONSE._serialized_start=174
+  _GEOMETRYRESPONSE._serialized_end=385
+  _BOXGEOMETRYREQUEST._serialized_start=388
+  _BOXGEOMETRYREQUEST._serialized_end=546
+  _SPHEREGEOMETRYREQUEST._serialized_start=549
+  _SPHEREGEOMETRYREQUEST._serialized_end=738
+  _TORUSKNOTGEOMETRYREQUEST._serialized_start=741
+  _TORUSKNOTGEOMETRYREQUEST._serialized_end=902
+  _ICOSAHEDRONGEOMETRYREQUEST._serialized_start=904
+  _ICOSAHEDRONGEOMETRYREQUEST._serialized_end=983
+  _TETRAHEDRONGEOMETRYREQUEST._serialized_start=985
+  _TETRAHEDRONGEOMETRYREQUEST._serialized_end=1064
+  _CYLINDERGEOMETRYREQUEST._serialized_start=1067
+  _CYLINDERGEOMETRYREQUEST._serialized_end=1283
+  _CONEGEOMETRYREQUEST._serialized_start=1286
+  _CONEGEOMETRYREQUEST._serialized_end=1471
+  _CIRCLEGEOMETRYREQUEST._serialized_start=1473
+  _CIRCLEGEOMETRYREQUEST._serialized_end=1592
+  _PLANEGEOMETRYREQUEST._serialized_start=1594
+  _PLANEGEOMETRYREQUEST._serialized_end=1715
+  _EXTRUDEGEOMETRYREQUEST._serialized_start=1718
+  _EXTRUDEGEOMETRYREQUEST._serialized_end=1943
+  _GEOMETRYREQUEST._serialized_start=1946
+  _GEOMETRYREQUEST._serialized_end=2626
+  _BATCHGEOMETRYREQUEST._serialized_start=2628
+  _BATCHGEOMETRYREQUEST._serialized_end=2698
+  _BATCHGEOMETRYRESPONSE._serialized_start=2700
+  _BATCHGEOMETRYRESPONSE._serialized_end=2773
+  _GEOMETRYSERVICE._serialized_start=2776
+  _GEOMETRYSERVICE._serialized_end=3773
+  _MATERIALSERVICE._serialized_start=3776
+  _MATERIALSERVICE._serialized_end=4054
 # @@protoc_insertion_point(module_scope)
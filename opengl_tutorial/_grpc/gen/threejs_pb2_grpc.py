@@ -64,6 +64,11 @@ class GeometryServiceStub(object):
                 request_serializer=threejs__pb2.ExtrudeGeometryRequest.SerializeToString,
                 response_deserializer=threejs__pb2.GeometryResponse.FromString,
                 )
+        self.BatchGeometry = channel.unary_unary(
+                '/testservice.GeometryService/BatchGeometry',
+                request_serializer=threejs__pb2.BatchGeometryRequest.SerializeToString,
+                response_deserializer=threejs__pb2.BatchGeometryResponse.FromString,
+                )
 
 
 class GeometryServiceServicer(object):
@@ -129,6 +134,12 @@ class GeometryServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGeometry(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_GeometryServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -182,6 +193,11 @@ def add_GeometryServiceServicer_to_server(servicer, server):
                     request_deserializer=threejs__pb2.ExtrudeGeometryRequest.FromString,
                     response_serializer=threejs__pb2.GeometryResponse.SerializeToString,
             ),
+            'BatchGeometry': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGeometry,
+                    request_deserializer=threejs__pb2.BatchGeometryRequest.FromString,
+                    response_serializer=threejs__pb2.BatchGeometryResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'testservice.GeometryService', rpc_method_handlers)
@@ -362,6 +378,23 @@ class GeometryService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def BatchGeometry(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/testservice.GeometryService/BatchGeometry',
+            threejs__pb2.BatchGeometryRequest.SerializeToString,
+            threejs__pb2.BatchGeometryResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
 
 class MaterialServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -0,0 +1,113 @@
+"""Time of extrude_geometry for bevelled outlines, and a check that its caps meet
+the side walls.
+
+The side walls are built on each outline moved by the bevel offset, so the caps
+have to cover exactly the area of the moved outlines, as three.js' do. Run from
+opengl_tutorial/:
+
+    python benchmarks/extrude.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from threejs import (
+    bevel_vectors,
+    extrude_geometry,
+    flatten_quadratic_path,
+    signed_area,
+    split_subpaths,
+)
+from threejs.triangulate import cross
+from vertex_cache import quadratic_circle
+
+
+def straight_path(corners):
+    # [start, handle, end] triples along the edges of a polygon.
+    corners = np.asarray(corners, dtype=np.float64)
+    following = np.roll(corners, -1, axis=0)
+    curves = np.stack([corners, (corners + following) / 2, following], 1)
+    curves = curves.reshape((-1, 2))
+    return np.column_stack([curves, np.zeros(len(curves))])
+
+
+def star(points, outer, inner):
+    angles = np.arange(2 * points) * np.pi / points
+    radii = np.where(np.arange(2 * points) % 2 == 0, outer, inner)
+    return straight_path(np.stack([radii * np.cos(angles), radii * np.sin(angles)], -1))
+
+
+OUTLINES = {
+    # An acute concave corner, whose clamped miter leaves the offset edges.
+    "concave pentagon": [straight_path([(0, 0), (4, 0), (4, 4), (2, 1.5), (0, 4)])],
+    "star": [star(5, 1, 0.4)],
+    "ring": [quadratic_circle(1, 16), quadratic_circle(0.5, 16)[::-1]],
+}
+
+
+def get_points(paths):
+    path_indices = np.cumsum([0] + [len(path) for path in paths[:-1]])
+    return np.concatenate(paths).ravel(), path_indices
+
+
+def get_outline_area(paths, bevel_offset):
+    # The outer path is oriented clockwise and the holes counter-clockwise
+    # before they're moved, like in extrude_shape.
+    area = 0
+    for i, path in enumerate(split_subpaths(*get_points(paths))):
+        ring = flatten_quadratic_path(path)
+        if np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if (signed_area(ring) < 0) != (i == 0):
+            ring = ring[::-1]
+        moved = ring + bevel_vectors(ring) * bevel_offset
+        area += abs(signed_area(moved)) * (1 if i == 0 else -1)
+    return area
+
+
+def get_cap_areas(geometry):
+    # The caps are the triangles which lie in a single plane of constant z.
+    triangles = geometry.attributes["position"].astype(np.float64).reshape((-1, 3, 3))
+    z = triangles[:, :, 2]
+    flat = np.all(z == z[:, :1], axis=1)
+    areas = cross(*triangles[flat].transpose((1, 0, 2))) / 2
+    return areas[z[flat, 0] == z.min()].sum(), areas[z[flat, 0] == z.max()].sum()
+
+
+def main():
+    print(f"{'':>17} {'offset':>6} {'back':>8} {'front':>8} {'outline':>8} {'time':>8}")
+    for name, paths in OUTLINES.items():
+        points, path_indices = get_points(paths)
+        for bevel_offset in [0, 0.05, -0.02]:
+
+            def extrude():
+                return extrude_geometry(
+                    points=points,
+                    path_indices=path_indices,
+                    depth=0.5,
+                    bevel_enabled=True,
+                    bevel_size=0.05,
+                    bevel_thickness=0.05,
+                    bevel_offset=bevel_offset,
+                    bevel_segments=3,
+                )
+
+            back, front = get_cap_areas(extrude())
+            outline = get_outline_area(paths, bevel_offset)
+            # float32 positions.
+            assert np.isclose(front, outline, rtol=1e-5), (name, front, outline)
+            assert np.isclose(-back, outline, rtol=1e-5), (name, back, outline)
+            seconds = min(timeit.repeat(extrude, number=10, repeat=3)) / 10
+            print(
+                f"{name:>17} {bevel_offset:6.2f} {back:8.4f} {front:8.4f}"
+                f" {outline:8.4f} {seconds * 1e3:5.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Per-frame cost of computing the world and normal matrices of 10k orbiting
+bodies, as in the HierarchicalModelMatrices and OrbitingBodies scenes.
+
+A sun is orbited by planets, each of which is orbited by moons. Every frame each
+body advances along its orbit and the world and normal matrix of every body is
+read, as ThreeMesh.set_uniforms does. Run from opengl_tutorial/:
+
+    python benchmarks/transform_store.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import manim.utils.opengl as opengl
+from manim.renderer.shader import Object3D
+from threejs import ThreeObject3D, TransformStore
+
+NUM_PLANETS = 100
+MOONS_PER_PLANET = 99
+
+
+def make_system(cls):
+    sun = cls()
+    planets = []
+    moons = []
+    for i in range(NUM_PLANETS):
+        planet = cls()
+        planet.model_matrix = opengl.z_rotation_matrix(
+            z=i * 2.4
+        ) @ opengl.translation_matrix(x=5 + i * 0.5)
+        sun.add(planet)
+        planets.append(planet)
+        for j in range(MOONS_PER_PLANET):
+            moon = cls()
+            moon.model_matrix = (
+                opengl.z_rotation_matrix(z=j * 0.7)
+                @ opengl.translation_matrix(x=1 + j * 0.01)
+                @ opengl.scale_matrix(0.1)
+            )
+            planet.add(moon)
+            moons.append(moon)
+    return sun, planets, moons
+
+
+def read_matrices(bodies):
+    for body in bodies:
+        body.hierarchical_model_matrix()
+        body.hierarchical_normal_matrix()
+
+
+def main():
+    orbit_step = opengl.z_rotation_matrix(z=0.01)
+
+    # Every body advances through its model_matrix, one at a time.
+    def object_frame(bodies):
+        def frame():
+            for body in bodies[1:]:
+                body.model_matrix = orbit_step @ body.model_matrix
+            read_matrices(bodies)
+
+        return frame
+
+    legacy_bodies = [
+        body
+        for group in make_system(Object3D)
+        for body in (group if isinstance(group, list) else [group])
+    ]
+    cached_bodies = [
+        body
+        for group in make_system(ThreeObject3D)
+        for body in (group if isinstance(group, list) else [group])
+    ]
+
+    # With a TransformStore all of the orbits advance with one matmul.
+    store_sun, store_planets, store_moons = make_system(ThreeObject3D)
+    store_bodies = [store_sun, *store_planets, *store_moons]
+    store = TransformStore()
+    store.add(store_sun)
+    orbiting = store.indices(store_bodies[1:])
+    orbit_steps = np.broadcast_to(orbit_step.astype(np.float32), (len(orbiting), 4, 4))
+
+    def store_frame():
+        store.model_matrices[orbiting] = np.matmul(
+            orbit_steps, store.model_matrices[orbiting]
+        )
+        store.invalidate()
+        read_matrices(store_bodies)
+
+    # The store should produce the same matrices as plain Object3Ds.
+    for frame in [object_frame(legacy_bodies), store_frame]:
+        frame()
+    for legacy_body, store_body in zip(legacy_bodies, store_bodies):
+        assert np.allclose(
+            legacy_body.hierarchical_model_matrix(),
+            store_body.hierarchical_model_matrix(),
+            atol=1e-3,
+        )
+
+    print(f"{len(store_bodies)} bodies, {len(store.levels)} levels")
+    for label, frame, number in [
+        ("Object3D", object_frame(legacy_bodies), 1),
+        ("CachedTransform", object_frame(cached_bodies), 1),
+        ("TransformStore", store_frame, 5),
+    ]:
+        seconds = min(timeit.repeat(frame, number=number, repeat=3)) / number
+        print(f"{label:>16}: {seconds * 1e3:8.1f} ms per frame")
+
+    # Reading the matrices is most of the cost left. The matrices themselves
+    # are computed in a few milliseconds.
+    def store_update():
+        store.invalidate()
+        store.update()
+
+    seconds = min(timeit.repeat(store_update, number=10, repeat=3)) / 10
+    print(f"{'store.update()':>16}: {seconds * 1e3:8.1f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
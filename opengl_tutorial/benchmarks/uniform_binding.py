@@ -0,0 +1,229 @@
+"""Per-mesh cost of ThreeMesh.set_uniforms, before and after UniformBinder and
+FrameState.
+
+The mock program mirrors the uniforms of a three.js MeshPhongMaterial program
+lit by 25 point lights, 100+ uniforms in total. Run from opengl_tutorial/:
+
+    python benchmarks/uniform_binding.py
+"""
+
+import re
+import sys
+import timeit
+import types
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import manim.utils.opengl as opengl
+from manim.renderer.shader import Shader
+from manim.utils.color import color_to_rgb
+from moderngl.program_members.attribute import Attribute
+from moderngl.program_members.uniform import Uniform
+from threejs import ThreeMesh
+
+NUM_POINT_LIGHTS = 25
+UNIFORM_NAMES = [
+    "modelMatrix",
+    "modelViewMatrix",
+    "projectionMatrix",
+    "viewMatrix",
+    "normalMatrix",
+    "cameraPosition",
+    "isOrthographic",
+    "diffuse",
+    "emissive",
+    "specular",
+    "shininess",
+    "opacity",
+    "ambientLightColor",
+    "toneMappingExposure",
+    "uvTransform",
+    "map",
+    "alphaTest",
+    "receiveShadow",
+    *[f"lightProbe[{i}]" for i in range(9)],
+    *[
+        f"pointLights[{i}].{field}"
+        for i in range(NUM_POINT_LIGHTS)
+        for field in ("position", "color", "distance", "decay")
+    ],
+]
+
+
+class MockProgram:
+    def __init__(self):
+        self._members = {}
+        for name in UNIFORM_NAMES:
+            # moderngl creates its members without calling __init__ as well.
+            uniform = Uniform.__new__(Uniform)
+            uniform.mglo = types.SimpleNamespace(value=None, data=None)
+            self._members[name] = uniform
+        for name in ["position", "normal", "uv"]:
+            self._members[name] = Attribute.__new__(Attribute)
+
+    def __getitem__(self, key):
+        return self._members[key]
+
+    def __setitem__(self, key, value):
+        self._members[key].value = value
+
+
+def perspective_projection_matrix(width, height, near=2, far=50):
+    # Column-major, like OpenGLCamera.projection_matrix.
+    projection_matrix = np.array(
+        [
+            [2 * near / width, 0, 0, 0],
+            [0, 2 * near / height, 0, 0],
+            [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+            [0, 0, -1, 0],
+        ]
+    )
+    return tuple(projection_matrix.T.ravel())
+
+
+class MockCamera:
+    # The mesh at the origin has to be inside the frustum, or it's culled.
+    projection_matrix = perspective_projection_matrix(16 / 6, 9 / 6)
+    orthographic = False
+
+    def __init__(self):
+        self.model_matrix = opengl.translation_matrix(0, 0, 11)
+
+    def get_view_matrix(self, format=True):
+        view_matrix = np.linalg.inv(self.model_matrix)
+        return opengl.matrix_to_shader_input(view_matrix) if format else view_matrix
+
+
+def legacy_set_uniforms(self, renderer):
+    # ThreeMesh.set_uniforms before UniformBinder.
+    for k, v in self.shader.shader_program._members.items():
+        view_matrix = renderer.camera.get_view_matrix(format=False)
+        if isinstance(v, Uniform):
+            if k == "viewMatrix":
+                self.shader.set_uniform(
+                    "viewMatrix", opengl.matrix_to_shader_input(view_matrix)
+                )
+            if k == "projectionMatrix":
+                self.shader.set_uniform(
+                    "projectionMatrix",
+                    renderer.camera.projection_matrix,
+                )
+            if k == "modelViewMatrix":
+                self.shader.set_uniform(
+                    "modelViewMatrix",
+                    opengl.matrix_to_shader_input(
+                        view_matrix @ self.hierarchical_model_matrix()
+                    ),
+                )
+            if k == "normalMatrix":
+                self.shader.set_uniform(
+                    "normalMatrix",
+                    opengl.matrix_to_shader_input(
+                        view_matrix[:3, :3] @ self.hierarchical_normal_matrix()
+                    ),
+                )
+            if k == "isOrthographic":
+                self.shader.set_uniform("isOrthographic", renderer.camera.orthographic)
+            point_lights_pattern = re.compile(r"pointLights\[(\d+)\]")
+            point_lights_match = re.match(point_lights_pattern, k)
+            if point_lights_match is not None:
+                point_light_index = int(point_lights_match.group(1))
+                if len(renderer.scene.point_lights) > point_light_index:
+                    point_light_config = renderer.scene.point_lights[point_light_index]
+                    camera_space_light_position = view_matrix @ np.array(
+                        point_light_config["position"] + [1]
+                    )
+                    camera_space_light_position = camera_space_light_position[:3]
+
+                    self.shader.set_uniform(
+                        f"pointLights[{point_light_index}].position",
+                        tuple(camera_space_light_position),
+                    )
+                    self.shader.set_uniform(
+                        f"pointLights[{point_light_index}].color",
+                        tuple(point_light_config["color"]),
+                    )
+                    self.shader.set_uniform(
+                        f"pointLights[{point_light_index}].distance",
+                        point_light_config["distance"],
+                    )
+                    self.shader.set_uniform(
+                        f"pointLights[{point_light_index}].decay",
+                        point_light_config["decay"],
+                    )
+            if k == "ambientLightColor" and renderer.scene.ambient_light is not None:
+                ambient_light_rgb = color_to_rgb(renderer.scene.ambient_light["color"])
+                ambient_light_values = [
+                    col * renderer.scene.ambient_light["intensity"]
+                    for col in ambient_light_rgb
+                ]
+                self.shader.set_uniform(
+                    "ambientLightColor",
+                    tuple(ambient_light_values),
+                )
+
+
+def uniform_values(program):
+    # Uniforms are either set from Python values or written as float32 buffers,
+    # so compare them as the float32 data the GPU would receive.
+    values = {}
+    for name, member in program._members.items():
+        if isinstance(member, Uniform):
+            data = member.read()
+            if data is None and member.value is not None:
+                data = np.asarray(member.value, dtype=np.float32).tobytes()
+            values[name] = None if data is None else bytes(data)
+    return values
+
+
+def main():
+    scene = types.SimpleNamespace(
+        point_lights=[
+            {
+                "position": [i, 3, 2],
+                "color": [1, 1, 1],
+                "distance": 100,
+                "decay": 1,
+            }
+            for i in range(NUM_POINT_LIGHTS)
+        ],
+        ambient_light={"color": "#FFFFFF", "intensity": 0.5},
+    )
+    # The FrameState is shared by every mesh drawn in the same frame, which is
+    # identified by the perspective_uniforms dict.
+    renderer = types.SimpleNamespace(
+        camera=MockCamera(), scene=scene, perspective_uniforms={}
+    )
+
+    def make_mesh():
+        shader = Shader.__new__(Shader)
+        shader.shader_program = MockProgram()
+        attributes = np.zeros(3, dtype=[("position", np.float32, (3,))])
+        return ThreeMesh(shader, attributes)
+
+    legacy_mesh = make_mesh()
+    mesh = make_mesh()
+    legacy_set_uniforms(legacy_mesh, renderer)
+    mesh.set_uniforms(renderer)
+    assert uniform_values(legacy_mesh.shader.shader_program) == uniform_values(
+        mesh.shader.shader_program
+    )
+
+    number = 500
+    print(f"{len(UNIFORM_NAMES)} uniforms, {NUM_POINT_LIGHTS} point lights")
+    for label, statement in [
+        ("legacy set_uniforms", lambda: legacy_set_uniforms(legacy_mesh, renderer)),
+        ("binder + FrameState", lambda: mesh.set_uniforms(renderer)),
+    ]:
+        seconds = min(timeit.repeat(statement, number=number, repeat=5)) / number
+        print(f"{label:>20}: {seconds * 1e6:8.1f} us per mesh")
+    # The camera and lights don't move between runs, so after the first one
+    # every upload is skipped.
+    print(f"{'uploads':>20}: {mesh.shader.binder.upload_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Vertex cache efficiency of the generated geometries before and after
+Geometry.optimize.
+
+ACMR is the number of vertex shader invocations per triangle and ATVR the number
+per unique vertex, for a FIFO post-transform cache of 16 vertices. Extrusions
+aren't indexed, so they're welded with Geometry.compact first. Run from
+opengl_tutorial/:
+
+    python benchmarks/vertex_cache.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from threejs import (
+    analyze_vertex_cache,
+    extrude_geometry,
+    sphere_geometry,
+    torus_knot_geometry,
+)
+
+
+def quadratic_circle(radius, segments):
+    # [start, handle, end] triples approximating a circle, flattened to x, y, z.
+    angles = np.linspace(0, 2 * np.pi, segments + 1)
+    start = angles[:-1]
+    end = angles[1:]
+    handle_radius = radius / np.cos((end - start) / 2)
+    curves = np.stack(
+        [
+            np.stack([radius * np.cos(start), radius * np.sin(start)], -1),
+            np.stack(
+                [
+                    handle_radius * np.cos((start + end) / 2),
+                    handle_radius * np.sin((start + end) / 2),
+                ],
+                -1,
+            ),
+            np.stack([radius * np.cos(end), radius * np.sin(end)], -1),
+        ],
+        1,
+    ).reshape((-1, 2))
+    return np.column_stack([curves, np.zeros(len(curves))])
+
+
+def make_ring():
+    outer = quadratic_circle(1, 16)
+    inner = quadratic_circle(0.5, 16)[::-1]
+    return extrude_geometry(
+        points=np.concatenate([outer, inner]).ravel(),
+        path_indices=[0, len(outer)],
+        steps=4,
+        depth=0.5,
+        bevel_enabled=True,
+        bevel_segments=4,
+    ).compact()
+
+
+GEOMETRIES = {
+    "SphereGeometry": lambda: sphere_geometry(width_segments=64, height_segments=32),
+    "TorusKnotGeometry": lambda: torus_knot_geometry(
+        tubular_segments=256, radial_segments=16
+    ),
+    "ExtrudeGeometry": make_ring,
+}
+
+
+def main():
+    print(f"{'':>18} {'triangles':>9} {'ACMR':>11} {'ATVR':>11} {'optimize':>9}")
+    for name, make in GEOMETRIES.items():
+        geometry = make()
+        optimized = geometry.optimize()
+        before = analyze_vertex_cache(geometry.index, len(geometry.attributes))
+        after = analyze_vertex_cache(optimized.index, len(optimized.attributes))
+        seconds = min(timeit.repeat(geometry.optimize, number=1, repeat=3))
+        print(
+            f"{name:>18} {len(geometry.index) // 3:>9}"
+            f" {before.acmr:5.3f}>{after.acmr:5.3f}"
+            f" {before.atvr:5.3f}>{after.atvr:5.3f}"
+            f" {seconds * 1e3:6.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,18 @@
+from .billboard import *
+from .bounds import *
+from .frame_state import *
 from .geometry import *
+from .generators import *
+from .geometry_cache import *
+from .instancing import *
 from .material import *
+from .picking import *
+from .program_cache import *
+from .shader_input import *
+from .simplify import *
 from .three_mesh import *
+from .transform_store import *
+from .transforms import *
+from .uniform_binder import *
+from .uniform_blocks import *
+from .vertex_cache import *
@@ -0,0 +1,40 @@
+import re
+
+# Billboards are drawn facing the camera by undoing the view rotation in the
+# vertex shader, so they don't need to be reoriented on the CPU every frame.
+# modelViewMatrix = viewMatrix * modelMatrix, so multiplying its rotation and
+# scale by the transpose of the view's rotation leaves the model's own, which is
+# then applied in camera space. v * m is the transpose of m times v.
+
+PROJECT_VERTEX_PATTERN = re.compile(
+    r"^(\s*)mvPosition = modelViewMatrix \* mvPosition;$", re.MULTILINE
+)
+BILLBOARD_PROJECT_VERTEX = (
+    r"\1mvPosition = vec4( ( mat3( modelViewMatrix ) * mvPosition.xyz )"
+    r" * mat3( viewMatrix ) + modelViewMatrix[ 3 ].xyz, 1.0 );"
+)
+
+# The normal matrix is the inverse-transpose of the model view matrix, whose
+# view rotation is undone the same way.
+DEFAULT_NORMAL_PATTERN = re.compile(
+    r"^(\s*)transformedNormal = normalMatrix \* transformedNormal;$", re.MULTILINE
+)
+BILLBOARD_DEFAULT_NORMAL = (
+    r"\1transformedNormal = ( normalMatrix * transformedNormal )"
+    r" * mat3( viewMatrix );"
+)
+
+
+def declare_billboard(vertex_shader):
+    """Rewrite a three.js vertex shader to draw its mesh as a billboard.
+
+    The mesh's x and y axes stay aligned with the screen's, whichever way the
+    camera faces, while its position, scale and rotation (relative to the
+    screen) still come from its model matrix.
+    """
+    vertex_shader, count = PROJECT_VERTEX_PATTERN.subn(
+        BILLBOARD_PROJECT_VERTEX, vertex_shader
+    )
+    if count == 0:
+        raise ValueError("The vertex shader doesn't include three.js' project_vertex")
+    return DEFAULT_NORMAL_PATTERN.sub(BILLBOARD_DEFAULT_NORMAL, vertex_shader)
@@ -0,0 +1,206 @@
+import collections
+import math
+
+import numpy as np
+
+# An axis-aligned box (min, max) and a sphere (center, radius) around the same
+# points. Spheres are cheaper to transform and test, boxes fit tighter.
+Bounds = collections.namedtuple("Bounds", ["min", "max", "center", "radius"])
+
+
+def compute_bounds(position):
+    """The bounds of an (n, 3) array of points, or None when there are none.
+
+    The sphere is centered on the box, which is close to the smallest sphere for
+    the generated geometries and much cheaper to find.
+    """
+    position = np.asarray(position, dtype=np.float64).reshape((-1, 3))
+    if len(position) == 0:
+        return None
+    minimum = position.min(axis=0)
+    maximum = position.max(axis=0)
+    center = (minimum + maximum) / 2
+    radius = np.sqrt(np.max(np.sum((position - center) ** 2, axis=1)))
+    return Bounds(minimum, maximum, center, radius)
+
+
+def get_max_scale(matrix):
+    # The longest column of the linear part, like three.js' getMaxScaleOnAxis.
+    return np.sqrt(np.max(np.sum(matrix[:3, :3] ** 2, axis=0)))
+
+
+def transform_bounds(bounds, matrix):
+    """Bounds which hold bounds after they're transformed by a 4x4 matrix."""
+    if bounds is None:
+        return None
+    linear = matrix[:3, :3]
+    translation = matrix[:3, 3]
+    box_center = linear @ ((bounds.min + bounds.max) / 2) + translation
+    box_extent = np.abs(linear) @ ((bounds.max - bounds.min) / 2)
+    return Bounds(
+        box_center - box_extent,
+        box_center + box_extent,
+        linear @ bounds.center + translation,
+        bounds.radius * get_max_scale(matrix),
+    )
+
+
+def merge_bounds(bounds):
+    """Bounds which hold every one of bounds, or None when there are none."""
+    bounds = [b for b in bounds if b is not None]
+    if len(bounds) <= 1:
+        return bounds[0] if bounds else None
+    minimum = np.min([b.min for b in bounds], axis=0)
+    maximum = np.max([b.max for b in bounds], axis=0)
+    center = (minimum + maximum) / 2
+    radius = min(
+        max(np.linalg.norm(b.center - center) + b.radius for b in bounds),
+        np.linalg.norm(maximum - minimum) / 2,
+    )
+    return Bounds(minimum, maximum, center, radius)
+
+
+def merge_transformed_bounds(bounds, matrices):
+    """Bounds which hold bounds transformed by every one of an (n, 4, 4) array
+    of matrices, or None when there are none."""
+    if bounds is None or len(matrices) == 0:
+        return None
+    linear = matrices[:, :3, :3]
+    translation = matrices[:, :3, 3]
+    box_centers = linear @ ((bounds.min + bounds.max) / 2) + translation
+    box_extents = np.abs(linear) @ ((bounds.max - bounds.min) / 2)
+    minimum = np.min(box_centers - box_extents, axis=0)
+    maximum = np.max(box_centers + box_extents, axis=0)
+    centers = linear @ bounds.center + translation
+    radii = bounds.radius * np.sqrt(np.max(np.sum(linear**2, axis=1), axis=1))
+    center = (minimum + maximum) / 2
+    radius = min(
+        np.max(np.linalg.norm(centers - center, axis=1) + radii),
+        np.linalg.norm(maximum - minimum) / 2,
+    )
+    return Bounds(minimum, maximum, center, radius)
+
+
+def get_local_bounds(mesh):
+    """The bounds of a mesh's vertices in model space. Meshes created from the
+    same Geometry share them."""
+    # The bounds of an InstancedThreeMesh hold all of its instances.
+    if hasattr(mesh, "instance_bounds"):
+        return mesh.instance_bounds
+    geometry = getattr(mesh, "geometry", None)
+    if geometry is not None:
+        return geometry.get_bounds()
+    # Otherwise they're kept on the mesh until its attributes are replaced.
+    cached = getattr(mesh, "_bounds", None)
+    if cached is None or cached[0] is not mesh.attributes:
+        bounds = None
+        if "position" in mesh.attributes.dtype.names:
+            bounds = compute_bounds(mesh.attributes["position"])
+        cached = mesh._bounds = (mesh.attributes, bounds)
+    return cached[1]
+
+
+def get_mesh_world_bounds(mesh):
+    """The bounds of a mesh's vertices in world space, or None."""
+    bounds = get_local_bounds(mesh)
+    if bounds is None:
+        return None
+    matrix = mesh.hierarchical_model_matrix()
+    if not getattr(mesh.shader, "billboard", False):
+        return transform_bounds(bounds, matrix)
+    # Billboards turn to face the camera around their origin, so only a sphere
+    # around it holds them whichever way they face.
+    center = matrix[:3, 3].copy()
+    radius = (np.linalg.norm(bounds.center) + bounds.radius) * get_max_scale(matrix)
+    return Bounds(center - radius, center + radius, center, radius)
+
+
+def get_world_bounds(obj):
+    """The bounds of an object and everything below it in world space, or None
+    if none of them are meshes with positions."""
+    bounds = [get_world_bounds(child) for child in obj.children]
+    if hasattr(obj, "attributes"):
+        bounds.append(get_mesh_world_bounds(obj))
+    return merge_bounds(bounds)
+
+
+class Frustum:
+    """The six planes around what a camera sees, extracted from its projection
+    matrix times its view matrix (Gribb and Hartmann). The planes' normals point
+    inward."""
+
+    def __init__(self, matrix):
+        rows = np.asarray(matrix, dtype=np.float64)
+        planes = np.array(
+            [
+                rows[3] + rows[0],
+                rows[3] - rows[0],
+                rows[3] + rows[1],
+                rows[3] - rows[1],
+                rows[3] + rows[2],
+                rows[3] - rows[2],
+            ]
+        )
+        planes /= np.linalg.norm(planes[:, :3], axis=1)[:, None]
+        # Plain float arithmetic is several times faster than NumPy for testing
+        # a single mesh.
+        self.plane_list = [tuple(plane) for plane in planes.tolist()]
+
+    def intersects(self, bounds, matrix=None):
+        """Whether bounds, transformed by matrix, may be (partly) inside the
+        frustum.
+
+        The sphere is tested first, and the box only when the sphere straddles a
+        plane. The test is conservative: boxes near the frustum's corners may
+        be reported as inside when they're just outside.
+        """
+        if bounds is None:
+            return False
+        x, y, z = bounds.center.tolist()
+        radius = float(bounds.radius)
+        if matrix is not None:
+            (a, b, c, d), (e, f, g, h), (i, j, k, l) = matrix[:3].tolist()
+            x, y, z = (
+                a * x + b * y + c * z + d,
+                e * x + f * y + g * z + h,
+                i * x + j * y + k * z + l,
+            )
+            # The longest column of the linear part, like three.js'
+            # getMaxScaleOnAxis.
+            radius *= math.sqrt(
+                max(
+                    a * a + e * e + i * i,
+                    b * b + f * f + j * j,
+                    c * c + g * g + k * k,
+                )
+            )
+
+        straddles = False
+        for nx, ny, nz, offset in self.plane_list:
+            distance = nx * x + ny * y + nz * z + offset
+            if distance < -radius:
+                return False
+            if distance < radius:
+                straddles = True
+        if not straddles:
+            return True
+
+        # The box fits tighter. It's tested as its center's distance from each
+        # plane plus its extent along the plane's normal.
+        (x0, y0, z0), (x1, y1, z1) = bounds.min.tolist(), bounds.max.tolist()
+        x, y, z = (x0 + x1) / 2, (y0 + y1) / 2, (z0 + z1) / 2
+        ex, ey, ez = (x1 - x0) / 2, (y1 - y0) / 2, (z1 - z0) / 2
+        if matrix is not None:
+            x, y, z, ex, ey, ez = (
+                a * x + b * y + c * z + d,
+                e * x + f * y + g * z + h,
+                i * x + j * y + k * z + l,
+                abs(a) * ex + abs(b) * ey + abs(c) * ez,
+                abs(e) * ex + abs(f) * ey + abs(g) * ez,
+                abs(i) * ex + abs(j) * ey + abs(k) * ez,
+            )
+        for nx, ny, nz, offset in self.plane_list:
+            distance = nx * x + ny * y + nz * z + offset
+            if distance + abs(nx) * ex + abs(ny) * ey + abs(nz) * ez < 0:
+                return False
+        return True
@@ -0,0 +1,70 @@
+import numpy as np
+
+from manim.utils.color import color_to_rgb
+
+from .bounds import Frustum
+from .shader_input import matrix_to_shader_buffer
+
+
+class FrameState:
+    """Camera and lighting values shared by every mesh drawn in a frame.
+
+    drawn and culled count the ThreeMeshes which were set up to be drawn and
+    those skipped for being outside the camera's frustum.
+    """
+
+    def __init__(self, renderer, token=None):
+        self.token = token
+        camera = renderer.camera
+        scene = renderer.scene
+
+        self.view_matrix = camera.get_view_matrix(format=False)
+        # The matrices are uploaded as column-major float32 buffers, like
+        # opengl.matrix_to_shader_input's tuples.
+        self.shader_view_matrix = matrix_to_shader_buffer(self.view_matrix)
+        self.projection_matrix = np.asarray(camera.projection_matrix, dtype=np.float32)
+        self.is_orthographic = camera.orthographic
+        # projection_matrix is column-major.
+        self.frustum = Frustum(
+            self.projection_matrix.reshape((4, 4)).T.astype(np.float64)
+            @ self.view_matrix
+        )
+        self.drawn = 0
+        self.culled = 0
+
+        # Point lights are passed to three.js shaders in camera space.
+        self.point_lights = []
+        for point_light_config in scene.point_lights:
+            camera_space_light_position = self.view_matrix @ np.array(
+                list(point_light_config["position"]) + [1]
+            )
+            self.point_lights.append(
+                {
+                    "position": tuple(camera_space_light_position[:3]),
+                    "color": tuple(point_light_config["color"]),
+                    "distance": point_light_config["distance"],
+                    "decay": point_light_config["decay"],
+                }
+            )
+
+        self.ambient_light_color = None
+        if scene.ambient_light is not None:
+            self.ambient_light_color = tuple(
+                col * scene.ambient_light["intensity"]
+                for col in color_to_rgb(scene.ambient_light["color"])
+            )
+
+    @classmethod
+    def for_renderer(cls, renderer):
+        """Return the FrameState of the frame the renderer is drawing.
+
+        The renderer rebuilds its perspective_uniforms dict at the start of each
+        frame, so the dict identifies the frame and the state is only computed
+        for the first mesh drawn in it.
+        """
+        token = getattr(renderer, "perspective_uniforms", None)
+        frame_state = getattr(renderer, "three_frame_state", None)
+        if token is None or frame_state is None or frame_state.token is not token:
+            frame_state = cls(renderer, token)
+            renderer.three_frame_state = frame_state
+        return frame_state
@@ -0,0 +1,678 @@
+import numpy as np
+
+from .geometry import Geometry
+from .triangulate import (
+    flatten_quadratic_path,
+    group_subpaths,
+    remove_duplicate_end,
+    signed_area,
+    split_subpaths,
+    triangulate,
+)
+
+# Vectorized ports of the three.js geometry generators. They accept the same
+# fields as the corresponding *GeometryRequest messages and produce the same
+# vertex and index layouts as three-server, so the results can be used in place
+# of server responses.
+
+
+def make_geometry(position, normal, uv, index):
+    attributes = np.empty(
+        len(position),
+        dtype=[
+            ("position", np.float32, (3,)),
+            ("normal", np.float32, (3,)),
+            ("uv", np.float32, (2,)),
+        ],
+    )
+    attributes["position"] = position
+    attributes["normal"] = normal
+    attributes["uv"] = uv
+    return Geometry.from_attributes(attributes, np.asarray(index, dtype=np.uint32))
+
+
+def grid_indices(rows, columns, offset=0):
+    # Two triangles (a, b, d) and (b, c, d) per cell of a (rows + 1) x
+    # (columns + 1) grid of vertices stored row by row.
+    iy, ix = np.meshgrid(np.arange(rows), np.arange(columns), indexing="ij")
+    a = offset + ix + (columns + 1) * iy
+    b = offset + ix + (columns + 1) * (iy + 1)
+    c = offset + (ix + 1) + (columns + 1) * (iy + 1)
+    d = offset + (ix + 1) + (columns + 1) * iy
+    return np.stack([a, b, d, b, c, d], axis=-1).ravel()
+
+
+def build_plane(u, v, w, udir, vdir, width, height, depth, grid_x, grid_y, offset):
+    iy, ix = np.meshgrid(np.arange(grid_y + 1), np.arange(grid_x + 1), indexing="ij")
+    iy = iy.ravel()
+    ix = ix.ravel()
+
+    position = np.empty((len(ix), 3))
+    position[:, u] = (ix * width / grid_x - width / 2) * udir
+    position[:, v] = (iy * height / grid_y - height / 2) * vdir
+    position[:, w] = depth / 2
+
+    normal = np.zeros((len(ix), 3))
+    normal[:, w] = 1 if depth > 0 else -1
+
+    uv = np.stack([ix / grid_x, 1 - iy / grid_y], axis=-1)
+    return position, normal, uv, grid_indices(grid_y, grid_x, offset)
+
+
+def box_geometry(
+    width=1,
+    height=1,
+    depth=1,
+    width_segments=1,
+    height_segments=1,
+    depth_segments=1,
+    wireframe=False,
+):
+    width_segments = int(width_segments)
+    height_segments = int(height_segments)
+    depth_segments = int(depth_segments)
+    x, y, z = 0, 1, 2
+    planes = [
+        (z, y, x, -1, -1, depth, height, width, depth_segments, height_segments),
+        (z, y, x, 1, -1, depth, height, -width, depth_segments, height_segments),
+        (x, z, y, 1, 1, width, depth, height, width_segments, depth_segments),
+        (x, z, y, 1, -1, width, depth, -height, width_segments, depth_segments),
+        (x, y, z, 1, -1, width, height, depth, width_segments, height_segments),
+        (x, y, z, -1, -1, width, height, -depth, width_segments, height_segments),
+    ]
+
+    parts = []
+    offset = 0
+    for plane in planes:
+        parts.append(build_plane(*plane, offset))
+        offset += len(parts[-1][0])
+    return make_geometry(*(np.concatenate(arrays) for arrays in zip(*parts)))
+
+
+def plane_geometry(
+    width=1, height=1, width_segments=1, height_segments=1, wireframe=False
+):
+    grid_x = int(width_segments)
+    grid_y = int(height_segments)
+    iy, ix = np.meshgrid(np.arange(grid_y + 1), np.arange(grid_x + 1), indexing="ij")
+    iy = iy.ravel()
+    ix = ix.ravel()
+
+    position = np.stack(
+        [
+            ix * width / grid_x - width / 2,
+            -(iy * height / grid_y - height / 2),
+            np.zeros(len(ix)),
+        ],
+        axis=-1,
+    )
+    normal = np.tile([0, 0, 1], (len(ix), 1))
+    uv = np.stack([ix / grid_x, 1 - iy / grid_y], axis=-1)
+    return make_geometry(position, normal, uv, grid_indices(grid_y, grid_x))
+
+
+def circle_geometry(
+    radius=1, segments=8, theta_start=0, theta_length=2 * np.pi, wireframe=False
+):
+    segments = max(3, int(segments))
+    theta = theta_start + np.arange(segments + 1) / segments * theta_length
+
+    position = np.zeros((segments + 2, 3))
+    position[1:, 0] = radius * np.cos(theta)
+    position[1:, 1] = radius * np.sin(theta)
+    normal = np.tile([0, 0, 1], (segments + 2, 1))
+    uv = (position[:, :2] / radius + 1) / 2
+
+    i = np.arange(1, segments + 1)
+    index = np.stack([i, i + 1, np.zeros_like(i)], axis=-1).ravel()
+    return make_geometry(position, normal, uv, index)
+
+
+def sphere_geometry(
+    radius=1,
+    width_segments=8,
+    height_segments=6,
+    phi_start=0,
+    phi_length=2 * np.pi,
+    theta_start=0,
+    theta_length=np.pi,
+    wireframe=False,
+):
+    width_segments = max(3, int(width_segments))
+    height_segments = max(2, int(height_segments))
+    theta_end = min(theta_start + theta_length, np.pi)
+
+    iy, ix = np.meshgrid(
+        np.arange(height_segments + 1), np.arange(width_segments + 1), indexing="ij"
+    )
+    u = ix / width_segments
+    v = iy / height_segments
+    phi = phi_start + u * phi_length
+    theta = theta_start + v * theta_length
+
+    position = np.stack(
+        [
+            -radius * np.cos(phi) * np.sin(theta),
+            radius * np.cos(theta) * np.ones_like(phi),
+            radius * np.sin(phi) * np.sin(theta),
+        ],
+        axis=-1,
+    ).reshape((-1, 3))
+    lengths = np.linalg.norm(position, axis=-1, keepdims=True)
+    normal = np.divide(
+        position, lengths, out=np.zeros_like(position), where=lengths > 0
+    )
+
+    # Offset the u coordinate of the poles to the middle of each segment.
+    u_offset = np.zeros(height_segments + 1)
+    if theta_start == 0:
+        u_offset[0] = 0.5 / width_segments
+    if theta_end == np.pi:
+        u_offset[-1] = -0.5 / width_segments
+    uv = np.stack([u + u_offset[:, None], 1 - v], axis=-1).reshape((-1, 2))
+
+    iy, ix = np.meshgrid(
+        np.arange(height_segments), np.arange(width_segments), indexing="ij"
+    )
+    a = iy * (width_segments + 1) + ix + 1
+    b = iy * (width_segments + 1) + ix
+    c = (iy + 1) * (width_segments + 1) + ix
+    d = (iy + 1) * (width_segments + 1) + ix + 1
+    # The triangles touching the poles are degenerate, so they're skipped.
+    first = np.stack([a, b, d], axis=-1)
+    second = np.stack([b, c, d], axis=-1)
+    first_mask = (iy != 0) | (theta_start > 0)
+    second_mask = (iy != height_segments - 1) | (theta_end < np.pi)
+    mask = np.stack([first_mask, second_mask], axis=-1).ravel()
+    index = np.concatenate([first, second], axis=-1).reshape((-1, 3))[mask]
+    return make_geometry(position, normal, uv, index.ravel())
+
+
+def cylinder_geometry(
+    radius_top=1,
+    radius_bottom=1,
+    height=1,
+    radial_segments=8,
+    height_segments=1,
+    open_ended=False,
+    theta_start=0,
+    theta_length=2 * np.pi,
+    wireframe=False,
+):
+    radial_segments = int(radial_segments)
+    height_segments = int(height_segments)
+    half_height = height / 2
+
+    # Torso.
+    iy, ix = np.meshgrid(
+        np.arange(height_segments + 1), np.arange(radial_segments + 1), indexing="ij"
+    )
+    u = ix / radial_segments
+    v = iy / height_segments
+    theta = u * theta_length + theta_start
+    radius = v * (radius_bottom - radius_top) + radius_top
+    slope = (radius_bottom - radius_top) / height
+
+    position = np.stack(
+        [radius * np.sin(theta), -v * height + half_height, radius * np.cos(theta)],
+        axis=-1,
+    ).reshape((-1, 3))
+    normal = np.stack(
+        [np.sin(theta), np.full_like(theta, slope), np.cos(theta)], axis=-1
+    ).reshape((-1, 3))
+    normal /= np.linalg.norm(normal, axis=-1, keepdims=True)
+    uv = np.stack([u, 1 - v], axis=-1).reshape((-1, 2))
+
+    # The torso's faces are emitted column by column.
+    ix, iy = np.meshgrid(
+        np.arange(radial_segments), np.arange(height_segments), indexing="ij"
+    )
+    a = iy * (radial_segments + 1) + ix
+    b = (iy + 1) * (radial_segments + 1) + ix
+    c = (iy + 1) * (radial_segments + 1) + ix + 1
+    d = iy * (radial_segments + 1) + ix + 1
+    parts = [(position, normal, uv, np.stack([a, b, d, b, c, d], axis=-1).ravel())]
+
+    # Caps.
+    offset = len(position)
+    if not open_ended:
+        for top, cap_radius in [(True, radius_top), (False, radius_bottom)]:
+            if cap_radius <= 0:
+                continue
+            parts.append(
+                build_cap(
+                    top,
+                    cap_radius,
+                    half_height,
+                    radial_segments,
+                    theta_start,
+                    theta_length,
+                    offset,
+                )
+            )
+            offset += len(parts[-1][0])
+    return make_geometry(*(np.concatenate(arrays) for arrays in zip(*parts)))
+
+
+def build_cap(
+    top, radius, half_height, radial_segments, theta_start, theta_length, offset
+):
+    sign = 1 if top else -1
+    theta = np.arange(radial_segments + 1) / radial_segments * theta_length
+    theta += theta_start
+
+    # One center vertex per segment followed by the rim.
+    center = np.tile([0, half_height * sign, 0], (radial_segments, 1))
+    rim = np.stack(
+        [
+            radius * np.sin(theta),
+            np.full_like(theta, half_height * sign),
+            radius * np.cos(theta),
+        ],
+        axis=-1,
+    )
+    position = np.concatenate([center, rim])
+    normal = np.tile([0, sign, 0], (len(position), 1))
+    uv = np.concatenate(
+        [
+            np.full((radial_segments, 2), 0.5),
+            np.stack(
+                [np.cos(theta) * 0.5 + 0.5, np.sin(theta) * 0.5 * sign + 0.5], axis=-1
+            ),
+        ]
+    )
+
+    c = offset + np.arange(radial_segments)
+    i = c + radial_segments
+    if top:
+        index = np.stack([i, i + 1, c], axis=-1)
+    else:
+        index = np.stack([i + 1, i, c], axis=-1)
+    return position, normal, uv, index.ravel()
+
+
+def cone_geometry(
+    radius=1,
+    height=1,
+    radial_segments=8,
+    height_segments=1,
+    open_ended=False,
+    theta_start=0,
+    theta_length=2 * np.pi,
+    wireframe=False,
+):
+    return cylinder_geometry(
+        0,
+        radius,
+        height,
+        radial_segments,
+        height_segments,
+        open_ended,
+        theta_start,
+        theta_length,
+    )
+
+
+def flat_normals(position):
+    # Face normals for a non-indexed geometry, computed from the float32
+    # positions like three.js' computeVertexNormals.
+    triangle = position.astype(np.float32).astype(np.float64).reshape((-1, 3, 3))
+    normal = np.cross(triangle[:, 2] - triangle[:, 1], triangle[:, 0] - triangle[:, 1])
+    length = np.linalg.norm(normal, axis=-1, keepdims=True)
+    return np.repeat(normal / np.where(length == 0, 1, length), 3, axis=0)
+
+
+def polyhedron_geometry(vertices, indices, radius=1, detail=0):
+    vertices = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+    faces = vertices[np.asarray(indices)].reshape((-1, 3, 3))
+    a, b, c = (faces[:, None, i] for i in range(3))
+    cols = int(detail) + 1
+
+    # Lay out the points of the subdivided face as rows i = 0..cols running from
+    # the edge ab towards c. The lerps are ordered like three.js' so vertices on
+    # the poles land exactly on the y axis.
+    rows, steps = [], []
+    for i in range(cols + 1):
+        rows.extend([i] * (cols - i + 1))
+        steps.extend(j / (cols - i) if i < cols else 0 for j in range(cols - i + 1))
+    s = (np.array(rows) / cols)[:, None]
+    t = np.array(steps)[:, None]
+    aj = a + (c - a) * s
+    bj = b + (c - b) * s
+    points = aj + (bj - aj) * t
+
+    # Index of v[i][j] in points.
+    start = np.concatenate([[0], np.cumsum(np.arange(cols + 1, 0, -1))])
+    triangles = []
+    for i in range(cols):
+        for j in range(2 * (cols - i) - 1):
+            k = j // 2
+            if j % 2 == 0:
+                triangles.append([start[i] + k + 1, start[i + 1] + k, start[i] + k])
+            else:
+                triangles.append(
+                    [start[i] + k + 1, start[i + 1] + k + 1, start[i + 1] + k]
+                )
+    position = points[:, np.array(triangles).ravel()].reshape((-1, 3))
+
+    # Project the vertices onto the sphere.
+    x, y, z = position.T
+    length = np.sqrt(x * x + y * y + z * z)
+    position = position * (1 / np.where(length == 0, 1, length))[:, None] * radius
+
+    # Spherical uvs, with the same fixups three.js applies to the poles and to
+    # faces straddling the seam.
+    x, y, z = position.T
+    u = np.arctan2(z, -x) / 2 / np.pi + 0.5
+    v = np.arctan2(-y, np.sqrt(x * x + z * z)) / np.pi + 0.5
+    u = u.reshape((-1, 3))
+    triangle = position.reshape((-1, 3, 3))
+    centroid = (triangle[:, 0] + triangle[:, 1] + triangle[:, 2]) / 3
+    azimuth = np.repeat(np.arctan2(centroid[:, 2], -centroid[:, 0])[:, None], 3, 1)
+    u = np.where((azimuth < 0) & (u == 1), u - 1, u)
+    on_pole = ((x == 0) & (z == 0)).reshape((-1, 3))
+    u = np.where(on_pole, azimuth / 2 / np.pi + 0.5, u)
+    straddles = (u.max(axis=1) > 0.9) & (u.min(axis=1) < 0.1)
+    u = np.where(straddles[:, None] & (u < 0.2), u + 1, u)
+    uv = np.stack([u.ravel(), 1 - v], axis=-1)
+
+    if detail == 0:
+        normal = flat_normals(position)
+    else:
+        normal = position.astype(np.float32).astype(np.float64)
+        length = np.linalg.norm(normal, axis=-1, keepdims=True)
+        normal = normal / np.where(length == 0, 1, length)
+    return make_geometry(position, normal, uv, [])
+
+
+def icosahedron_geometry(radius=1, detail=0, wireframe=False):
+    t = (1 + np.sqrt(5)) / 2
+    vertices = [
+        [-1, t, 0],
+        [1, t, 0],
+        [-1, -t, 0],
+        [1, -t, 0],
+        [0, -1, t],
+        [0, 1, t],
+        [0, -1, -t],
+        [0, 1, -t],
+        [t, 0, -1],
+        [t, 0, 1],
+        [-t, 0, -1],
+        [-t, 0, 1],
+    ]
+    indices = [
+        [0, 11, 5],
+        [0, 5, 1],
+        [0, 1, 7],
+        [0, 7, 10],
+        [0, 10, 11],
+        [1, 5, 9],
+        [5, 11, 4],
+        [11, 10, 2],
+        [10, 7, 6],
+        [7, 1, 8],
+        [3, 9, 4],
+        [3, 4, 2],
+        [3, 2, 6],
+        [3, 6, 8],
+        [3, 8, 9],
+        [4, 9, 5],
+        [2, 4, 11],
+        [6, 2, 10],
+        [8, 6, 7],
+        [9, 8, 1],
+    ]
+    return polyhedron_geometry(vertices, indices, radius, detail)
+
+
+def tetrahedron_geometry(radius=1, detail=0, wireframe=False):
+    vertices = [[1, 1, 1], [-1, -1, 1], [-1, 1, -1], [1, -1, -1]]
+    indices = [[2, 1, 0], [0, 3, 2], [1, 3, 0], [2, 3, 1]]
+    return polyhedron_geometry(vertices, indices, radius, detail)
+
+
+def torus_knot_curve(u, p, q, radius):
+    qu_over_p = q / p * u
+    cs = np.cos(qu_over_p)
+    return np.stack(
+        [
+            radius * (2 + cs) * 0.5 * np.cos(u),
+            radius * (2 + cs) * np.sin(u) * 0.5,
+            radius * np.sin(qu_over_p) * 0.5,
+        ],
+        axis=-1,
+    )
+
+
+def torus_knot_geometry(
+    torus_radius=1,
+    tube_radius=0.4,
+    tubular_segments=64,
+    radial_segments=8,
+    p=2,
+    q=3,
+    wireframe=False,
+):
+    tubular_segments = int(tubular_segments)
+    radial_segments = int(radial_segments)
+
+    # A frame for each ring of the tube, taken from a finite difference along
+    # the curve.
+    u = np.arange(tubular_segments + 1) / tubular_segments * p * np.pi * 2
+    p1 = torus_knot_curve(u, p, q, torus_radius)
+    p2 = torus_knot_curve(u + 0.01, p, q, torus_radius)
+    tangent = p2 - p1
+    binormal = np.cross(tangent, p2 + p1)
+    normal = np.cross(binormal, tangent)
+    binormal /= np.linalg.norm(binormal, axis=-1, keepdims=True)
+    normal /= np.linalg.norm(normal, axis=-1, keepdims=True)
+
+    v = np.arange(radial_segments + 1) / radial_segments * np.pi * 2
+    cx = (-tube_radius * np.cos(v))[None, :, None]
+    cy = (tube_radius * np.sin(v))[None, :, None]
+    position = p1[:, None] + (cx * normal[:, None] + cy * binormal[:, None])
+    vertex_normal = position - p1[:, None]
+    vertex_normal /= np.linalg.norm(vertex_normal, axis=-1, keepdims=True)
+
+    iy, ix = np.meshgrid(
+        np.arange(tubular_segments + 1), np.arange(radial_segments + 1), indexing="ij"
+    )
+    uv = np.stack([iy / tubular_segments, ix / radial_segments], axis=-1)
+    return make_geometry(
+        position.reshape((-1, 3)),
+        vertex_normal.reshape((-1, 3)),
+        uv.reshape((-1, 2)),
+        grid_indices(tubular_segments, radial_segments),
+    )
+
+
+def bevel_vectors(contour):
+    # The direction (scaled to bevel at unit size) in which each point of a
+    # contour moves as it is bevelled, as in three.js' getBevelVec.
+    prev = np.roll(contour, 1, axis=0)
+    next = np.roll(contour, -1, axis=0)
+    v_prev = contour - prev
+    v_next = next - contour
+    prev_x, prev_y = v_prev.T
+    next_x, next_y = v_next.T
+    prev_lensq = prev_x * prev_x + prev_y * prev_y
+    collinear = prev_x * next_y - prev_y * next_x
+    eps = np.finfo(np.float64).eps
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Intersect the two edges shifted outwards by one unit.
+        prev_len = np.sqrt(prev_lensq)[:, None]
+        next_len = np.sqrt(next_x * next_x + next_y * next_y)[:, None]
+        prev_shift = prev + np.stack([-prev_y, prev_x], -1) / prev_len
+        next_shift = next + np.stack([-next_y, next_x], -1) / next_len
+        shift = next_shift - prev_shift
+        sf = (shift[:, 0] * next_y - shift[:, 1] * next_x) / collinear
+        corner = prev_shift + v_prev * sf[:, None] - contour
+        corner_lensq = np.sum(corner * corner, axis=-1)
+        corner_shrink = np.where(corner_lensq <= 2, 1, np.sqrt(corner_lensq / 2))
+
+        # Collinear edges just move along their normal, or back along the edge
+        # for a full reversal.
+        same_direction = np.where(
+            prev_x > eps,
+            next_x > eps,
+            np.where(prev_x < -eps, next_x < -eps, np.sign(prev_y) == np.sign(next_y)),
+        )
+        straight = np.where(
+            same_direction[:, None], np.stack([-prev_y, prev_x], -1), v_prev
+        )
+        straight_shrink = np.sqrt(np.where(same_direction, prev_lensq, prev_lensq / 2))
+
+        return np.where(
+            (np.abs(collinear) > eps)[:, None],
+            corner / corner_shrink[:, None],
+            straight / straight_shrink[:, None],
+        )
+
+
+def extrude_shape(
+    contour,
+    holes,
+    steps,
+    depth,
+    bevel_enabled,
+    bevel_thickness,
+    bevel_size,
+    bevel_offset,
+    bevel_segments,
+):
+    # Mirrors the vertex and face layout of three.js' ExtrudeGeometry.addShape.
+    if signed_area(contour) >= 0:
+        contour = contour[::-1]
+        holes = [hole[::-1] if signed_area(hole) < 0 else hole for hole in holes]
+    contour = remove_duplicate_end(contour)
+    holes = [remove_duplicate_end(hole) for hole in holes]
+    faces = triangulate(contour, holes)
+
+    rings = [contour, *holes]
+    vertices = np.concatenate(rings)
+    movements = np.concatenate([bevel_vectors(ring) for ring in rings])
+
+    # Stack the layers of the extrusion: the back bevel, the steps and the
+    # front bevel.
+    layers = []
+    bevel_t = np.arange(bevel_segments) / bevel_segments
+    bevel_z = bevel_thickness * np.cos(bevel_t * np.pi / 2)
+    bevel_bs = bevel_size * np.sin(bevel_t * np.pi / 2) + bevel_offset
+    for z, bs in zip(bevel_z, bevel_bs):
+        layers.append((vertices + movements * bs, -z))
+    extruded = vertices
+    if bevel_enabled:
+        extruded = vertices + movements * (bevel_size + bevel_offset)
+    for s in range(steps + 1):
+        layers.append((extruded, depth / steps * s))
+    for z, bs in zip(bevel_z[::-1], bevel_bs[::-1]):
+        layers.append((vertices + movements * bs, depth + z))
+    placeholder = np.concatenate(
+        [np.column_stack([xy, np.full(len(xy), z)]) for xy, z in layers]
+    )
+
+    # Lids, textured with their xy coordinates.
+    vlen = len(vertices)
+    top = vlen * (steps + bevel_segments * 2)
+    lid_index = np.concatenate([faces[:, ::-1].ravel(), faces.ravel() + top])
+    lid_position = placeholder[lid_index]
+    lid_uv = lid_position[:, :2]
+
+    # Side walls, one quad (a, b, c, d) for each edge of each ring and layer.
+    side_index = []
+    layer_offset = 0
+    for ring in rings:
+        j = np.arange(len(ring))[::-1]
+        k = (j - 1) % len(ring)
+        s = np.arange(steps + bevel_segments * 2)
+        j = layer_offset + j[:, None]
+        k = layer_offset + k[:, None]
+        side_index.append(
+            np.stack(
+                [j + vlen * s, k + vlen * s, k + vlen * (s + 1), j + vlen * (s + 1)],
+                axis=-1,
+            ).reshape((-1, 4))
+        )
+        layer_offset += len(ring)
+    quads = placeholder[np.concatenate(side_index)]
+    a, b = quads[:, 0], quads[:, 1]
+    along_x = np.abs(a[:, 1] - b[:, 1]) < np.abs(a[:, 0] - b[:, 0])
+    quad_uv = np.stack(
+        [np.where(along_x[:, None], quads[..., 0], quads[..., 1]), 1 - quads[..., 2]],
+        axis=-1,
+    )
+    corners = [0, 1, 3, 1, 2, 3]
+    side_position = quads[:, corners].reshape((-1, 3))
+    side_uv = quad_uv[:, corners].reshape((-1, 2))
+
+    return (
+        np.concatenate([lid_position, side_position]),
+        np.concatenate([lid_uv, side_uv]),
+    )
+
+
+def extrude_geometry(
+    points=(),
+    path_indices=(),
+    steps=1,
+    depth=1,
+    bevel_enabled=False,
+    bevel_thickness=0.1,
+    bevel_size=0.1,
+    bevel_offset=0,
+    bevel_segments=8,
+    wireframe=False,
+):
+    steps = int(steps)
+    if not bevel_enabled:
+        bevel_thickness = bevel_size = bevel_offset = bevel_segments = 0
+    bevel_segments = int(bevel_segments)
+
+    positions = []
+    uvs = []
+    for shape, holes in group_subpaths(split_subpaths(points, path_indices)):
+        contour = flatten_quadratic_path(shape)
+        if len(contour) < 3:
+            continue
+        holes = [flatten_quadratic_path(hole) for hole in holes]
+        position, uv = extrude_shape(
+            contour,
+            [hole for hole in holes if len(hole) >= 3],
+            steps,
+            depth,
+            bevel_enabled,
+            bevel_thickness,
+            bevel_size,
+            bevel_offset,
+            bevel_segments,
+        )
+        positions.append(position)
+        uvs.append(uv)
+
+    position = np.concatenate(positions) if positions else np.empty((0, 3))
+    uv = np.concatenate(uvs) if uvs else np.empty((0, 2))
+    return make_geometry(position, flat_normals(position), uv, [])
+
+
+LOCAL_GEOMETRY_GENERATORS = {
+    "BoxGeometry": box_geometry,
+    "PlaneGeometry": plane_geometry,
+    "CircleGeometry": circle_geometry,
+    "SphereGeometry": sphere_geometry,
+    "CylinderGeometry": cylinder_geometry,
+    "ConeGeometry": cone_geometry,
+    "IcosahedronGeometry": icosahedron_geometry,
+    "TetrahedronGeometry": tetrahedron_geometry,
+    "TorusKnotGeometry": torus_knot_geometry,
+    "ExtrudeGeometry": extrude_geometry,
+}
+
+
+def generate_geometry(name, request):
+    """Generate the geometry for a *GeometryRequest locally."""
+    fields = {
+        field.name: getattr(request, field.name) for field in request.DESCRIPTOR.fields
+    }
+    return LOCAL_GEOMETRY_GENERATORS[name](**fields)
@@ -1,12 +1,114 @@
 import numpy as np
 
+from .bounds import compute_bounds
+from .picking import BVH
+from .simplify import simplify
+from .vertex_cache import (
+    get_triangles,
+    optimize_overdraw,
+    optimize_vertex_cache,
+    optimize_vertex_fetch,
+)
+
+# The values three-server substitutes for unset (or falsy) request fields.
+GEOMETRY_DEFAULTS = {
+    "BoxGeometry": {
+        "width": 1,
+        "height": 1,
+        "depth": 1,
+        "width_segments": 1,
+        "height_segments": 1,
+        "depth_segments": 1,
+    },
+    "SphereGeometry": {
+        "radius": 1,
+        "width_segments": 8,
+        "height_segments": 6,
+        "phi_start": 0,
+        "phi_length": 2 * np.pi,
+        "theta_start": 0,
+        "theta_length": np.pi,
+    },
+    "TorusKnotGeometry": {
+        "torus_radius": 1,
+        "tube_radius": 0.4,
+        "tubular_segments": 64,
+        "radial_segments": 8,
+        "p": 2,
+        "q": 3,
+    },
+    "IcosahedronGeometry": {
+        "radius": 1,
+        "detail": 0,
+    },
+    "TetrahedronGeometry": {
+        "radius": 1,
+        "detail": 0,
+    },
+    "CylinderGeometry": {
+        "radius_top": 1,
+        "radius_bottom": 1,
+        "height": 1,
+        "radial_segments": 8,
+        "height_segments": 1,
+        "open_ended": False,
+        "theta_start": 0,
+        "theta_length": 2 * np.pi,
+    },
+    "ConeGeometry": {
+        "radius": 1,
+        "height": 1,
+        "radial_segments": 8,
+        "height_segments": 1,
+        "open_ended": False,
+        "theta_start": 0,
+        "theta_length": 2 * np.pi,
+    },
+    "CircleGeometry": {
+        "radius": 1,
+        "segments": 8,
+        "theta_start": 0,
+        "theta_length": 2 * np.pi,
+    },
+    "PlaneGeometry": {
+        "width": 1,
+        "height": 1,
+        "width_segments": 1,
+        "height_segments": 1,
+    },
+    "ExtrudeGeometry": {
+        "steps": 1,
+        "depth": 1,
+        "bevel_enabled": False,
+        "bevel_thickness": 0.1,
+        "bevel_size": 0.1,
+        "bevel_offset": 0,
+        "bevel_segments": 8,
+    },
+}
+
+
+def get_index_dtype(num_vertices):
+    # The narrowest index type OpenGL draws with which can address every vertex.
+    return np.dtype(np.uint16 if num_vertices < 65536 else np.uint32)
+
 
 class Geometry:
-    def __init__(self, position, normal, index=None):
+    # Built the first time a mesh of the geometry is picked.
+    _bvh = None
+    _bounds = None
+    # Simplified levels of detail, by their ratios of triangles.
+    _lods = None
+
+    def __init__(self, position, normal, index=None, uv=None):
+        if uv is None:
+            uv = []
         num_vertices = len(position) // 3
         dtype = [("position", np.float32, (3,))]
         if len(normal) > 0:
             dtype.append(("normal", np.float32, (3,)))
+        if len(uv) > 0:
+            dtype.append(("uv", np.float32, (2,)))
         self.attributes = np.zeros(
             num_vertices,
             dtype=dtype,
@@ -14,4 +116,151 @@ class Geometry:
         self.attributes["position"] = np.array(position).reshape((-1, 3))
         if len(normal) > 0:
             self.attributes["normal"] = np.array(normal).reshape((-1, 3))
+        if len(uv) > 0:
+            self.attributes["uv"] = np.array(uv).reshape((-1, 2))
         self.index = np.array(index)
+
+    @classmethod
+    def from_response(cls, response):
+        if not response.packed_position:
+            return cls(response.position, response.normal, response.index, response.uv)
+
+        # Build the attributes straight from the packed buffers without
+        # materializing any intermediate lists.
+        fields = [("position", 3), ("normal", 3), ("uv", 2)]
+        buffers = {
+            name: np.frombuffer(getattr(response, f"packed_{name}"), dtype="<f4")
+            for name, _ in fields
+        }
+        dtype = [
+            (name, np.float32, (size,))
+            for name, size in fields
+            if len(buffers[name]) > 0
+        ]
+        attributes = np.empty(response.vertex_count, dtype=dtype)
+        for name, size in fields:
+            if len(buffers[name]) > 0:
+                attributes[name] = buffers[name].reshape((-1, size))
+
+        index = np.frombuffer(response.packed_index, dtype="<u4")
+        if len(index) != response.index_count:
+            raise ValueError(
+                f"Expected {response.index_count} indices but received {len(index)}"
+            )
+        return cls.from_attributes(attributes, index)
+
+    @classmethod
+    def from_attributes(cls, attributes, index):
+        # Wrap existing arrays (e.g. memory-mapped ones) without copying them.
+        geometry = cls.__new__(cls)
+        geometry.attributes = attributes
+        geometry.index = index
+        return geometry
+
+    def compact(self, tolerance=1e-6):
+        """Return a copy of the geometry with its duplicate vertices welded and
+        its index stored in the narrowest type.
+
+        Vertices whose attributes (position, normal and uv) all match to within
+        tolerance become one, which keeps the position of the first of them in
+        the vertex buffer.
+        Geometry without an index gets one, and triangles which welding turns
+        into lines or points are dropped.
+        """
+        attributes = self.attributes
+        num_vertices = len(attributes)
+        keys = np.concatenate(
+            [
+                np.round(
+                    attributes[name].reshape((num_vertices, -1)) / tolerance
+                ).astype(np.int64)
+                for name in attributes.dtype.names
+            ],
+            axis=1,
+        )
+        _, first, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        # np.unique sorts the vertices, so put them back in their original order.
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        vertex_map = rank[inverse.reshape(-1)]
+
+        if self.index is None or np.ndim(self.index) == 0 or len(self.index) == 0:
+            index = np.arange(num_vertices - num_vertices % 3)
+        else:
+            index = np.asarray(self.index)
+        triangles = vertex_map[index].reshape((-1, 3))
+        a, b, c = triangles.T
+        triangles = triangles[(a != b) & (b != c) & (c != a)]
+        return Geometry.from_attributes(
+            attributes[first[order]],
+            triangles.ravel().astype(get_index_dtype(len(order))),
+        )
+
+    def optimize(self, cache_size=16):
+        """Return a copy of the geometry with its triangles and vertices
+        reordered for the GPU's post-transform vertex cache.
+
+        Triangles are ordered with Forsyth's algorithm and then regrouped to
+        reduce overdraw, and the vertices are stored in the order the new index
+        first uses them.
+        """
+        index = optimize_vertex_cache(self.index, len(self.attributes), cache_size)
+        index = optimize_overdraw(index, self.attributes["position"], cache_size)
+        attributes, index = optimize_vertex_fetch(self.attributes, index)
+        return Geometry.from_attributes(
+            attributes, index.astype(get_index_dtype(len(attributes)))
+        )
+
+    def freeze(self):
+        # Geometries handed out by a cache are shared between meshes, so they
+        # mustn't be modified in place.
+        self.attributes.flags.writeable = False
+        self.index.flags.writeable = False
+        return self
+
+    def get_bounds(self):
+        """The Bounds of the geometry's positions, or None if it has none."""
+        if self._bounds is None:
+            self._bounds = compute_bounds(self.attributes["position"])
+        return self._bounds
+
+    def get_bvh(self):
+        if self._bvh is None:
+            self._bvh = BVH(self.attributes, self.index)
+        return self._bvh
+
+    def get_lods(self, ratios=(1, 0.5, 0.25, 0.1)):
+        """Return a level of detail for each of ratios, the fraction of the
+        geometry's triangles it keeps.
+
+        Levels are simplified with the quadric error metric, and a ratio of 1
+        returns the geometry itself. The levels are frozen and kept on the
+        geometry, so meshes created from it share them.
+        """
+        ratios = tuple(ratios)
+        if self._lods is None:
+            self._lods = {}
+        if ratios not in self._lods:
+            num_triangles = len(get_triangles(self.index, len(self.attributes)))
+            counts = [int(num_triangles * ratio) for ratio in ratios]
+            simplified = simplify(
+                self.attributes,
+                self.index,
+                [count for count in counts if count < num_triangles],
+            )
+            lods = []
+            for count in counts:
+                if count >= num_triangles:
+                    lods.append(self)
+                    continue
+                attributes, index = simplified.pop(0)
+                lods.append(
+                    Geometry.from_attributes(
+                        attributes, index.astype(get_index_dtype(len(attributes)))
+                    ).freeze()
+                )
+            self._lods[ratios] = lods
+        return self._lods[ratios]
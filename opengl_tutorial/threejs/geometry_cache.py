@@ -0,0 +1,259 @@
+import collections
+import hashlib
+import os
+import struct
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from .geometry import Geometry, get_index_dtype
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class GeometryCache:
+    """A bounded least-recently-used cache of frozen Geometry objects."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        # Geometries may be cached from gRPC callback threads.
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            geometry = self._entries.get(key)
+            if geometry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return geometry
+
+    def put(self, key, geometry):
+        with self._lock:
+            self._entries[key] = geometry.freeze()
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return geometry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+DiskCacheInfo = collections.namedtuple(
+    "DiskCacheInfo", ["hits", "misses", "evictions", "max_bytes", "currsize"]
+)
+
+
+class DiskGeometryCache:
+    """A size-bounded on-disk cache of geometries which are loaded with np.memmap.
+
+    Each entry is a single file made up of a fixed-size header followed by the
+    vertex attributes, stored as interleaved little-endian float32 records in the
+    same layout as Geometry.attributes, and then the index as little-endian
+    uint16 or uint32, whichever is narrowest for the vertex count. Entries
+    written under a different version stamp are treated as misses and deleted.
+    """
+
+    MAGIC = b"THREEGEO"
+    FORMAT_VERSION = 2
+    # magic, format version, version stamp, vertex count, index count,
+    # has normal, has uv, index element size.
+    HEADER = struct.Struct("<8sI20sIIBBB")
+    HEADER_SIZE = 64
+    SUFFIX = ".geom"
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, version=b""):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.version = hashlib.sha1(version).digest()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_path(self, key):
+        name, request_bytes = key
+        digest = hashlib.sha1(name.encode() + b"\0" + request_bytes).hexdigest()
+        return self.directory / f"{name}-{digest}{self.SUFFIX}"
+
+    def get(self, key):
+        path = self.get_path(key)
+        try:
+            geometry = self.load(path)
+        except FileNotFoundError:
+            geometry = None
+        except (OSError, ValueError):
+            # The entry is truncated (e.g. shorter than its arrays) or corrupt.
+            self.discard(path)
+            geometry = None
+        if geometry is None:
+            self.misses += 1
+            return None
+        # Use the modification time to track recency for eviction. Another
+        # process may have evicted or replaced the entry since it was loaded.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return geometry
+
+    def put(self, key, geometry):
+        path = self.get_path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        attribute_names = geometry.attributes.dtype.names
+        attributes = geometry.attributes.astype(
+            self.get_attribute_dtype(
+                "normal" in attribute_names, "uv" in attribute_names
+            )
+        )
+        index_dtype = get_index_dtype(len(attributes)).newbyteorder("<")
+        index = np.asarray(geometry.index).astype(index_dtype).ravel()
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.FORMAT_VERSION,
+            self.version,
+            len(attributes),
+            len(index),
+            "normal" in attribute_names,
+            "uv" in attribute_names,
+            index_dtype.itemsize,
+        )
+
+        # Write to a temporary file first so that readers never observe a
+        # partially written entry.
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(header.ljust(self.HEADER_SIZE, b"\0"))
+            f.write(attributes.tobytes())
+            f.write(index.tobytes())
+        os.replace(temp_path, path)
+        self.evict()
+        return geometry
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            header = f.read(self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            self.discard(path)
+            return None
+        (
+            magic,
+            format_version,
+            version,
+            num_vertices,
+            num_indices,
+            has_normal,
+            has_uv,
+            index_element_size,
+        ) = self.HEADER.unpack(header)
+        if (
+            magic != self.MAGIC
+            or format_version != self.FORMAT_VERSION
+            or version != self.version
+            or index_element_size not in (2, 4)
+        ):
+            self.discard(path)
+            return None
+
+        attribute_dtype = self.get_attribute_dtype(has_normal, has_uv)
+        index_dtype = f"<u{index_element_size}"
+        attributes = np.memmap(
+            path,
+            dtype=attribute_dtype,
+            mode="r",
+            offset=self.HEADER_SIZE,
+            shape=(num_vertices,),
+        )
+        if num_indices > 0:
+            index = np.memmap(
+                path,
+                dtype=index_dtype,
+                mode="r",
+                offset=self.HEADER_SIZE + num_vertices * attribute_dtype.itemsize,
+                shape=(num_indices,),
+            )
+        else:
+            index = np.empty(0, dtype=index_dtype)
+        return Geometry.from_attributes(attributes, index).freeze()
+
+    @staticmethod
+    def discard(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.SUFFIX):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            self.evictions += 1
+
+    def clear(self):
+        if self.directory.exists():
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(self.SUFFIX):
+                    os.remove(entry.path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        currsize = 0
+        if self.directory.exists():
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(self.SUFFIX):
+                    currsize += entry.stat().st_size
+        return DiskCacheInfo(
+            self.hits, self.misses, self.evictions, self.max_bytes, currsize
+        )
+
+    @staticmethod
+    def get_attribute_dtype(has_normal, has_uv):
+        dtype = [("position", "<f4", (3,))]
+        if has_normal:
+            dtype.append(("normal", "<f4", (3,)))
+        if has_uv:
+            dtype.append(("uv", "<f4", (2,)))
+        return np.dtype(dtype)
@@ -0,0 +1,48 @@
+import numpy as np
+
+# three.js draws an InstancedMesh with the same shader chunks as any other mesh,
+# and only defines USE_INSTANCING in front of them. Its prefix then declares the
+# instanceMatrix (and with USE_INSTANCING_COLOR, instanceColor) attribute, and
+# project_vertex and defaultnormal_vertex transform each vertex by it before the
+# model view matrix.
+
+
+def insert_defines(shader, defines):
+    # Defines have to come after #version, if there is one.
+    lines = shader.split("\n")
+    start = 1 if lines and lines[0].startswith("#version") else 0
+    return "\n".join(
+        lines[:start] + [f"#define {define}" for define in defines] + lines[start:]
+    )
+
+
+def declare_instancing(vertex_shader, fragment_shader, instance_colors=False):
+    """Rewrite a three.js program to draw instances, like an InstancedMesh.
+
+    With instance_colors, each instance's instanceColor multiplies the
+    material's diffuse color.
+    """
+    if "instanceMatrix" not in vertex_shader:
+        raise ValueError("The vertex shader doesn't declare three.js' instanceMatrix")
+    if instance_colors:
+        return (
+            insert_defines(vertex_shader, ["USE_INSTANCING", "USE_INSTANCING_COLOR"]),
+            # The fragment shader only sees the color through vColor.
+            insert_defines(fragment_shader, ["USE_COLOR"]),
+        )
+    return insert_defines(vertex_shader, ["USE_INSTANCING"]), fragment_shader
+
+
+def get_instance_attributes(matrices, colors=None):
+    """Per-instance attributes for an (n, 4, 4) array of model matrices, and
+    optionally an (n, 3) array of RGB colors."""
+    matrices = np.asarray(matrices, dtype=np.float64).reshape((-1, 4, 4))
+    dtype = [("instanceMatrix", np.float32, (16,))]
+    if colors is not None:
+        dtype.append(("instanceColor", np.float32, (3,)))
+    attributes = np.empty(len(matrices), dtype=dtype)
+    # A mat4 attribute takes a column per location.
+    attributes["instanceMatrix"] = matrices.transpose((0, 2, 1)).reshape((-1, 16))
+    if colors is not None:
+        attributes["instanceColor"] = np.asarray(colors).reshape((-1, 3))
+    return attributes
@@ -1,5 +1,12 @@
 from manim.renderer.shader import Shader
 
+from .billboard import declare_billboard
+from .instancing import declare_instancing
+from .program_cache import ProgramCache
+from .uniform_blocks import declare_uniform_blocks
+
+program_cache = ProgramCache()
+
 
 # Move the #extension directive earlier in the file.
 def move_extension_to_start(shader):
@@ -16,20 +23,78 @@ def move_extension_to_start(shader):
     # return "\n".join(new_shader_lines)
 
 
+def preprocess_shader(shader, uniform_blocks=False):
+    shader = move_extension_to_start(shader)
+    if uniform_blocks:
+        shader = declare_uniform_blocks(shader)
+    return shader
+
+
 class Material(Shader):
-    def __init__(self, context, vertex_shader, fragment_shader):
-        super().__init__(
-            context,
-            source={
-                "vertex_shader": vertex_shader,
-                "fragment_shader": fragment_shader,
-            },
+    def __init__(
+        self,
+        context,
+        vertex_shader,
+        fragment_shader,
+        uniform_blocks=False,
+        billboard=False,
+        instancing=False,
+        instance_colors=False,
+    ):
+        # With uniform_blocks, the camera and light uniforms are read from uniform
+        # buffers written once per frame rather than set for every mesh.
+        vertex_shader = preprocess_shader(vertex_shader, uniform_blocks)
+        # Meshes drawn with a billboard material always face the camera.
+        self.billboard = billboard
+        if billboard:
+            vertex_shader = declare_billboard(vertex_shader)
+        fragment_shader = preprocess_shader(fragment_shader, uniform_blocks)
+        # Instancing materials draw an InstancedThreeMesh's instances in one call.
+        self.instancing = instancing or instance_colors
+        self.instance_colors = instance_colors
+        if self.instancing:
+            vertex_shader, fragment_shader = declare_instancing(
+                vertex_shader, fragment_shader, instance_colors
+            )
+
+        # Shader.__init__ would link a new program even when an identical one
+        # already exists, so the program comes from the cache instead.
+        self.context = context
+        self.name = None
+        self.program_key, self.shader_program, self.binder = program_cache.acquire(
+            context, vertex_shader, fragment_shader
         )
+        self.uniforms = {}
+
+    def set_uniform(self, name, value):
+        # The program may be shared with other materials, so the value is kept
+        # to restore it before this material is drawn.
+        self.uniforms[name] = value
+        self.binder.set_uniform(name, value)
+
+    def apply_uniforms(self):
+        for name, value in self.uniforms.items():
+            self.binder.set_uniform(name, value)
+
+    def release(self):
+        if self.program_key is not None:
+            program_cache.release(self.program_key)
+            self.program_key = None
 
 
 class BasicMaterial(Material):
-    def __init__(self, context, vertex_shader, fragment_shader, config):
-        super().__init__(context, vertex_shader, fragment_shader)
+    def __init__(
+        self, context, vertex_shader, fragment_shader, config, uniform_blocks=False
+    ):
+        super().__init__(
+            context,
+            vertex_shader,
+            fragment_shader,
+            uniform_blocks,
+            billboard=config.get("billboard", False),
+            instancing=config.get("instancing", False),
+            instance_colors=config.get("instance_colors", False),
+        )
         defaults = {
             "diffuse": (1, 1, 1),
             "opacity": 1,
@@ -39,9 +104,18 @@ class BasicMaterial(Material):
 
 
 class PhongMaterial(Material):
-    def __init__(self, context, vertex_shader, fragment_shader, config):
-        fragment_shader = move_extension_to_start(fragment_shader)
-        super().__init__(context, vertex_shader, fragment_shader)
+    def __init__(
+        self, context, vertex_shader, fragment_shader, config, uniform_blocks=False
+    ):
+        super().__init__(
+            context,
+            vertex_shader,
+            fragment_shader,
+            uniform_blocks,
+            billboard=config.get("billboard", False),
+            instancing=config.get("instancing", False),
+            instance_colors=config.get("instance_colors", False),
+        )
 
         defaults = {
             "diffuse": (1, 1, 1),
@@ -62,9 +136,18 @@ class PhongMaterial(Material):
 
 
 class StandardMaterial(Material):
-    def __init__(self, context, vertex_shader, fragment_shader, config):
-        fragment_shader = move_extension_to_start(fragment_shader)
-        super().__init__(context, vertex_shader, fragment_shader)
+    def __init__(
+        self, context, vertex_shader, fragment_shader, config, uniform_blocks=False
+    ):
+        super().__init__(
+            context,
+            vertex_shader,
+            fragment_shader,
+            uniform_blocks,
+            billboard=config.get("billboard", False),
+            instancing=config.get("instancing", False),
+            instance_colors=config.get("instance_colors", False),
+        )
 
         defaults = {
             "diffuse": (1, 1, 1),
@@ -0,0 +1,220 @@
+import collections
+
+import numpy as np
+
+PickResult = collections.namedtuple(
+    "PickResult",
+    ["object", "triangle", "barycentric", "distance", "point", "instance"],
+    defaults=[None],
+)
+
+
+def cross(a, b):
+    # np.cross has a lot of overhead for the small arrays of a single query.
+    ax, ay, az = a[..., 0], a[..., 1], a[..., 2]
+    bx, by, bz = b[..., 0], b[..., 1], b[..., 2]
+    return np.stack([ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx], -1)
+
+
+class BVH:
+    """A bounding volume hierarchy over the triangles of a mesh, for casting rays
+    against it.
+
+    Nodes are split at the median centroid along their longest axis until they
+    hold at most leaf_size triangles. The tree is kept in flat arrays: node i's
+    children are left[i] and left[i] + 1, and a leaf (left[i] == -1) holds the
+    triangles order[start[i]:start[i] + count[i]].
+    """
+
+    def __init__(self, attributes, index=None, leaf_size=16):
+        self.attributes = attributes
+        self.index = index
+        position = np.asarray(attributes["position"], dtype=np.float64)
+        if index is None or len(index) == 0:
+            triangles = np.arange(len(position) - len(position) % 3).reshape((-1, 3))
+        else:
+            triangles = np.asarray(index, dtype=np.intp).reshape((-1, 3))
+        vertices = position[triangles]
+        self.v0 = vertices[:, 0]
+        self.e1 = vertices[:, 1] - self.v0
+        self.e2 = vertices[:, 2] - self.v0
+        triangle_min = vertices.min(axis=1)
+        triangle_max = vertices.max(axis=1)
+        centroids = vertices.mean(axis=1)
+
+        self.order = np.arange(len(triangles))
+        node_min = []
+        node_max = []
+        left = []
+        start = []
+        count = []
+
+        def add_node(node_start, node_end):
+            triangles = self.order[node_start:node_end]
+            if len(triangles) > 0:
+                node_min.append(triangle_min[triangles].min(axis=0))
+                node_max.append(triangle_max[triangles].max(axis=0))
+            else:
+                # An empty mesh, which a ray never hits.
+                node_min.append(np.full(3, np.inf))
+                node_max.append(np.full(3, -np.inf))
+            left.append(-1)
+            start.append(node_start)
+            count.append(node_end - node_start)
+            return len(left) - 1
+
+        stack = [add_node(0, len(triangles))]
+        while stack:
+            node = stack.pop()
+            if count[node] <= leaf_size:
+                continue
+            node_start = start[node]
+            node_end = node_start + count[node]
+            triangles = self.order[node_start:node_end]
+            node_centroids = centroids[triangles]
+            axis = np.argmax(np.ptp(node_centroids, axis=0))
+            middle = len(triangles) // 2
+            partition = np.argpartition(node_centroids[:, axis], middle)
+            self.order[node_start:node_end] = triangles[partition]
+            left[node] = add_node(node_start, node_start + middle)
+            add_node(node_start + middle, node_end)
+            stack.extend([left[node], left[node] + 1])
+
+        self.node_min = np.array(node_min)
+        self.node_max = np.array(node_max)
+        self.left = np.array(left, dtype=np.intp)
+        self.start = np.array(start, dtype=np.intp)
+        self.count = np.array(count, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.order)
+
+    def candidate_triangles(self, origin, direction):
+        """The triangles of the leaves whose bounds the ray passes through.
+
+        The tree is traversed a level at a time, testing every node of the level
+        at once.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # -0 is made +0 so that the divisions below give +inf for both.
+            inverse_direction = 1 / np.where(direction == 0, 0.0, direction)
+            leaves = []
+            nodes = np.zeros(1, dtype=np.intp)
+            while len(nodes) > 0:
+                t0 = (self.node_min[nodes] - origin) * inverse_direction
+                t1 = (self.node_max[nodes] - origin) * inverse_direction
+                # A ray parallel to a slab and lying on one of its planes gives
+                # 0 * inf = NaN. It's inside the slab along its whole length.
+                t0[np.isnan(t0)] = -np.inf
+                t1[np.isnan(t1)] = np.inf
+                t_near = np.fmin(t0, t1).max(axis=1)
+                t_far = np.fmax(t0, t1).min(axis=1)
+                nodes = nodes[t_far >= np.maximum(t_near, 0)]
+                is_leaf = self.left[nodes] < 0
+                leaves.append(nodes[is_leaf])
+                children = self.left[nodes[~is_leaf]]
+                nodes = np.concatenate([children, children + 1])
+
+        leaves = np.concatenate(leaves)
+        counts = self.count[leaves]
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        return self.order[np.repeat(self.start[leaves], counts) + offsets]
+
+    def intersect(self, origin, direction):
+        """Return the (distance, triangle, u, v) of the closest triangle the ray
+        origin + distance * direction hits, or None.
+
+        u and v are the barycentric coordinates of the hit point relative to the
+        triangle's second and third vertices. Triangles are hit from either side.
+        """
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        triangles = self.candidate_triangles(origin, direction)
+        if len(triangles) == 0:
+            return None
+
+        # Möller–Trumbore, for all of the candidates at once.
+        e1 = self.e1[triangles]
+        e2 = self.e2[triangles]
+        p = cross(direction, e2)
+        determinant = np.sum(e1 * p, axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse_determinant = 1 / determinant
+            s = origin - self.v0[triangles]
+            u = np.sum(s * p, axis=-1) * inverse_determinant
+            q = cross(s, e1)
+            v = (q @ direction) * inverse_determinant
+            t = np.sum(e2 * q, axis=-1) * inverse_determinant
+            hit = (
+                (np.abs(determinant) > 1e-12)
+                & (u >= 0)
+                & (v >= 0)
+                & (u + v <= 1)
+                & (t >= 0)
+            )
+        if not np.any(hit):
+            return None
+        closest = np.flatnonzero(hit)[np.argmin(t[hit])]
+        return t[closest], triangles[closest], u[closest], v[closest]
+
+
+def get_bvh(mesh):
+    """The BVH of a mesh's triangles in model space. Meshes created from the same
+    Geometry share it."""
+    geometry = getattr(mesh, "geometry", None)
+    if geometry is not None:
+        return geometry.get_bvh()
+    # Otherwise it's kept on the mesh until its attributes are replaced.
+    bvh = getattr(mesh, "_bvh", None)
+    if (
+        bvh is None
+        or bvh.attributes is not mesh.attributes
+        or bvh.index is not mesh.indices
+    ):
+        bvh = mesh._bvh = BVH(mesh.attributes, mesh.indices)
+    return bvh
+
+
+def pick(objects, origin, direction):
+    """Cast a world space ray against the meshes in (and below) objects.
+
+    Returns a PickResult for the closest hit, or None. The triangle is an index
+    into the mesh's triangles, the barycentric coordinates weigh its three
+    vertices, and the distance is in units of direction. For an
+    InstancedThreeMesh, instance is the index of the instance hit.
+    """
+    origin = np.append(np.asarray(origin, dtype=np.float64), 1)
+    direction = np.append(np.asarray(direction, dtype=np.float64), 0)
+    closest = None
+    for obj in objects:
+        for mesh in obj.get_meshes():
+            if "position" not in mesh.attributes.dtype.names:
+                continue
+            world_matrix = mesh.hierarchical_model_matrix()
+            # Each instance of an InstancedThreeMesh is a copy of the geometry.
+            instance_matrices = getattr(mesh, "instance_matrices", None)
+            if instance_matrices is None:
+                model_matrices = [(None, world_matrix)]
+            else:
+                model_matrices = enumerate(world_matrix @ instance_matrices)
+            for instance, model_matrix in model_matrices:
+                # The ray is moved into model space rather than every triangle
+                # into world space. Distances along it are the same in both.
+                model_matrix_inv = np.linalg.inv(model_matrix)
+                hit = get_bvh(mesh).intersect(
+                    (model_matrix_inv @ origin)[:3], (model_matrix_inv @ direction)[:3]
+                )
+                if hit is None or (closest is not None and hit[0] >= closest.distance):
+                    continue
+                distance, triangle, u, v = hit
+                closest = PickResult(
+                    mesh,
+                    int(triangle),
+                    (1 - u - v, u, v),
+                    distance,
+                    origin[:3] + distance * direction[:3],
+                    instance,
+                )
+    return closest
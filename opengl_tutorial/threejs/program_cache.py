@@ -0,0 +1,71 @@
+import collections
+import hashlib
+
+from .uniform_binder import UniformBinder, UploadInfo
+
+ProgramCacheInfo = collections.namedtuple(
+    "ProgramCacheInfo", ["hits", "misses", "releases", "currsize"]
+)
+
+
+class ProgramCache:
+    """Linked shader programs shared between materials with identical sources.
+
+    Programs are keyed per context on a hash of their preprocessed sources and
+    are reference counted, so a program is released once no material uses it.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.releases = 0
+        # (context, source hash) -> [program, binder, reference count]
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(vertex_shader, fragment_shader):
+        source_hash = hashlib.sha1()
+        source_hash.update(vertex_shader.encode())
+        source_hash.update(b"\0")
+        source_hash.update(fragment_shader.encode())
+        return source_hash.hexdigest()
+
+    def acquire(self, context, vertex_shader, fragment_shader):
+        """Return a (key, program, binder) tuple, linking the program on a miss.
+        The key must be passed to release() once the program is no longer
+        used."""
+        key = (context, self.get_key(vertex_shader, fragment_shader))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            program = context.program(
+                vertex_shader=vertex_shader, fragment_shader=fragment_shader
+            )
+            entry = self._entries[key] = [program, UniformBinder(program), 0]
+        else:
+            self.hits += 1
+        entry[2] += 1
+        return key, entry[0], entry[1]
+
+    def release(self, key):
+        entry = self._entries[key]
+        entry[2] -= 1
+        if entry[2] == 0:
+            del self._entries[key]
+            entry[0].release()
+            self.releases += 1
+
+    def upload_info(self):
+        """Uniform uploads performed and skipped by all cached programs."""
+        return UploadInfo(
+            sum(binder.uploads_performed for _, binder, _ in self._entries.values()),
+            sum(binder.uploads_skipped for _, binder, _ in self._entries.values()),
+        )
+
+    def info(self):
+        return ProgramCacheInfo(
+            self.hits, self.misses, self.releases, len(self._entries)
+        )
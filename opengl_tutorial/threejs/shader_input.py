@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def matrix_to_shader_buffer(matrix, out=None):
+    """Like opengl.matrix_to_shader_input, but returns the matrix as a
+    column-major float32 array, which can be passed to Uniform.write().
+
+    When out (a float32 array of the matrix's shape) is given the matrix is
+    copied into it, so a matrix uploaded every frame needs no allocations.
+    """
+    if out is None:
+        out = np.empty(np.shape(matrix), dtype=np.float32)
+    # A C-contiguous array holding the transpose is the matrix in column-major
+    # order.
+    np.copyto(out.T, matrix)
+    return out
+
+
+def matmul_to_shader_buffer(a, b, out):
+    """Write a @ b into out in column-major order without a temporary."""
+    np.matmul(a, b, out=out.T)
+    return out
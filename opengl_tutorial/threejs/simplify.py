@@ -0,0 +1,233 @@
+import heapq
+
+import numpy as np
+
+from .vertex_cache import get_triangles, optimize_vertex_fetch
+
+# Mesh simplification by edge collapses ordered by Garland and Heckbert's
+# quadric error metric. Each vertex accumulates the planes of the triangles
+# around it, and collapsing an edge costs the summed squared distance from the
+# vertex it's collapsed onto to the planes of both ends.
+
+# How much more the planes through open edges weigh than the triangles', so that
+# the outlines of open meshes hold their shape.
+BORDER_WEIGHT = 10.0
+
+
+def plane_quadrics(normals, points, weights):
+    # K = w * p p^T for the planes p = (n, -n.x), one per row.
+    planes = np.concatenate(
+        [normals, -np.sum(normals * points, axis=-1, keepdims=True)], axis=-1
+    )
+    return weights[:, None, None] * planes[:, :, None] * planes[:, None, :]
+
+
+def collapse_costs(quadrics, points, a, b):
+    # The cost of moving a onto b with the combined quadric of both.
+    v = np.concatenate([points[b], np.ones((len(b), 1))], axis=-1)
+    return np.maximum(
+        np.einsum("ni,nij,nj->n", v, quadrics[a] + quadrics[b], v), 0
+    ).tolist()
+
+
+def simplify(attributes, index, triangle_counts, tolerance=1e-6):
+    """Simplify a triangle mesh down to each of triangle_counts in turn.
+
+    Returns an (attributes, index) pair for each count, in the order of the
+    counts, with the unused vertices dropped. Each edge collapse moves one
+    vertex onto its neighbor (with the neighbor's attributes), so no new
+    vertices are created. Vertices at the same position are treated as one,
+    which keeps seams and flat shaded meshes closed. Collapses which would flip
+    a triangle or make the mesh non-manifold are skipped, so meshes may stop
+    short of the smaller counts.
+    """
+    position = np.asarray(attributes["position"], dtype=np.float64)
+    triangles = get_triangles(index, len(attributes))
+
+    # Collapses work on the welded positions, and each corner keeps the
+    # attribute vertex it had.
+    keys = np.round(position / tolerance).astype(np.int64)
+    _, first, welded = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    points = position[first]
+    corners = welded.reshape(-1)[triangles]
+    a, b, c = corners.T
+    valid = (a != b) & (b != c) & (c != a)
+    triangles = triangles[valid]
+    corners = corners[valid]
+
+    # Triangle planes, weighted by area.
+    corner_points = points[corners]
+    normals = np.cross(
+        corner_points[:, 1] - corner_points[:, 0],
+        corner_points[:, 2] - corner_points[:, 0],
+    )
+    areas = np.linalg.norm(normals, axis=-1)
+    unit_normals = normals / np.maximum(areas, 1e-30)[:, None]
+    quadrics = np.zeros((len(points), 4, 4))
+    face_quadrics = plane_quadrics(unit_normals, corner_points[:, 0], areas / 2)
+    for k in range(3):
+        np.add.at(quadrics, corners[:, k], face_quadrics)
+
+    # Planes perpendicular to the triangles through their open edges.
+    edge_start = corners.ravel()
+    edge_end = np.roll(corners, -1, axis=1).ravel()
+    edge_faces = np.repeat(np.arange(len(corners)), 3)
+    edges = np.sort(np.stack([edge_start, edge_end], -1), axis=-1)
+    unique_edges, edge_ids, edge_uses = np.unique(
+        edges, axis=0, return_inverse=True, return_counts=True
+    )
+    border = edge_uses[edge_ids.reshape(-1)] == 1
+    if np.any(border):
+        vectors = points[edge_end[border]] - points[edge_start[border]]
+        lengths = np.linalg.norm(vectors, axis=-1)
+        border_normals = np.cross(vectors, unit_normals[edge_faces[border]])
+        border_normals /= np.maximum(np.linalg.norm(border_normals, axis=-1), 1e-30)[
+            :, None
+        ]
+        border_quadrics = plane_quadrics(
+            border_normals, points[edge_start[border]], BORDER_WEIGHT * lengths**2
+        )
+        np.add.at(quadrics, edge_start[border], border_quadrics)
+        np.add.at(quadrics, edge_end[border], border_quadrics)
+
+    # The attributes besides position pick which vertex a corner takes when its
+    # own is collapsed.
+    features = np.concatenate(
+        [
+            np.asarray(attributes[name], dtype=np.float64).reshape(
+                (len(attributes), -1)
+            )
+            for name in attributes.dtype.names
+            if name != "position"
+        ]
+        or [np.zeros((len(attributes), 0))],
+        axis=1,
+    )
+
+    face_corners = corners.tolist()
+    face_attributes = triangles.tolist()
+    vertex_faces = [set() for _ in range(len(points))]
+    for face, vertices in enumerate(face_corners):
+        for vertex in vertices:
+            vertex_faces[vertex].add(face)
+    alive = np.ones(len(face_corners), dtype=bool)
+    num_alive = len(face_corners)
+    version = [0] * len(points)
+
+    # Entries are (cost, vertex, target, vertex's version, target's version),
+    # and are stale once either version has moved on.
+    heap = []
+
+    def push(sources, targets):
+        for cost, source, target in zip(
+            collapse_costs(quadrics, points, sources, targets), sources, targets
+        ):
+            heapq.heappush(
+                heap, (cost, source, target, version[source], version[target])
+            )
+
+    a, b = unique_edges.T
+    push(np.concatenate([a, b]).tolist(), np.concatenate([b, a]).tolist())
+
+    def snapshot():
+        index = np.array(
+            [face_attributes[face] for face in np.flatnonzero(alive)], dtype=np.intp
+        ).reshape(-1)
+        return optimize_vertex_fetch(attributes, index)
+
+    order = np.argsort(triangle_counts)[::-1]
+    results = [None] * len(triangle_counts)
+    next_target = 0
+
+    while next_target < len(order):
+        if num_alive <= triangle_counts[order[next_target]]:
+            results[order[next_target]] = snapshot()
+            next_target += 1
+            continue
+        if not heap:
+            break
+        _, source, target, source_version, target_version = heapq.heappop(heap)
+        if version[source] != source_version or version[target] != target_version:
+            continue
+        source_faces = vertex_faces[source]
+        target_faces = vertex_faces[target]
+        shared = source_faces & target_faces
+        if not shared:
+            continue
+
+        # Link condition: the ends may only share the neighbors across the
+        # collapsed triangles, or the mesh would pinch.
+        opposite = {
+            vertex
+            for face in shared
+            for vertex in face_corners[face]
+            if vertex != source and vertex != target
+        }
+        source_neighbors = {
+            vertex for face in source_faces for vertex in face_corners[face]
+        }
+        target_neighbors = {
+            vertex for face in target_faces for vertex in face_corners[face]
+        }
+        if (source_neighbors & target_neighbors) - opposite - {source, target}:
+            continue
+
+        moved = list(source_faces - shared)
+        if moved:
+            moved_corners = np.array([face_corners[face] for face in moved])
+            before = points[moved_corners]
+            after = before.copy()
+            after[moved_corners == source] = points[target]
+            normals_before = np.cross(
+                before[:, 1] - before[:, 0], before[:, 2] - before[:, 0]
+            )
+            normals_after = np.cross(
+                after[:, 1] - after[:, 0], after[:, 2] - after[:, 0]
+            )
+            if np.any(np.sum(normals_before * normals_after, axis=-1) <= 0):
+                continue
+
+        # The attribute vertices at the target, for the moved corners to choose
+        # from.
+        candidates = list(
+            {
+                vertex
+                for face in target_faces
+                for vertex, corner in zip(face_attributes[face], face_corners[face])
+                if corner == target
+            }
+        )
+        for face in shared:
+            alive[face] = False
+            num_alive -= 1
+            for vertex in face_corners[face]:
+                if vertex != source:
+                    vertex_faces[vertex].discard(face)
+        for face in moved:
+            k = face_corners[face].index(source)
+            face_corners[face][k] = target
+            vertex = face_attributes[face][k]
+            if len(candidates) == 1:
+                face_attributes[face][k] = candidates[0]
+            else:
+                distances = np.sum(
+                    (features[candidates] - features[vertex]) ** 2, axis=-1
+                )
+                face_attributes[face][k] = candidates[int(np.argmin(distances))]
+            target_faces.add(face)
+        vertex_faces[source] = set()
+        version[source] += 1
+        version[target] += 1
+        quadrics[target] += quadrics[source]
+
+        neighbors = list(
+            {vertex for face in target_faces for vertex in face_corners[face]}
+            - {target}
+        )
+        push([target] * len(neighbors), neighbors)
+        push(neighbors, [target] * len(neighbors))
+
+    # Whatever couldn't be reached is as simple as the mesh gets.
+    for target in order[next_target:]:
+        results[target] = snapshot()
+    return results
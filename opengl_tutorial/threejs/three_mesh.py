@@ -1,89 +1,237 @@
-import re
-
+import moderngl
 import numpy as np
+from manim.renderer.shader import Mesh, filter_attributes
+
+from .bounds import (
+    compute_bounds,
+    get_local_bounds,
+    get_max_scale,
+    get_mesh_world_bounds,
+    merge_transformed_bounds,
+)
+from .frame_state import FrameState
+from .geometry import get_index_dtype
+from .instancing import get_instance_attributes
+from .material import Material
+from .transforms import CachedTransform
+from .uniform_binder import UniformBinder
+
+
+class ThreeMesh(CachedTransform, Mesh):
+    # Like three.js' Object3D.frustumCulled. Meshes outside the camera's frustum
+    # are neither set up nor drawn.
+    frustum_culled = True
+    # Whether the mesh was outside the frustum of the frame being drawn.
+    culled = False
+    instance_count = 1
 
-import manim.utils.opengl as opengl
-from manim.renderer.shader import Mesh
-from manim.utils.color import color_to_rgb
+    def __init__(self, *args, geometry=None, **kwargs):
+        super().__init__(*args, geometry=geometry, **kwargs)
+        # Kept so that what's derived from the geometry (e.g. its BVH) is shared
+        # between the meshes created from it.
+        self.geometry = geometry
 
+    def is_in_frustum(self, frustum):
+        bounds = get_local_bounds(self)
+        if bounds is None:
+            # Without positions there's nothing to tell where the mesh is.
+            return True
+        if getattr(self.shader, "billboard", False):
+            return frustum.intersects(get_mesh_world_bounds(self))
+        return frustum.intersects(bounds, self.hierarchical_model_matrix())
 
-class ThreeMesh(Mesh):
     def set_uniforms(self, renderer):
-        from moderngl.program_members.uniform import Uniform
-
-        for k, v in self.shader.shader_program._members.items():
-            view_matrix = renderer.camera.get_view_matrix(format=False)
-            if isinstance(v, Uniform):
-                if k == "viewMatrix":
-                    self.shader.set_uniform(
-                        "viewMatrix", opengl.matrix_to_shader_input(view_matrix)
-                    )
-                if k == "projectionMatrix":
-                    self.shader.set_uniform(
-                        "projectionMatrix",
-                        renderer.camera.projection_matrix,
-                    )
-                if k == "modelViewMatrix":
-                    self.shader.set_uniform(
-                        "modelViewMatrix",
-                        opengl.matrix_to_shader_input(
-                            view_matrix @ self.hierarchical_model_matrix()
-                        ),
-                    )
-                if k == "normalMatrix":
-                    self.shader.set_uniform(
-                        "normalMatrix",
-                        opengl.matrix_to_shader_input(
-                            view_matrix[:3, :3] @ self.hierarchical_normal_matrix()
-                        ),
-                    )
-                if k == "isOrthographic":
-                    self.shader.set_uniform(
-                        "isOrthographic", renderer.camera.orthographic
-                    )
-                point_lights_pattern = re.compile("pointLights\[(\d+)\]")
-                point_lights_match = re.match(point_lights_pattern, k)
-                if point_lights_match is not None:
-                    point_light_index = int(point_lights_match.group(1))
-                    # TODO: Use a while loop and warn if the shader can't contain all of
-                    # the lights.
-                    if len(renderer.scene.point_lights) > point_light_index:
-                        point_light_config = renderer.scene.point_lights[
-                            point_light_index
-                        ]
-                        camera_space_light_position = view_matrix @ np.array(
-                            point_light_config["position"] + [1]
-                        )
-                        camera_space_light_position = camera_space_light_position[:3]
-
-                        self.shader.set_uniform(
-                            f"pointLights[{point_light_index}].position",
-                            tuple(camera_space_light_position),
-                        )
-                        self.shader.set_uniform(
-                            f"pointLights[{point_light_index}].color",
-                            tuple(point_light_config["color"]),
-                        )
-                        self.shader.set_uniform(
-                            f"pointLights[{point_light_index}].distance",
-                            point_light_config["distance"],
-                        )
-                        self.shader.set_uniform(
-                            f"pointLights[{point_light_index}].decay",
-                            point_light_config["decay"],
-                        )
-                if (
-                    k == "ambientLightColor"
-                    and renderer.scene.ambient_light is not None
-                ):
-                    ambient_light_rgb = color_to_rgb(
-                        renderer.scene.ambient_light["color"]
-                    )
-                    ambient_light_values = [
-                        col * renderer.scene.ambient_light["intensity"]
-                        for col in ambient_light_rgb
-                    ]
-                    self.shader.set_uniform(
-                        "ambientLightColor",
-                        tuple(ambient_light_values),
-                    )
+        frame_state = FrameState.for_renderer(renderer)
+        self.culled = self.frustum_culled and not self.is_in_frustum(
+            frame_state.frustum
+        )
+        if self.culled:
+            frame_state.culled += 1
+            return
+        frame_state.drawn += 1
+
+        # Materials can share a program, so restore this mesh's material values.
+        if isinstance(self.shader, Material):
+            self.shader.apply_uniforms()
+
+        binder = getattr(self.shader, "binder", None)
+        if binder is None:
+            binder = self.shader.binder = UniformBinder(self.shader.shader_program)
+        binder.bind(self, frame_state)
+
+    def get_index_data(self):
+        # Mesh.render converts every index to int32. Indices already in a type
+        # OpenGL can draw with (e.g. from Geometry.compact()) are uploaded as
+        # they are, and others in the narrowest type that fits.
+        indices = self.indices
+        if indices is None or np.ndim(indices) == 0 or len(indices) == 0:
+            return None
+        indices = np.asarray(indices)
+        if indices.dtype not in (np.uint16, np.uint32):
+            indices = indices.astype(get_index_dtype(len(self.attributes)))
+        return np.ascontiguousarray(indices)
+
+    def render(self):
+        if self.skip_render or self.culled:
+            return
+
+        context = self.shader.context
+        if self.use_depth_test:
+            context.enable(moderngl.DEPTH_TEST)
+        else:
+            context.disable(moderngl.DEPTH_TEST)
+
+        from moderngl.program_members.attribute import Attribute
+
+        attribute_names = [
+            name
+            for name, member in self.shader.shader_program._members.items()
+            if isinstance(member, Attribute)
+        ]
+        content = self.get_vertex_array_content(context, attribute_names)
+        index_data = self.get_index_data()
+        if index_data is None:
+            index_buffer_object = None
+            index_element_size = 4
+        else:
+            index_buffer_object = context.buffer(index_data)
+            index_element_size = index_data.itemsize
+        vertex_array_object = context.vertex_array(
+            self.shader.shader_program,
+            content,
+            index_buffer=index_buffer_object,
+            index_element_size=index_element_size,
+        )
+        vertex_array_object.render(self.primitive, instances=self.instance_count)
+        for buffer_object, *_ in content:
+            buffer_object.release()
+        vertex_array_object.release()
+        if index_buffer_object is not None:
+            index_buffer_object.release()
+
+    def get_vertex_array_content(self, context, attribute_names):
+        # A (buffer, format, *attributes) tuple for each buffer the program
+        # reads attributes from.
+        shader_attributes = filter_attributes(self.attributes, attribute_names)
+        names = shader_attributes.dtype.names
+        return [
+            (
+                context.buffer(shader_attributes.tobytes()),
+                moderngl.detect_format(self.shader.shader_program, names),
+                *names,
+            )
+        ]
+
+
+class LODThreeMesh(ThreeMesh):
+    """A ThreeMesh which draws simpler geometry the smaller it is on screen.
+
+    levels are Geometries from the most to the least detailed, e.g. from
+    Geometry.get_lods(). Level i is drawn while the mesh's bounding sphere is at
+    least screen_sizes[i] of the screen's height across, and the last level once
+    it's smaller than all of them.
+    """
+
+    def __init__(self, levels, *args, screen_sizes=(0.5, 0.25, 0.1), **kwargs):
+        if len(screen_sizes) != len(levels) - 1:
+            raise ValueError(
+                f"Expected {len(levels) - 1} screen sizes for {len(levels)} levels "
+                f"but received {len(screen_sizes)}"
+            )
+        super().__init__(*args, geometry=levels[0], **kwargs)
+        self.levels = levels
+        self.screen_sizes = screen_sizes
+        self.level = 0
+
+    def get_screen_size(self, frame_state):
+        """The diameter of the mesh's bounding sphere as a fraction of the
+        screen's height."""
+        # Simplification keeps vertices where they are, so the most detailed
+        # level's bounds hold every level.
+        bounds = self.levels[0].get_bounds()
+        if bounds is None:
+            return 0
+        model_matrix = self.hierarchical_model_matrix()
+        center = model_matrix[:3, :3] @ bounds.center + model_matrix[:3, 3]
+        radius = bounds.radius * get_max_scale(model_matrix)
+        # The projection's y scale, which is on its diagonal in either order.
+        y_scale = frame_state.projection_matrix[5]
+        if frame_state.is_orthographic:
+            return radius * y_scale
+        depth = -(
+            frame_state.view_matrix[2, :3] @ center + frame_state.view_matrix[2, 3]
+        )
+        if depth <= radius:
+            # The camera is inside the sphere.
+            return np.inf
+        return radius * y_scale / depth
+
+    def set_level(self, level):
+        if level == self.level:
+            return
+        self.level = level
+        self.geometry = self.levels[level]
+        self.attributes = self.geometry.attributes
+        self.indices = self.geometry.index
+
+    def set_uniforms(self, renderer):
+        super().set_uniforms(renderer)
+        if not self.culled:
+            screen_size = self.get_screen_size(FrameState.for_renderer(renderer))
+            self.set_level(sum(screen_size < size for size in self.screen_sizes))
+
+
+class InstancedThreeMesh(ThreeMesh):
+    """Draws a geometry once for each of an (n, 4, 4) array of model matrices in
+    a single call, like three.js' InstancedMesh.
+
+    Each instance is transformed by its matrix and then by the mesh's own model
+    matrix. The material must be created with instancing, or with
+    instance_colors to multiply its diffuse color by an (n, 3) array of colors.
+    """
+
+    def __init__(self, instance_matrices, *args, instance_colors=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not getattr(self.shader, "instancing", False):
+            raise ValueError("InstancedThreeMesh needs a material with instancing")
+        self.set_instances(instance_matrices, instance_colors)
+
+    @property
+    def instance_count(self):
+        return len(self.instance_attributes)
+
+    def set_instances(self, instance_matrices, instance_colors=None):
+        instance_matrices = np.asarray(instance_matrices, dtype=np.float64).reshape(
+            (-1, 4, 4)
+        )
+        if getattr(self.shader, "instance_colors", False):
+            # Instances without colors keep the material's diffuse color.
+            if instance_colors is None:
+                instance_colors = np.ones((len(instance_matrices), 3))
+        elif instance_colors is not None:
+            raise ValueError("Instance colors need a material with instance_colors")
+        self.instance_matrices = instance_matrices
+        self.instance_attributes = get_instance_attributes(
+            instance_matrices, instance_colors
+        )
+        if self.geometry is not None:
+            bounds = self.geometry.get_bounds()
+        else:
+            bounds = compute_bounds(self.attributes["position"])
+        self.instance_bounds = merge_transformed_bounds(bounds, instance_matrices)
+
+    def get_vertex_array_content(self, context, attribute_names):
+        content = super().get_vertex_array_content(context, attribute_names)
+        instance_attributes = filter_attributes(
+            self.instance_attributes, attribute_names
+        )
+        names = instance_attributes.dtype.names
+        content.append(
+            (
+                context.buffer(instance_attributes.tobytes()),
+                # The instance attributes advance once per instance.
+                moderngl.detect_format(self.shader.shader_program, names) + "/i",
+                *names,
+            )
+        )
+        return content
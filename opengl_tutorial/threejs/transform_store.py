@@ -0,0 +1,132 @@
+import numpy as np
+
+from .transforms import CachedTransform, TrackedMatrix, inverse_transpose
+
+
+class TransformStore:
+    """The model matrices of many objects, kept in a single array.
+
+    Objects added to the store (ThreeMesh, ThreeObject3D, ...) have their
+    model_matrix replaced by a view into model_matrices, an (N, 4, 4) float32
+    array ordered breadth first, so that every level of the hierarchy is a
+    contiguous slice whose parents come before it. The world and normal
+    matrices of all of the objects are then computed with one batched matmul
+    per level rather than per object.
+
+    Matrices can be changed through the objects as usual, or many at once by
+    writing into model_matrices (e.g. at the indices returned by indices()) and
+    calling invalidate().
+    """
+
+    def __init__(self):
+        self.objects = []
+        self.model_matrices = np.empty((0, 4, 4), dtype=np.float32)
+        self.world_matrices = np.empty((0, 4, 4), dtype=np.float32)
+        self.normal_matrices = np.empty((0, 3, 3), dtype=np.float32)
+        self.parents = np.empty(0, dtype=np.intp)
+        # (start, end) of each level of the hierarchy in the arrays.
+        self.levels = []
+        self.hierarchy_changed = False
+        self.stale = True
+
+    def __len__(self):
+        return len(self.objects)
+
+    def add(self, *roots):
+        """Add the objects and everything below them.
+
+        Only objects with cached transforms can be kept in a store. Objects
+        below any other object are left out, as is what's below them.
+        """
+        for root in roots:
+            bfs = [root]
+            while bfs:
+                obj = bfs.pop(0)
+                if obj._transform_store is self:
+                    continue
+                if obj._transform_store is not None:
+                    raise ValueError("Object is already in another TransformStore")
+                obj.invalidate_world_matrix()
+                obj._transform_store = self
+                obj._world_matrix_stale = True
+                self.objects.append(obj)
+                bfs.extend(
+                    child
+                    for child in obj.children
+                    if isinstance(child, CachedTransform)
+                )
+        self.hierarchy_changed = True
+
+    def indices(self, objects):
+        self.update()
+        return np.array([obj._transform_index for obj in objects], dtype=np.intp)
+
+    def invalidate(self):
+        self.stale = True
+
+    def rebuild(self):
+        # Sort the objects breadth first. An object whose parent isn't in the
+        # store is a root, which has to be the top of its hierarchy.
+        children = {id(obj): [] for obj in self.objects}
+        roots = []
+        for obj in self.objects:
+            if obj.parent is None:
+                roots.append(obj)
+            elif id(obj.parent) in children:
+                children[id(obj.parent)].append(obj)
+            else:
+                raise ValueError(
+                    "Objects in a TransformStore can only have parents in the store"
+                )
+
+        objects = []
+        self.levels = []
+        level = roots
+        while level:
+            self.levels.append((len(objects), len(objects) + len(level)))
+            objects.extend(level)
+            level = [child for obj in level for child in children[id(obj)]]
+
+        model_matrices = np.empty((len(objects), 4, 4), dtype=np.float32)
+        parents = np.full(len(objects), -1, dtype=np.intp)
+        for index, obj in enumerate(objects):
+            obj._transform_index = index
+            model_matrices[index] = obj._model_matrix
+            if obj.parent is not None:
+                parents[index] = obj.parent._transform_index
+        for index, obj in enumerate(objects):
+            obj._model_matrix = model_matrices[index].view(TrackedMatrix)
+            obj._model_matrix.owner = obj
+
+        self.objects = objects
+        self.model_matrices = model_matrices
+        self.world_matrices = np.empty_like(model_matrices)
+        self.normal_matrices = np.empty((len(objects), 3, 3), dtype=np.float32)
+        self.parents = parents
+        self.hierarchy_changed = False
+        self.stale = True
+
+    def update(self):
+        if self.hierarchy_changed:
+            self.rebuild()
+        if not self.stale:
+            return
+        for level_index, (start, end) in enumerate(self.levels):
+            if level_index == 0:
+                self.world_matrices[start:end] = self.model_matrices[start:end]
+            else:
+                np.matmul(
+                    self.world_matrices[self.parents[start:end]],
+                    self.model_matrices[start:end],
+                    out=self.world_matrices[start:end],
+                )
+        inverse_transpose(self.world_matrices[:, :3, :3], self.normal_matrices)
+        self.stale = False
+
+    def world_matrix(self, obj):
+        self.update()
+        return self.world_matrices[obj._transform_index]
+
+    def normal_matrix(self, obj):
+        self.update()
+        return self.normal_matrices[obj._transform_index]
@@ -0,0 +1,174 @@
+import numpy as np
+from manim.renderer.shader import Object3D
+
+
+class TrackedMatrix(np.ndarray):
+    """A model matrix which tells the object owning it when it's modified in
+    place, e.g. by Object3D.set_position()."""
+
+    def __new__(cls, matrix, owner):
+        tracked_matrix = np.array(matrix, dtype=np.float64).view(cls)
+        tracked_matrix.owner = owner
+        return tracked_matrix
+
+    def __array_finalize__(self, obj):
+        # Views (model_matrix[:, 3][:3], ...) modify the owner's matrix as well.
+        self.owner = getattr(obj, "owner", None)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if self.owner is not None:
+            self.owner.invalidate_world_matrix()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        # Results are plain arrays, only matrices written through out= (as by
+        # m += ...) are tracked.
+        inputs = [
+            x.view(np.ndarray) if isinstance(x, TrackedMatrix) else x for x in inputs
+        ]
+        if out is not None:
+            kwargs["out"] = tuple(
+                x.view(np.ndarray) if isinstance(x, TrackedMatrix) else x for x in out
+            )
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        for x in out or ():
+            if isinstance(x, TrackedMatrix) and x.owner is not None:
+                x.owner.invalidate_world_matrix()
+        return result
+
+
+def inverse_transpose(matrix, out):
+    """Write the inverse-transpose of a 3x3 matrix (or of a stack of them) into
+    out.
+
+    The inverse-transpose is the cofactor matrix divided by the determinant. A
+    singular matrix (e.g. one scaled by 0) has no inverse, and its cofactor
+    matrix is used as is.
+    """
+    if matrix.ndim == 2:
+        # Plain float arithmetic is several times faster than NumPy for a single
+        # small matrix.
+        (a, b, c), (d, e, f), (g, h, i) = matrix.tolist()
+        cofactors = [
+            [e * i - f * h, f * g - d * i, d * h - e * g],
+            [c * h - b * i, a * i - c * g, b * g - a * h],
+            [b * f - c * e, c * d - a * f, a * e - b * d],
+        ]
+        out[...] = cofactors
+        determinant = a * cofactors[0][0] + b * cofactors[0][1] + c * cofactors[0][2]
+        if determinant != 0:
+            out /= determinant
+        return out
+
+    # Cofactor (i, j) is the 2x2 minor of the rows and columns following i and
+    # j (wrapping around), which has the cofactor's sign built in.
+    following = [1, 2, 0]
+    after_following = [2, 0, 1]
+    rows_1 = matrix[..., following, :]
+    rows_2 = matrix[..., after_following, :]
+    np.subtract(
+        rows_1[..., following] * rows_2[..., after_following],
+        rows_1[..., after_following] * rows_2[..., following],
+        out=out,
+    )
+    determinant = np.sum(matrix[..., 0, :] * out[..., 0, :], axis=-1)[..., None, None]
+    np.divide(out, determinant, out=out, where=determinant != 0)
+    return out
+
+
+class CachedTransform:
+    """Object3D mixin caching the hierarchical model and normal matrices.
+
+    Assigning (or modifying) model_matrix, or moving the object to another
+    parent, marks it and every object below it as stale, and the matrices of
+    stale objects are recomputed the next time they're read. Objects below an
+    ancestor without the mixin can't tell when it changes, so their matrices are
+    recomputed on every read, as for a plain Object3D.
+
+    The normal matrix is the inverse-transpose of the model matrix, so unlike
+    with Object3D the normal_matrix attribute isn't used.
+    """
+
+    _parent = None
+    _model_matrix = None
+    _world_matrix_stale = True
+    _normal_matrix_stale = True
+    # Set while the object's matrices are kept in a TransformStore, which then
+    # takes care of the caching.
+    _transform_store = None
+
+    @property
+    def model_matrix(self):
+        return self._model_matrix
+
+    @model_matrix.setter
+    def model_matrix(self, matrix):
+        if self._model_matrix is None:
+            self._model_matrix = TrackedMatrix(matrix, self)
+            self._world_matrix = np.empty((4, 4))
+            self._world_normal_matrix = np.empty((3, 3))
+        else:
+            self._model_matrix.view(np.ndarray)[...] = matrix
+        self.invalidate_world_matrix()
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        self._parent = parent
+        if self._transform_store is not None:
+            self._transform_store.hierarchy_changed = True
+        self.invalidate_world_matrix()
+
+    def invalidate_world_matrix(self):
+        # Objects below a stale object are always stale as well, so there's no
+        # need to visit them again.
+        dfs = [self]
+        while dfs:
+            node = dfs.pop()
+            if isinstance(node, CachedTransform):
+                # Objects below an object in a store are either in the store as
+                # well or, like objects below a plain Object3D, always stale.
+                if node._transform_store is not None:
+                    node._transform_store.stale = True
+                    continue
+                if node._world_matrix_stale:
+                    continue
+                node._world_matrix_stale = True
+            dfs.extend(getattr(node, "children", ()))
+
+    def hierarchical_model_matrix(self):
+        if self._transform_store is not None:
+            return self._transform_store.world_matrix(self)
+        if self._world_matrix_stale:
+            parent = self._parent
+            if parent is None:
+                np.copyto(self._world_matrix, self._model_matrix)
+                self._world_matrix_stale = False
+            else:
+                np.matmul(
+                    parent.hierarchical_model_matrix(),
+                    self._model_matrix.view(np.ndarray),
+                    out=self._world_matrix,
+                )
+                self._world_matrix_stale = (
+                    not isinstance(parent, CachedTransform)
+                    or parent._world_matrix_stale
+                )
+            self._normal_matrix_stale = True
+        return self._world_matrix
+
+    def hierarchical_normal_matrix(self):
+        if self._transform_store is not None:
+            return self._transform_store.normal_matrix(self)
+        world_matrix = self.hierarchical_model_matrix()
+        if self._normal_matrix_stale:
+            inverse_transpose(world_matrix[:3, :3], self._world_normal_matrix)
+            self._normal_matrix_stale = self._world_matrix_stale
+        return self._world_normal_matrix
+
+
+class ThreeObject3D(CachedTransform, Object3D):
+    pass
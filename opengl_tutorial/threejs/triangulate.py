@@ -0,0 +1,243 @@
+import numpy as np
+
+# Planar shape utilities for building ExtrudeGeometries client-side: flattening
+# the quadratic Bézier subpaths manim produces, sorting them into shapes and
+# holes, and triangulating the result.
+
+
+def split_subpaths(points, path_indices):
+    # Points arrive flattened as in an ExtrudeGeometryRequest, i.e. as x, y, z
+    # triples, with path_indices holding the index of the first point of each
+    # subpath.
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))[:, :2]
+    bounds = list(path_indices) + [len(points)]
+    return [points[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def flatten_quadratic_path(path, divisions=12):
+    """Sample a path of [start, handle, end] Bézier triples like three.js does.
+
+    Each curve starts where the previous one ended and consecutive duplicate
+    points are dropped.
+    """
+    curves = path.reshape((-1, 3, 2))
+    start = np.concatenate([curves[:1, 0], curves[:-1, 2]])
+    handle = curves[:, 1]
+    end = curves[:, 2]
+
+    t = (np.arange(divisions + 1) / divisions)[None, :, None]
+    k = 1 - t
+    polyline = (
+        k * k * start[:, None]
+        + 2 * (1 - t) * t * handle[:, None]
+        + t * t * end[:, None]
+    ).reshape((-1, 2))
+
+    keep = np.ones(len(polyline), dtype=bool)
+    keep[1:] = np.any(polyline[1:] != polyline[:-1], axis=-1)
+    return polyline[keep]
+
+
+def remove_duplicate_end(polyline):
+    if len(polyline) > 2 and np.array_equal(polyline[-1], polyline[0]):
+        return polyline[:-1]
+    return polyline
+
+
+def points_in_polygon(points, polygon):
+    """Even-odd ray casting (pnpoly) for many points against one polygon."""
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 2))
+    x = points[:, 0, None]
+    y = points[:, 1, None]
+    xi, yi = polygon[:, 0], polygon[:, 1]
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crosses = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+    return np.count_nonzero(crosses, axis=-1) % 2 == 1
+
+
+def group_subpaths(subpaths):
+    """Sort subpaths into (shape, holes) pairs.
+
+    Like three-server, a subpath is a hole of the most recent shape when its
+    first point lies inside that shape's control polygon.
+    """
+    groups = []
+    for path in subpaths:
+        if groups and points_in_polygon(path[0], groups[-1][0])[0]:
+            groups[-1][1].append(path)
+        else:
+            groups.append((path, []))
+    return groups
+
+
+def signed_area(contour):
+    x, y = contour[:, 0], contour[:, 1]
+    return 0.5 * np.sum(np.roll(x, 1) * y - x * np.roll(y, 1))
+
+
+def cross(o, a, b):
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (
+        a[..., 1] - o[..., 1]
+    ) * (b[..., 0] - o[..., 0])
+
+
+def triangulate(contour, holes=()):
+    """Triangulate a polygon with holes by ear clipping.
+
+    Returns an (n, 3) array of counter-clockwise triangles indexing into the
+    contour followed by each of the holes.
+    """
+    vertices = np.concatenate([contour, *holes]) if holes else np.asarray(contour)
+    ring = np.arange(len(contour))
+    if signed_area(contour) < 0:
+        ring = ring[::-1]
+
+    offset = len(contour)
+    hole_rings = []
+    for hole in holes:
+        hole_ring = np.arange(offset, offset + len(hole))
+        if signed_area(hole) > 0:
+            hole_ring = hole_ring[::-1]
+        hole_rings.append(hole_ring)
+        offset += len(hole)
+
+    # Merge the holes into the outer ring from right to left, so that every
+    # bridge only has to cross already merged geometry.
+    hole_rings.sort(key=lambda r: -vertices[r, 0].max())
+    for hole_ring in hole_rings:
+        ring = bridge_hole(vertices, ring, hole_ring)
+    return clip_ears(vertices, ring)
+
+
+def bridge_hole(vertices, ring, hole_ring):
+    # Connect the hole's rightmost vertex m to a visible vertex of the ring and
+    # splice the hole in along the two-way bridge.
+    start = np.argmax(vertices[hole_ring, 0])
+    hole_ring = np.roll(hole_ring, -start)
+    m = vertices[hole_ring[0]]
+
+    a = vertices[ring]
+    b = np.roll(a, -1, axis=0)
+    crosses = (a[:, 1] > m[1]) != (b[:, 1] > m[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = a[:, 0] + (m[1] - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+    candidates = np.flatnonzero(crosses & (x >= m[0]))
+    if len(candidates) == 0:
+        # Malformed input (the hole isn't inside the contour), just connect it
+        # to the nearest vertex.
+        position = np.argmin(np.sum((a - m) ** 2, axis=-1))
+    else:
+        edge = candidates[np.argmin(x[candidates])]
+        intersection = np.array([x[edge], m[1]])
+        position = edge if a[edge, 0] > b[edge, 0] else (edge + 1) % len(ring)
+        p = a[position]
+
+        # If any vertex lies inside the triangle (m, intersection, p) it blocks
+        # the view of p, and the blocking vertex with the smallest angle to the
+        # ray is visible instead.
+        if not np.array_equal(intersection, p):
+            triangle = (m, intersection, p) if p[1] > m[1] else (m, p, intersection)
+            inside = (
+                (cross(triangle[0], triangle[1], a) >= 0)
+                & (cross(triangle[1], triangle[2], a) >= 0)
+                & (cross(triangle[2], triangle[0], a) >= 0)
+                & np.any(a != p, axis=-1)
+                & (a[:, 0] > m[0])
+            )
+            blocking = np.flatnonzero(inside)
+            if len(blocking) > 0:
+                delta = a[blocking] - m
+                tangent = np.abs(delta[:, 1]) / delta[:, 0]
+                order = np.lexsort((np.sum(delta**2, axis=-1), tangent))
+                position = blocking[order[0]]
+                p = a[position]
+
+        # A vertex can occur several times in the ring once other holes have
+        # been bridged to it, so pick the occurrence whose wedge contains m.
+        for occurrence in np.flatnonzero(np.all(a == p, axis=-1)):
+            previous = a[occurrence - 1]
+            following = a[(occurrence + 1) % len(ring)]
+            left_in = cross(previous, p, m) > 0
+            left_out = cross(p, following, m) > 0
+            if cross(previous, p, following) >= 0:
+                visible = left_in and left_out
+            else:
+                visible = left_in or left_out
+            if visible:
+                position = occurrence
+                break
+
+    return np.concatenate(
+        [
+            ring[: position + 1],
+            hole_ring,
+            hole_ring[:1],
+            ring[position:],
+        ]
+    )
+
+
+def clip_ears(vertices, ring):
+    # Rather than clipping one ear at a time, every vertex is tested at once and
+    # a set of non-adjacent ears is clipped per round. Clipping an ear only
+    # changes the triangles of its two neighbors, so the other ears stay valid.
+    points = vertices[ring]
+    nodes = np.arange(len(ring))
+    triangles = []
+    while len(nodes) > 3:
+        previous = np.roll(nodes, 1)
+        following = np.roll(nodes, -1)
+        a, b, c = points[previous], points[nodes], points[following]
+        turn = cross(a, b, c)
+
+        # Drop vertices at the same position as the previous one. Collinear
+        # vertices are kept, like earcut does, since the caps of a bevelled
+        # extrusion move them off the line.
+        repeated = np.flatnonzero(np.all(a == b, axis=-1))[: len(nodes) - 3]
+        if len(repeated) > 0:
+            nodes = np.delete(nodes, repeated)
+            continue
+
+        # Only reflex (or flat) vertices can lie inside an ear. Vertices sharing
+        # a position with a corner (the ends of hole bridges) don't count.
+        ears = turn > 0
+        reflex = points[nodes[turn <= 0]][None]
+        convex = np.flatnonzero(ears)
+        if len(convex) > 0 and reflex.shape[1] > 0:
+            a_, b_, c_ = a[convex, None], b[convex, None], c[convex, None]
+            inside = (
+                (cross(a_, b_, reflex) >= 0)
+                & (cross(b_, c_, reflex) >= 0)
+                & (cross(c_, a_, reflex) >= 0)
+                & np.any(reflex != a_, axis=-1)
+                & np.any(reflex != b_, axis=-1)
+                & np.any(reflex != c_, axis=-1)
+            )
+            ears[convex] = ~inside.any(axis=-1)
+
+        clipped = []
+        for node in np.flatnonzero(ears):
+            if len(clipped) == len(nodes) - 3:
+                break
+            if clipped and clipped[-1] == node - 1:
+                continue
+            if clipped and node == len(nodes) - 1 and clipped[0] == 0:
+                continue
+            clipped.append(node)
+
+        if not clipped:
+            # Malformed input, clip the most convex corner regardless of
+            # what's inside it.
+            clipped = [np.argmax(turn)]
+
+        triangles.append(
+            np.stack([previous[clipped], nodes[clipped], following[clipped]], axis=-1)
+        )
+        nodes = np.delete(nodes, clipped)
+
+    if len(nodes) == 3:
+        triangles.append(nodes[None])
+    if not triangles:
+        return np.empty((0, 3), dtype=np.int64)
+    return ring[np.concatenate(triangles)]
@@ -0,0 +1,175 @@
+import collections
+import functools
+import re
+
+import numpy as np
+
+from .shader_input import matmul_to_shader_buffer
+from .uniform_blocks import BLOCK_BINDINGS, get_uniform_blocks
+
+UploadInfo = collections.namedtuple("UploadInfo", ["performed", "skipped"])
+
+point_lights_pattern = re.compile(r"pointLights\[(\d+)\]\.(\w+)")
+
+
+def view_matrix_value(mesh, frame_state):
+    return frame_state.shader_view_matrix
+
+
+def projection_matrix_value(mesh, frame_state):
+    return frame_state.projection_matrix
+
+
+def model_view_matrix_value(out, mesh, frame_state):
+    return matmul_to_shader_buffer(
+        frame_state.view_matrix, mesh.hierarchical_model_matrix(), out
+    )
+
+
+def normal_matrix_value(out, mesh, frame_state):
+    return matmul_to_shader_buffer(
+        frame_state.view_matrix[:3, :3], mesh.hierarchical_normal_matrix(), out
+    )
+
+
+def is_orthographic_value(mesh, frame_state):
+    return frame_state.is_orthographic
+
+
+def ambient_light_color_value(mesh, frame_state):
+    return frame_state.ambient_light_color
+
+
+def point_light_value(index, field, mesh, frame_state):
+    # TODO: Warn if the shader can't contain all of the lights.
+    if len(frame_state.point_lights) <= index:
+        return None
+    return frame_state.point_lights[index][field]
+
+
+UNIFORM_SLOTS = {
+    "viewMatrix": view_matrix_value,
+    "projectionMatrix": projection_matrix_value,
+    "isOrthographic": is_orthographic_value,
+    "ambientLightColor": ambient_light_color_value,
+}
+
+# Uniforms which change with every mesh are computed into a float32 buffer of the
+# given shape, owned by the binder.
+MESH_MATRIX_SLOTS = {
+    "modelViewMatrix": (model_view_matrix_value, (4, 4)),
+    "normalMatrix": (normal_matrix_value, (3, 3)),
+}
+
+POINT_LIGHT_FIELDS = ("position", "color", "distance", "decay")
+
+PLAIN_TYPES = (tuple, float, int, bool)
+
+
+class UniformBinder:
+    """Sets the uniforms of a three.js program.
+
+    The program's uniforms are classified once, when it is linked, so binding a
+    mesh is a loop over prebuilt (uniform, value function) pairs rather than a
+    scan of every member of the program.
+
+    Programs declaring the blocks of uniform_blocks.py read the camera and
+    light uniforms from buffers shared by every program instead.
+
+    Every upload goes through a shadow copy of the program's uniforms, and
+    values equal (as float32) to the last ones uploaded are skipped.
+    """
+
+    def __init__(self, program):
+        from moderngl.program_members.uniform import Uniform
+        from moderngl.program_members.uniform_block import UniformBlock
+
+        self.program = program
+        self.setters = []
+        # Block name -> size, for the blocks of uniform_blocks.py.
+        self.block_sizes = {}
+        for name, member in program._members.items():
+            if isinstance(member, UniformBlock) and name in BLOCK_BINDINGS:
+                member.binding = BLOCK_BINDINGS[name]
+                self.block_sizes[name] = member.size
+                continue
+            if not isinstance(member, Uniform):
+                continue
+            if name in UNIFORM_SLOTS:
+                self.setters.append((name, member, UNIFORM_SLOTS[name]))
+                continue
+            if name in MESH_MATRIX_SLOTS:
+                value_function, shape = MESH_MATRIX_SLOTS[name]
+                out = np.empty(shape, dtype=np.float32)
+                self.setters.append(
+                    (name, member, functools.partial(value_function, out))
+                )
+                continue
+            point_lights_match = point_lights_pattern.fullmatch(name)
+            if (
+                point_lights_match is not None
+                and point_lights_match.group(2) in POINT_LIGHT_FIELDS
+            ):
+                index = int(point_lights_match.group(1))
+                field = point_lights_match.group(2)
+                self.setters.append(
+                    (name, member, functools.partial(point_light_value, index, field))
+                )
+
+        self.uploaded = {}
+        self.uploads_performed = 0
+        self.uploads_skipped = 0
+
+    def upload(self, name, uniform, value):
+        # name -> (last value, last value as float32 bytes). Values equal to the
+        # last one as Python objects are equal as float32 too, which saves the
+        # conversion for the tuples and scalars most uniforms are set with.
+        previous = self.uploaded.get(name)
+        if (
+            type(value) is np.ndarray
+            and value.dtype == np.float32
+            and value.flags.c_contiguous
+        ):
+            # Column-major float32 buffers (see shader_input.py) are compared
+            # and written as they are, without converting them to tuples.
+            data = memoryview(value).cast("B")
+            if previous is not None and data == previous[1]:
+                self.uploads_skipped += 1
+                return
+            uniform.write(data)
+            self.uploaded[name] = (None, value.tobytes())
+            self.uploads_performed += 1
+            return
+        if (
+            previous is not None
+            and type(value) in PLAIN_TYPES
+            and type(previous[0]) is type(value)
+            and previous[0] == value
+        ):
+            self.uploads_skipped += 1
+            return
+        data = np.asarray(value, dtype=np.float32).tobytes()
+        if previous is not None and previous[1] == data:
+            self.uploads_skipped += 1
+            self.uploaded[name] = (value, data)
+            return
+        uniform.value = value
+        self.uploaded[name] = (value, data)
+        self.uploads_performed += 1
+
+    def set_uniform(self, name, value):
+        # Like Shader.set_uniform, names the program doesn't use are ignored.
+        uniform = self.program.get(name, None)
+        if uniform is not None:
+            self.upload(name, uniform, value)
+
+    def bind(self, mesh, frame_state):
+        if self.block_sizes:
+            get_uniform_blocks(self.program.ctx).bind(frame_state, self.block_sizes)
+        for name, uniform, value_function in self.setters:
+            value = value_function(mesh, frame_state)
+            if value is not None:
+                self.upload(name, uniform, value)
+
+    def upload_info(self):
+        return UploadInfo(self.uploads_performed, self.uploads_skipped)
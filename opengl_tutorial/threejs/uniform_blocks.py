@@ -0,0 +1,165 @@
+import numpy as np
+
+# The camera and light uniforms of materials created with uniform_blocks=True
+# are read from std140 uniform blocks. The buffers backing them are written once
+# per frame and shared by every program, rather than each program having its
+# own copy set for every mesh.
+
+FRAME_BLOCK = "ThreeFrame"
+POINT_LIGHTS_BLOCK = "ThreePointLights"
+BLOCK_BINDINGS = {FRAME_BLOCK: 0, POINT_LIGHTS_BLOCK: 1}
+
+# The block members must be declared in the same order as the fields below.
+FRAME_BLOCK_SOURCE = f"""layout(std140) uniform {FRAME_BLOCK} {{
+\tmat4 viewMatrix;
+\tmat4 projectionMatrix;
+\tvec3 ambientLightColor;
+\tbool isOrthographic;
+}};"""
+FRAME_BLOCK_UNIFORMS = {
+    "uniform mat4 viewMatrix;",
+    "uniform mat4 projectionMatrix;",
+    "uniform vec3 ambientLightColor;",
+    "uniform bool isOrthographic;",
+}
+FRAME_BLOCK_DTYPE = np.dtype(
+    {
+        "names": [
+            "viewMatrix",
+            "projectionMatrix",
+            "ambientLightColor",
+            "isOrthographic",
+        ],
+        "formats": [("<f4", 16), ("<f4", 16), ("<f4", 3), "<i4"],
+        "offsets": [0, 64, 128, 140],
+        "itemsize": 144,
+    }
+)
+
+# three.js declares the PointLight struct itself, so only the array moves into a
+# block.
+POINT_LIGHTS_UNIFORM = "uniform PointLight pointLights[ NUM_POINT_LIGHTS ];"
+POINT_LIGHTS_BLOCK_SOURCE = f"""layout(std140) uniform {POINT_LIGHTS_BLOCK} {{
+\tPointLight pointLights[ NUM_POINT_LIGHTS ];
+}};"""
+# A vec3 is aligned to 16 bytes but only takes 12, so distance fits behind
+# color, and the struct is padded to a multiple of 16.
+POINT_LIGHT_DTYPE = np.dtype(
+    {
+        "names": ["position", "color", "distance", "decay"],
+        "formats": [("<f4", 3), ("<f4", 3), "<f4", "<f4"],
+        "offsets": [0, 16, 28, 32],
+        "itemsize": 48,
+    }
+)
+
+
+def declare_uniform_blocks(shader):
+    """Rewrite the camera and light uniforms three.js declares into the blocks
+    above.
+
+    Uniform blocks need GLSL 1.40 (or GLSL ES 3.00), so other shaders are
+    returned unchanged, as are shaders which don't declare viewMatrix, the first
+    uniform of three.js' prefix.
+    """
+    lines = shader.split("\n")
+    version = lines[0].split()
+    if len(version) < 2 or version[0] != "#version" or int(version[1]) < 140:
+        return shader
+    declarations = [" ".join(line.split()) for line in lines]
+    if "uniform mat4 viewMatrix;" not in declarations:
+        return shader
+
+    rewritten_lines = []
+    for line, declaration in zip(lines, declarations):
+        if declaration == "uniform mat4 viewMatrix;":
+            if FRAME_BLOCK_SOURCE not in rewritten_lines:
+                rewritten_lines.append(FRAME_BLOCK_SOURCE)
+        elif declaration in FRAME_BLOCK_UNIFORMS:
+            continue
+        elif declaration == POINT_LIGHTS_UNIFORM:
+            indent = line[: len(line) - len(line.lstrip())]
+            rewritten_lines.extend(
+                indent + block_line
+                for block_line in POINT_LIGHTS_BLOCK_SOURCE.split("\n")
+            )
+        else:
+            rewritten_lines.append(line)
+    return "\n".join(rewritten_lines)
+
+
+def frame_block_data(frame_state):
+    data = np.zeros(1, dtype=FRAME_BLOCK_DTYPE)
+    # Both matrices are already flattened in column-major order, as std140
+    # stores them.
+    data["viewMatrix"] = frame_state.shader_view_matrix.ravel()
+    data["projectionMatrix"] = frame_state.projection_matrix.ravel()
+    if frame_state.ambient_light_color is not None:
+        data["ambientLightColor"] = frame_state.ambient_light_color
+    data["isOrthographic"] = frame_state.is_orthographic
+    return data.tobytes()
+
+
+def point_lights_block_data(frame_state, size):
+    # Programs are compiled for a fixed number of lights. Lights missing from
+    # the scene are left black, and so contribute nothing.
+    count = max(size // POINT_LIGHT_DTYPE.itemsize, len(frame_state.point_lights))
+    data = np.zeros(count, dtype=POINT_LIGHT_DTYPE)
+    for light, point_light in zip(data, frame_state.point_lights):
+        for field in POINT_LIGHT_DTYPE.names:
+            light[field] = point_light[field]
+    return data.tobytes()
+
+
+BLOCK_DATA = {
+    FRAME_BLOCK: lambda frame_state, size: frame_block_data(frame_state),
+    POINT_LIGHTS_BLOCK: point_lights_block_data,
+}
+
+
+class UniformBlocks:
+    """The uniform buffers of a context, written once per frame."""
+
+    def __init__(self, context):
+        self.context = context
+        self.buffers = {}
+        self.frame_state = None
+        self.uploads = 0
+
+    def bind(self, frame_state, block_sizes):
+        """Make sure the buffers hold the values of frame_state and are large
+        enough for a program whose blocks have the given sizes."""
+        if frame_state is not self.frame_state:
+            self.frame_state = frame_state
+            names = set(self.buffers) | set(block_sizes)
+        else:
+            # Only a program with more lights than the ones before it in the
+            # frame needs a larger buffer.
+            names = [
+                name
+                for name, size in block_sizes.items()
+                if name not in self.buffers or self.buffers[name].size < size
+            ]
+        for name in names:
+            buffer = self.buffers.get(name)
+            size = max(block_sizes.get(name, 0), 0 if buffer is None else buffer.size)
+            data = BLOCK_DATA[name](frame_state, size)
+            if buffer is None or buffer.size < len(data):
+                if buffer is not None:
+                    buffer.release()
+                buffer = self.buffers[name] = self.context.buffer(
+                    reserve=len(data), dynamic=True
+                )
+            buffer.write(data)
+            buffer.bind_to_uniform_block(BLOCK_BINDINGS[name])
+            self.uploads += 1
+
+
+uniform_blocks_by_context = {}
+
+
+def get_uniform_blocks(context):
+    uniform_blocks = uniform_blocks_by_context.get(context)
+    if uniform_blocks is None:
+        uniform_blocks = uniform_blocks_by_context[context] = UniformBlocks(context)
+    return uniform_blocks
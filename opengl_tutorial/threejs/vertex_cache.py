@@ -0,0 +1,187 @@
+import collections
+
+import numpy as np
+
+# Triangle and vertex orderings which make better use of the GPU's post-transform
+# vertex cache. A vertex whose transformed value is still in the cache when it's
+# referenced again isn't run through the vertex shader a second time.
+
+VertexCacheStats = collections.namedtuple("VertexCacheStats", ["acmr", "atvr"])
+
+# The constants of Tom Forsyth's "Linear-Speed Vertex Cache Optimisation".
+CACHE_DECAY_POWER = 1.5
+LAST_TRIANGLE_SCORE = 0.75
+VALENCE_BOOST_SCALE = 2.0
+VALENCE_BOOST_POWER = 0.5
+
+
+def get_triangles(index, num_vertices):
+    if index is None or np.ndim(index) == 0 or len(index) == 0:
+        return np.arange(num_vertices - num_vertices % 3).reshape((-1, 3))
+    return np.asarray(index, dtype=np.intp).reshape((-1, 3))
+
+
+def analyze_vertex_cache(index, num_vertices, cache_size=16):
+    """Simulate a FIFO post-transform cache of cache_size vertices.
+
+    ACMR is the average number of cache misses (vertex shader invocations) per
+    triangle, 0.5 at best for a large regular mesh and 3 at worst. ATVR is the
+    number of misses per vertex used, 1 at best.
+    """
+    triangles = get_triangles(index, num_vertices)
+    if len(triangles) == 0:
+        return VertexCacheStats(0.0, 0.0)
+    # The time (in misses) at which each vertex last entered the cache.
+    entered = [-cache_size - 1] * num_vertices
+    misses = 0
+    for vertex in triangles.ravel().tolist():
+        if misses - entered[vertex] > cache_size:
+            entered[vertex] = misses
+            misses += 1
+    num_used = len(np.unique(triangles))
+    return VertexCacheStats(misses / len(triangles), misses / num_used)
+
+
+def optimize_vertex_cache(index, num_vertices, cache_size=16):
+    """Return the triangles of index reordered with Forsyth's algorithm.
+
+    Each vertex is scored by its position in a simulated LRU cache and by how
+    many triangles still use it, and the triangle with the highest total score
+    among those of the cached vertices is drawn next.
+    """
+    triangles = get_triangles(index, num_vertices)
+    num_triangles = len(triangles)
+    if num_triangles == 0:
+        return triangles.ravel()
+
+    cache_scores = [LAST_TRIANGLE_SCORE] * 3 + [
+        (1 - (position - 3) / (cache_size - 3)) ** CACHE_DECAY_POWER
+        for position in range(3, cache_size)
+    ]
+    valences = np.bincount(triangles.ravel(), minlength=num_vertices)
+    valence_scores = [0.0] + [
+        VALENCE_BOOST_SCALE * valence**-VALENCE_BOOST_POWER
+        for valence in range(1, valences.max() + 1)
+    ]
+
+    # The triangles which haven't been drawn yet, for each vertex.
+    vertex_triangles = [[] for _ in range(num_vertices)]
+    triangle_vertices = triangles.tolist()
+    for triangle, vertices in enumerate(triangle_vertices):
+        for vertex in vertices:
+            vertex_triangles[vertex].append(triangle)
+    cache_position = [-1] * num_vertices
+    vertex_scores = [valence_scores[valence] for valence in valences.tolist()]
+
+    drawn = bytearray(num_triangles)
+    order = []
+    cache = []
+    best = max(
+        range(num_triangles),
+        key=lambda t: sum(vertex_scores[v] for v in triangle_vertices[t]),
+    )
+    # When none of the cached vertices have triangles left, continue from the
+    # first triangle not drawn yet.
+    next_undrawn = 0
+    while True:
+        order.append(best)
+        drawn[best] = 1
+        vertices = triangle_vertices[best]
+        for vertex in vertices:
+            vertex_triangles[vertex].remove(best)
+
+        # A degenerate triangle repeats a vertex, which is only cached once.
+        new_vertices = list(dict.fromkeys(vertices))
+        cache = new_vertices + [vertex for vertex in cache if vertex not in vertices]
+        for vertex in cache[cache_size:]:
+            cache_position[vertex] = -1
+            vertex_scores[vertex] = valence_scores[len(vertex_triangles[vertex])]
+        del cache[cache_size:]
+        for position, vertex in enumerate(cache):
+            cache_position[vertex] = position
+            remaining = len(vertex_triangles[vertex])
+            vertex_scores[vertex] = (
+                cache_scores[position] + valence_scores[remaining] if remaining else 0
+            )
+
+        best = -1
+        best_score = -1.0
+        for vertex in cache:
+            for triangle in vertex_triangles[vertex]:
+                a, b, c = triangle_vertices[triangle]
+                score = vertex_scores[a] + vertex_scores[b] + vertex_scores[c]
+                if score > best_score:
+                    best = triangle
+                    best_score = score
+        if best < 0:
+            while next_undrawn < num_triangles and drawn[next_undrawn]:
+                next_undrawn += 1
+            if next_undrawn == num_triangles:
+                break
+            best = next_undrawn
+
+    return triangles[order].ravel()
+
+
+def optimize_overdraw(index, position, cache_size=16):
+    """Reorder the clusters of a cache optimized index to reduce overdraw.
+
+    The index is split into clusters where the cache starts over, i.e. at
+    triangles whose three vertices are all misses, so moving clusters around
+    hardly changes the cache's efficiency. Clusters facing away from the center
+    of the mesh are likely to occlude the others, so they're drawn first.
+    """
+    triangles = get_triangles(index, len(position))
+    if len(triangles) == 0:
+        return triangles.ravel()
+
+    entered = [-cache_size - 1] * len(position)
+    misses = 0
+    cluster_starts = []
+    for triangle, vertices in enumerate(triangles.tolist()):
+        triangle_misses = 0
+        for vertex in vertices:
+            if misses - entered[vertex] > cache_size:
+                entered[vertex] = misses
+                misses += 1
+                triangle_misses += 1
+        # The first triangle always starts a cluster, even if it's degenerate
+        # and can't have three misses.
+        if triangle == 0 or triangle_misses == 3:
+            cluster_starts.append(triangle)
+
+    corners = np.asarray(position, dtype=np.float64)[triangles]
+    # Area weighted normals and centroids.
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    areas = np.linalg.norm(normals, axis=-1)
+    centroids = corners.mean(axis=1)
+    mesh_centroid = np.sum(centroids * areas[:, None], axis=0) / max(areas.sum(), 1e-30)
+
+    cluster_normals = np.add.reduceat(normals, cluster_starts)
+    cluster_areas = np.add.reduceat(areas, cluster_starts)
+    cluster_centroids = (
+        np.add.reduceat(centroids * areas[:, None], cluster_starts)
+        / np.maximum(cluster_areas, 1e-30)[:, None]
+    )
+    cluster_normal_lengths = np.linalg.norm(cluster_normals, axis=-1)
+    keys = np.sum(
+        (cluster_centroids - mesh_centroid) * cluster_normals, axis=-1
+    ) / np.maximum(cluster_normal_lengths, 1e-30)
+
+    bounds = cluster_starts + [len(triangles)]
+    cluster_order = np.argsort(-keys, kind="stable")
+    return np.concatenate(
+        [triangles[bounds[i] : bounds[i + 1]] for i in cluster_order]
+    ).ravel()
+
+
+def optimize_vertex_fetch(attributes, index):
+    """Return (attributes, index) with the vertices in the order the index first
+    uses them, so that they're fetched from memory sequentially. Vertices the
+    index doesn't use are dropped."""
+    index = np.asarray(index).ravel()
+    used, first_use = np.unique(index, return_index=True)
+    order = used[np.argsort(first_use)]
+    remap = np.empty(len(attributes), dtype=np.intp)
+    remap[order] = np.arange(len(order))
+    return attributes[order], remap[index]
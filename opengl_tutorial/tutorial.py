@@ -10,6 +10,13 @@ import tutorial_utils
 from manim import *
 from manim.opengl import *
 from manim.renderer.opengl_renderer import OpenGLCamera
+from threejs import (
+    LODThreeMesh,
+    ThreeMesh,
+    ThreeObject3D,
+    TransformStore,
+    matrix_to_shader_buffer,
+)
 
 
 class GrpcAgain(Scene):
@@ -552,10 +559,13 @@ class ModelVisualization(Scene):
         translation_matrix = np.eye(4)
         rotation_matrix = np.eye(4)
         scale_matrix = np.eye(4)
+        model_buffer = np.empty((4, 4), dtype=np.float32)
 
         def update_mesh(mesh, dt):
             model_matrix = translation_matrix @ rotation_matrix @ scale_matrix
-            mesh.shader.shader_program["model"] = tuple(model_matrix.T.ravel())
+            mesh.shader.shader_program["model"].write(
+                matrix_to_shader_buffer(model_matrix, model_buffer)
+            )
 
         def translation_callback(sender, data):
             nonlocal translation_matrix
@@ -664,6 +674,7 @@ class UpdateMesh(Scene):
         self.add(mesh)
 
         t = 0.1
+        model_buffer = np.empty((4, 4), dtype=np.float32)
 
         def update_mesh(dt):
             nonlocal t
@@ -676,7 +687,9 @@ class UpdateMesh(Scene):
                 ]
             )
             t += dt
-            mesh.shader.set_uniform("model", tuple(transformation_matrix.T.ravel()))
+            mesh.shader.shader_program["model"].write(
+                matrix_to_shader_buffer(transformation_matrix, model_buffer)
+            )
 
         self.add_updater(update_mesh)
 
@@ -737,11 +750,14 @@ class ViewIntuitionVisualization(Scene):
         translation_matrix = camera_model
         rotation_matrix = np.eye(4)
         scale_matrix = np.eye(4)
+        view_buffer = np.empty((4, 4), dtype=np.float32)
 
         def update_mesh(mesh, dt):
             camera_model_matrix = translation_matrix @ rotation_matrix @ scale_matrix
             view_matrix = np.linalg.inv(camera_model_matrix)
-            mesh.shader.shader_program["view"] = tuple(view_matrix.T.ravel())
+            mesh.shader.shader_program["view"].write(
+                matrix_to_shader_buffer(view_matrix, view_buffer)
+            )
 
         def translation_callback(sender, data):
             nonlocal translation_matrix
@@ -821,40 +837,18 @@ class ViewVisualization(Scene):
             OpenGLLine(IN * z_radius, OUT * z_radius),
         )
 
-        def look_at_camera(mob):
-            tutorial_utils.look_at(mob, self.camera.get_position(), looking_axis="z")
-
-        # Add axis labels.
-        x_label_group = OpenGLVGroup()
-        x_label_group.model_matrix = opengl.translation_matrix(
-            x=self.grid_size + 0.3
-        ) @ opengl.scale_matrix(1.2)
-
-        y_label_group = OpenGLVGroup()
-        y_label_group.model_matrix = opengl.translation_matrix(
-            y=self.grid_size + 0.3
-        ) @ opengl.scale_matrix(1.2)
-
-        z_label_group = OpenGLVGroup()
-        z_label_group.model_matrix = opengl.translation_matrix(
-            z=z_radius + 0.3
-        ) @ opengl.scale_matrix(1.2)
-
-        x_label = OpenGLMathTex("x")
-        y_label = OpenGLMathTex("y")
-        z_label = OpenGLMathTex("z")
-
-        x_label_group.add(x_label, update_parent=True)
-        y_label_group.add(y_label, update_parent=True)
-        z_label_group.add(z_label, update_parent=True)
-
-        self.add_updater(lambda dt: look_at_camera(x_label))
-        self.add_updater(lambda dt: look_at_camera(y_label))
-        self.add_updater(lambda dt: look_at_camera(z_label))
-
-        self.add(x_label)
-        self.add(y_label)
-        self.add(z_label)
+        # Add axis labels. The labels are billboards, so they face the camera as
+        # it moves without any updaters.
+        for tex_string, position in [
+            ("x", RIGHT * (self.grid_size + 0.3)),
+            ("y", UP * (self.grid_size + 0.3)),
+            ("z", OUT * (z_radius + 0.3)),
+        ]:
+            label = tutorial_utils.get_label(self.renderer.context, tex_string)
+            label.model_matrix = opengl.translation_matrix(
+                *position
+            ) @ opengl.scale_matrix(1.2)
+            self.add(label)
 
         shader = Shader(self.renderer.context, name="default")
         shader.set_uniform("u_color", (1.0, 0.0, 0.0, 1.0))
@@ -893,7 +887,7 @@ class ViewVisualization(Scene):
         camera_body.model_matrix = (
             opengl.translation_matrix(z=0.5) @ camera_cone.model_matrix
         )
-        camera_mesh = Object3D(
+        camera_mesh = ThreeObject3D(
             camera_body,
             camera_cone,
         )
@@ -931,10 +925,10 @@ class ViewVisualization(Scene):
                     r, theta, phi + self.camera_rotation_speed
                 )
             )
-            tutorial_utils.look_at(rotating_camera, ORIGIN)
-
             self.camera_indicator.set_position(rotating_camera.get_position())
-            tutorial_utils.look_at(self.camera_indicator, ORIGIN)
+            tutorial_utils.look_at_many(
+                [rotating_camera, self.camera_indicator], ORIGIN
+            )
 
         self.add_updater(update_rotating_camera)
 
@@ -1086,19 +1080,29 @@ class ViewVisualization(Scene):
         )
         camera_frame.add(camera_button, update_parent=True)
 
-        def mouse_over_button(button):
-            if tutorial_utils.mouse_over_camera_frame_mob(self, button):
+        # The buttons are found under the mouse with one query per frame, and
+        # only restyled when the hovered button changes.
+        buttons = tutorial_utils.HitTestRegistry(self)
+        hovered_button = None
+
+        def highlight_hovered_button(dt):
+            nonlocal hovered_button
+            button = buttons.hovered()
+            if button is hovered_button:
+                return
+            if hovered_button is not None:
+                hovered_button.set_style(stroke_color=WHITE, fill_color=WHITE)
+            if button is not None:
                 button.set_style(stroke_color=YELLOW, fill_color=YELLOW)
-            else:
-                button.set_style(stroke_color=WHITE, fill_color=WHITE)
+            hovered_button = button
 
-        self.add_updater(lambda dt: mouse_over_button(camera_button))
+        self.add_updater(highlight_hovered_button)
+        self.mouse_press_callbacks.append(buttons.click)
 
         def click_camera_button():
-            if tutorial_utils.mouse_over_camera_frame_mob(self, camera_button):
-                self.pause_camera_rotation = not self.pause_camera_rotation
+            self.pause_camera_rotation = not self.pause_camera_rotation
 
-        self.mouse_press_callbacks.append(click_camera_button)
+        buttons.add(camera_button, on_click=click_camera_button)
 
         self.model_rotation_speed = 0.012
         self.pause_model_rotation = False
@@ -1147,13 +1151,11 @@ class ViewVisualization(Scene):
             @ model_button.model_matrix
         )
         camera_frame.add(model_button, update_parent=True)
-        self.add_updater(lambda dt: mouse_over_button(model_button))
 
         def click_model_button():
-            if tutorial_utils.mouse_over_camera_frame_mob(self, model_button):
-                self.pause_model_rotation = not self.pause_model_rotation
+            self.pause_model_rotation = not self.pause_model_rotation
 
-        self.mouse_press_callbacks.append(click_model_button)
+        buttons.add(model_button, on_click=click_model_button)
 
         self.interactive_embed()
         # self.wait(10)
@@ -1477,7 +1479,6 @@ class HierarchicalModelMatrices(Scene):
 
         def update_sun(mob, dt):
             sun.model_matrix = opengl.z_rotation_matrix(z=0.01) @ sun.model_matrix
-            sun.normal_matrix = opengl.z_rotation_matrix(z=0.01) @ sun.normal_matrix
 
         sun.add_updater(update_sun)
 
@@ -1488,13 +1489,102 @@ class HierarchicalModelMatrices(Scene):
                 @ opengl.translation_matrix(x=-5)
             )
             earth.model_matrix = rotation_about_axis @ earth.model_matrix
-            earth.normal_matrix = rotation_about_axis @ earth.normal_matrix
 
         earth.add_updater(update_earth)
 
         self.interactive_embed()
 
 
+class OrbitingBodies(Scene):
+    # HierarchicalModelMatrices with 10,000 bodies. The model matrices are kept
+    # in a TransformStore, so the orbits advance and the world matrices are
+    # computed with a few batched matmuls per frame.
+    num_planets = 100
+    moons_per_planet = 99
+
+    def construct(self):
+        self.point_lights.append(
+            {
+                "position": [0, 0, 0],
+                "color": [7, 7, 1],
+                "distance": 100,
+                "decay": 1,
+            }
+        )
+        self.ambient_light = {
+            "color": BLUE_B,
+            "intensity": 0.5,
+        }
+
+        sun = tutorial_utils.get_three_mesh(
+            self.renderer.context,
+            geometry_config={
+                "name": "SphereGeometry",
+                "width_segments": 18,
+                "height_segments": 18,
+            },
+            material_config={"name": "StandardMaterial", "emissive": (1, 1, 0)},
+        )
+        self.add(sun)
+
+        # Every moon shares a low-poly sphere and a material. The planets share
+        # a detailed sphere's levels of detail, and are only drawn in full when
+        # the camera is close to them.
+        geometry = tutorial_utils.get_geometry(
+            "SphereGeometry", {"width_segments": 6, "height_segments": 4}
+        )
+        planet_levels = tutorial_utils.get_geometry(
+            "SphereGeometry", {"width_segments": 32, "height_segments": 16}
+        ).get_lods()
+        material = tutorial_utils.get_material(
+            self.renderer.context, "PhongMaterial", {"diffuse": (0.3, 0.3, 1)}
+        )
+        bodies = []
+        orbit_speeds = []
+        for i in range(self.num_planets):
+            planet = LODThreeMesh(planet_levels, material=material)
+            planet.model_matrix = (
+                opengl.z_rotation_matrix(z=i * 2.4)
+                @ opengl.translation_matrix(x=3 + i * 0.1)
+                @ opengl.scale_matrix(0.1)
+            )
+            sun.add(planet)
+            bodies.append(planet)
+            orbit_speeds.append(0.5 / (1 + i * 0.1))
+            for j in range(self.moons_per_planet):
+                moon = ThreeMesh(material, geometry.attributes, indices=geometry.index)
+                moon.model_matrix = (
+                    opengl.z_rotation_matrix(z=j * 0.7)
+                    @ opengl.translation_matrix(x=2 + j * 0.05)
+                    @ opengl.scale_matrix(0.2)
+                )
+                planet.add(moon)
+                bodies.append(moon)
+                orbit_speeds.append(2 / (1 + j * 0.05))
+
+        store = TransformStore()
+        store.add(sun)
+        orbiting = store.indices(bodies)
+        orbit_speeds = np.array(orbit_speeds)
+        orbit_steps = np.zeros((len(bodies), 4, 4), dtype=np.float32)
+        orbit_steps[:, 2, 2] = orbit_steps[:, 3, 3] = 1
+
+        def update_orbits(dt):
+            # A rotation about the z axis for every body, applied in one matmul.
+            angles = orbit_speeds * dt
+            orbit_steps[:, 0, 0] = orbit_steps[:, 1, 1] = np.cos(angles)
+            orbit_steps[:, 1, 0] = np.sin(angles)
+            orbit_steps[:, 0, 1] = -orbit_steps[:, 1, 0]
+            store.model_matrices[orbiting] = np.matmul(
+                orbit_steps, store.model_matrices[orbiting]
+            )
+            store.invalidate()
+
+        self.add_updater(update_orbits)
+
+        self.interactive_embed()
+
+
 class Gallery(Scene):
     def construct(self):
         config["background_color"] = "#2A2A2A"
@@ -1565,6 +1655,7 @@ class Gallery(Scene):
                     },
                 )
                 self.remove(current_mesh)
+                current_mesh.shader.release()
                 self.add(new_mesh)
                 current_mesh = new_mesh
                 current_geometry_name = new_geometry_name
@@ -1647,9 +1738,9 @@ class Gallery(Scene):
         scale_matrix = np.eye(4)
 
         def update_mesh(dt):
-            model_matrix = translation_matrix @ rotation_matrix @ scale_matrix
-            current_mesh.model_matrix = model_matrix
-            current_mesh.normal_matrix = model_matrix
+            current_mesh.model_matrix = (
+                translation_matrix @ rotation_matrix @ scale_matrix
+            )
 
         def translation_callback(sender, data):
             nonlocal translation_matrix
@@ -1695,6 +1786,18 @@ class Gallery(Scene):
 
         self.add_updater(update_mesh)
 
+        # Clicking on the mesh moves the light just in front of the clicked point.
+        def move_light_to_mouse():
+            ray_origin, ray_direction = tutorial_utils.get_mouse_ray(self)
+            hit = tutorial_utils.pick([current_mesh], ray_origin, ray_direction)
+            if hit is None:
+                return
+            light_position = hit.point - ray_direction
+            self.point_lights[0]["position"] = list(light_position)
+            self.light_indicator.model_matrix[:3, 3] = light_position
+
+        self.mouse_press_callbacks.append(move_light_to_mouse)
+
         self.interactive_embed()
 
 
@@ -1730,63 +1833,64 @@ class ThreeDLogo(Scene):
             points[i : i + path.shape[0]] = path
             i += path.shape[0]
 
-        extrude = tutorial_utils.get_three_mesh(
-            self.renderer.context,
-            geometry_config={
-                "name": "ExtrudeGeometry",
-                "points": points.ravel(),
-                "path_indices": path_indices,
-                "depth": 0.7,
-            },
-            material_config={
-                "name": "PhongMaterial",
-                "diffuse": (0.09, 0.09, 0.09),
-            },
-        )
-        extrude.model_matrix = opengl.translation_matrix(x=-1) @ extrude.model_matrix
-
         circle_diffuse = np.array([95, 165, 95]) / 255
         square_diffuse = np.array([55, 55, 125]) / 255
         triangle_diffuse = np.array([180, 80, 30]) / 255
 
-        circle = tutorial_utils.get_three_mesh(
+        extrude, circle, square, triangle = tutorial_utils.get_three_meshes(
             self.renderer.context,
-            geometry_config={
-                "name": "SphereGeometry",
-                "width_segments": 30,
-                "height_segments": 30,
-            },
-            material_config={"name": "StandardMaterial", "diffuse": circle_diffuse},
+            [
+                (
+                    {
+                        "name": "ExtrudeGeometry",
+                        "points": points.ravel(),
+                        "path_indices": path_indices,
+                        "depth": 0.7,
+                    },
+                    {
+                        "name": "PhongMaterial",
+                        "diffuse": (0.09, 0.09, 0.09),
+                    },
+                ),
+                (
+                    {
+                        "name": "SphereGeometry",
+                        "width_segments": 30,
+                        "height_segments": 30,
+                    },
+                    {"name": "StandardMaterial", "diffuse": circle_diffuse},
+                ),
+                (
+                    {
+                        "name": "BoxGeometry",
+                    },
+                    {"name": "StandardMaterial", "diffuse": square_diffuse},
+                ),
+                (
+                    {
+                        "name": "ConeGeometry",
+                        "height": 0.75,
+                        "radius": 0.45,
+                        "radial_segments": 60,
+                    },
+                    {"name": "StandardMaterial", "diffuse": triangle_diffuse},
+                ),
+            ],
         )
+        extrude.model_matrix = opengl.translation_matrix(x=-1) @ extrude.model_matrix
+
         circle.model_matrix = (
             opengl.translation_matrix(x=0.5, y=-2, z=-1.35)
             @ opengl.scale_matrix(scale_factor=1.25)
             @ circle.model_matrix
         )
 
-        square = tutorial_utils.get_three_mesh(
-            self.renderer.context,
-            geometry_config={
-                "name": "BoxGeometry",
-            },
-            material_config={"name": "StandardMaterial", "diffuse": square_diffuse},
-        )
         square.model_matrix = (
             opengl.translation_matrix(x=1.7, y=-0.8, z=-4)
             @ opengl.scale_matrix(scale_factor=2.4)
             @ square.model_matrix
         )
 
-        triangle = tutorial_utils.get_three_mesh(
-            self.renderer.context,
-            geometry_config={
-                "name": "ConeGeometry",
-                "height": 0.75,
-                "radius": 0.45,
-                "radial_segments": 60,
-            },
-            material_config={"name": "StandardMaterial", "diffuse": triangle_diffuse},
-        )
         triangle.model_matrix = (
             opengl.translation_matrix(x=2.9, y=-1.7, z=-6.2)
             @ opengl.scale_matrix(scale_factor=2.4)
@@ -1848,7 +1952,7 @@ class ThreeDLogo(Scene):
         #     ]
         # )
 
-        logo = Object3D()
+        logo = ThreeObject3D()
         logo.add(extrude)
         logo.add(circle)
         logo.add(square)
@@ -1,3 +1,9 @@
+import collections
+import concurrent.futures
+import os
+import queue
+from pathlib import Path
+
 import grpc
 
 import manim.utils.opengl as opengl
@@ -13,6 +19,20 @@ channel = grpc.insecure_channel(
 )
 geometry_stub = threejs_pb2_grpc.GeometryServiceStub(channel)
 material_stub = threejs_pb2_grpc.MaterialServiceStub(channel)
+# Ask the server for GeometryResponses in the packed binary encoding.
+geometry_metadata = (("geometry-encoding", "packed"),)
+# Set to "local" to generate the geometries which have a NumPy implementation
+# in-process rather than requesting them from three-server.
+geometry_source = os.environ.get("THREE_GEOMETRY_SOURCE", "server")
+# Set to "1" to read the camera and light uniforms of materials from uniform
+# blocks, which are uploaded once per frame.
+uniform_blocks = os.environ.get("THREE_UNIFORM_BLOCKS", "0") == "1"
+# Set to "1" to weld the duplicate vertices of fetched and generated geometries
+# and store their indices in the narrowest type, before they're cached.
+compact_geometries = os.environ.get("THREE_COMPACT_GEOMETRIES", "0") == "1"
+# Set to "1" to reorder the triangles and vertices of fetched and generated
+# geometries for the vertex cache, before they're cached.
+optimize_geometries = os.environ.get("THREE_OPTIMIZE_GEOMETRIES", "0") == "1"
 
 
 def grpc_again():
@@ -22,33 +42,249 @@ def grpc_again():
     print(geometry_response.response)
 
 
-def get_geometry(name, config=None, wireframe=False):
+# Bump when three-server or the local generators change the geometry they return
+# for the same request, so that geometries cached on disk before are replaced.
+GEOMETRY_OUTPUT_VERSION = 2
+
+geometry_cache = GeometryCache(maxsize=128)
+# Entries are stamped with the compiled service definition, the output version
+# and the flags prepare_geometry() applies before they're written, so that
+# changes to any of them invalidate them.
+disk_geometry_cache = DiskGeometryCache(
+    Path(__file__).parent / ".geometry_cache",
+    max_bytes=256 * 1024 * 1024,
+    version=b"\0".join(
+        [
+            threejs_pb2.DESCRIPTOR.serialized_pb,
+            b"output %d" % GEOMETRY_OUTPUT_VERSION,
+            b"compact %d" % compact_geometries,
+            b"optimize %d" % optimize_geometries,
+        ]
+    ),
+)
+
+
+def get_geometry_request(name, config=None, wireframe=False):
     if config is None:
         config = {}
-    geometry_response = getattr(geometry_stub, f"{name}")(
-        getattr(threejs_pb2, f"{name}Request")(**config, wireframe=wireframe)
-    )
-    geometry = Geometry(
-        geometry_response.position,
-        geometry_response.normal,
-        geometry_response.index,
-    )
+    request = getattr(threejs_pb2, f"{name}Request")(**config, wireframe=wireframe)
+    # Fill in the defaults the server would use so that equivalent requests
+    # serialize identically.
+    for field, default in GEOMETRY_DEFAULTS.get(name, {}).items():
+        if not getattr(request, field):
+            setattr(request, field, default)
+    return request
+
+
+def get_geometry_cache_key(name, request):
+    return (name, request.SerializeToString(deterministic=True))
+
+
+# Maps geometry names to their field in the GeometryRequest oneof.
+geometry_request_fields = {
+    field.message_type.name[: -len("Request")]: field.name
+    for field in threejs_pb2.GeometryRequest.DESCRIPTOR.fields
+}
+
+
+def get_cached_geometry(cache_key):
+    geometry = geometry_cache.get(cache_key)
+    if geometry is None:
+        geometry = disk_geometry_cache.get(cache_key)
+        if geometry is not None:
+            geometry_cache.put(cache_key, geometry)
     return geometry
 
 
-def get_material(context, name, config=None):
+def prepare_geometry(geometry):
+    if compact_geometries:
+        geometry = geometry.compact()
+    if optimize_geometries:
+        geometry = geometry.optimize()
+    return geometry
+
+
+def cache_geometry(cache_key, geometry):
+    geometry = prepare_geometry(geometry)
+    disk_geometry_cache.put(cache_key, geometry)
+    return geometry_cache.put(cache_key, geometry)
+
+
+def get_local_geometry(name, request, cache_key):
+    # Local geometries are cheap to regenerate, so they're only kept in memory.
+    if geometry_source == "local" and name in LOCAL_GEOMETRY_GENERATORS:
+        return geometry_cache.put(
+            cache_key, prepare_geometry(generate_geometry(name, request))
+        )
+    return None
+
+
+# Futures for geometries which have been requested but haven't arrived yet.
+pending_geometries = {}
+
+
+def resolve_future(future, fn, call):
+    # Complete a concurrent.futures.Future from a finished gRPC call.
+    try:
+        future.set_result(fn(call.result()))
+    except Exception as e:
+        future.set_exception(e)
+
+
+def get_geometry_async(name, config=None, wireframe=False):
+    """Request a geometry without blocking. Returns a concurrent.futures.Future
+    which resolves to the Geometry."""
+    request = get_geometry_request(name, config, wireframe)
+    cache_key = get_geometry_cache_key(name, request)
+    if cache_key in pending_geometries:
+        return pending_geometries[cache_key]
+
+    future = concurrent.futures.Future()
+    geometry = get_cached_geometry(cache_key)
+    if geometry is None:
+        geometry = get_local_geometry(name, request, cache_key)
+    if geometry is not None:
+        future.set_result(geometry)
+        return future
+
+    def on_response(geometry_response):
+        return cache_geometry(cache_key, Geometry.from_response(geometry_response))
+
+    pending_geometries[cache_key] = future
+    future.add_done_callback(lambda _: pending_geometries.pop(cache_key, None))
+    call = getattr(geometry_stub, f"{name}").future(request, metadata=geometry_metadata)
+    call.add_done_callback(lambda call: resolve_future(future, on_response, call))
+    return future
+
+
+def get_geometry(name, config=None, wireframe=False):
+    return get_geometry_async(name, config, wireframe).result()
+
+
+def get_geometries_async(requests, wireframe=False):
+    """Request a list of (name, config) geometries in a single round trip without
+    blocking. Returns a concurrent.futures.Future which resolves to the list of
+    Geometries.
+
+    Geometries which are already cached aren't requested again, and duplicate
+    requests are only sent once.
+    """
+    cache_keys = []
+    geometries = {}
+    uncached_requests = {}
+    for name, config in requests:
+        request = get_geometry_request(name, config, wireframe)
+        cache_key = get_geometry_cache_key(name, request)
+        cache_keys.append(cache_key)
+        if cache_key in geometries or cache_key in uncached_requests:
+            continue
+        geometry = get_cached_geometry(cache_key)
+        if geometry is None:
+            geometry = get_local_geometry(name, request, cache_key)
+        if geometry is not None:
+            geometries[cache_key] = geometry
+        else:
+            uncached_requests[cache_key] = threejs_pb2.GeometryRequest(
+                **{geometry_request_fields[name]: request}
+            )
+
+    future = concurrent.futures.Future()
+    if not uncached_requests:
+        future.set_result([geometries[cache_key] for cache_key in cache_keys])
+        return future
+
+    def on_response(batch_response):
+        for cache_key, geometry_response in zip(
+            uncached_requests, batch_response.responses
+        ):
+            geometries[cache_key] = cache_geometry(
+                cache_key, Geometry.from_response(geometry_response)
+            )
+        return [geometries[cache_key] for cache_key in cache_keys]
+
+    call = geometry_stub.BatchGeometry.future(
+        threejs_pb2.BatchGeometryRequest(requests=uncached_requests.values()),
+        metadata=geometry_metadata,
+    )
+    call.add_done_callback(lambda call: resolve_future(future, on_response, call))
+    return future
+
+
+def get_geometries(requests, wireframe=False):
+    return get_geometries_async(requests, wireframe).result()
+
+
+# Shader sources only depend on the material name, so each one is requested once.
+material_response_futures = {}
+
+
+def get_material_response_future(name):
+    future = material_response_futures.get(name)
+    if future is None:
+        future = getattr(material_stub, f"{name}").future(
+            getattr(threejs_pb2, f"{name}Request")()
+        )
+        material_response_futures[name] = future
+
+        def forget_failed_request(future):
+            if future.code() != grpc.StatusCode.OK:
+                material_response_futures.pop(name, None)
+
+        future.add_done_callback(forget_failed_request)
+    return future
+
+
+class MaterialFuture:
+    """A material whose shader sources are being fetched in the background.
+
+    The program is compiled by the first call to result(), on the calling thread,
+    since that's the thread which owns the OpenGL context.
+    """
+
+    def __init__(self, context, name, config, response_future):
+        self.context = context
+        self.name = name
+        self.config = config
+        self.response_future = response_future
+        self.material = None
+
+    def done(self):
+        return self.response_future.done()
+
+    def add_done_callback(self, fn):
+        self.response_future.add_done_callback(lambda _: fn(self))
+
+    def result(self, timeout=None):
+        if self.material is None:
+            material_response = self.response_future.result(timeout)
+            self.material = getattr(threejs, self.name)(
+                self.context,
+                material_response.vertex_shader,
+                material_response.fragment_shader,
+                self.config,
+                uniform_blocks=uniform_blocks,
+            )
+        return self.material
+
+
+def get_material_async(context, name, config=None):
     if config is None:
         config = {}
-    material_response = getattr(material_stub, f"{name}")(
-        getattr(threejs_pb2, f"{name}Request")()
-    )
-    material = getattr(threejs, name)(
-        context,
-        material_response.vertex_shader,
-        material_response.fragment_shader,
-        config,
-    )
-    return material
+    return MaterialFuture(context, name, config, get_material_response_future(name))
+
+
+def get_material(context, name, config=None):
+    return get_material_async(context, name, config).result()
+
+
+def as_completed(futures):
+    """Yield futures (gRPC, concurrent.futures or MaterialFutures) as they
+    finish."""
+    finished = queue.Queue()
+    for future in futures:
+        future.add_done_callback(finished.put)
+    for _ in range(len(futures)):
+        yield finished.get()
 
 
 def get_three_mesh(context, geometry_config=None, material_config=None):
@@ -58,199 +294,144 @@ def get_three_mesh(context, geometry_config=None, material_config=None):
     del material_config["name"]
     geometry = get_geometry(geometry_name, config=geometry_config)
     material = get_material(context, material_name, config=material_config)
-    return ThreeMesh(material, geometry.attributes, indices=geometry.index)
-
+    return ThreeMesh(geometry=geometry, material=material)
+
+
+def get_three_meshes(context, mesh_configs):
+    """Like get_three_mesh, but for a list of (geometry_config, material_config)
+    pairs. All of the requests are sent up front, with the geometries in a single
+    round trip, and each material is compiled as soon as its sources arrive."""
+    geometries_future = get_geometries_async(
+        [
+            (
+                geometry_config["name"],
+                {k: v for k, v in geometry_config.items() if k != "name"},
+            )
+            for geometry_config, _ in mesh_configs
+        ]
+    )
+    material_futures = [
+        get_material_async(
+            context,
+            material_config["name"],
+            config={k: v for k, v in material_config.items() if k != "name"},
+        )
+        for _, material_config in mesh_configs
+    ]
+    for material_future in as_completed(material_futures):
+        material_future.result()
 
-def get_2d_box(width, height, material, radius):
-    height_geometry = get_geometry(
-        "CylinderGeometry",
-        {
-            "radius_top": radius,
-            "radius_bottom": radius,
-            "height": width,
-        },
-    )
-    width_geometry = get_geometry(
-        "CylinderGeometry",
-        {
-            "radius_top": radius,
-            "radius_bottom": radius,
-            "height": height,
-        },
-    )
+    return [
+        ThreeMesh(geometry=geometry, material=material_future.result())
+        for geometry, material_future in zip(
+            geometries_future.result(), material_futures
+        )
+    ]
 
-    line = Mesh(geometry=width_geometry, material=material)
-    line2 = Mesh(geometry=width_geometry, material=material)
-    line3 = Mesh(geometry=height_geometry, material=material)
-    line4 = Mesh(geometry=height_geometry, material=material)
 
-    line.model_matrix = opengl.translation_matrix(x=width / 2) @ line.model_matrix
-    line2.model_matrix = opengl.translation_matrix(x=-width / 2) @ line2.model_matrix
-    line3.model_matrix = (
-        opengl.translation_matrix(y=height / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ line3.model_matrix
-    )
-    line4.model_matrix = (
-        opengl.translation_matrix(y=-height / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ line4.model_matrix
+def get_label(context, tex_string, material_config=None):
+    """A ThreeMesh of the glyphs of an OpenGLMathTex, centered on its origin.
+
+    The material is a billboard, so the label faces the camera without having to
+    be reoriented when the camera moves.
+    """
+    if material_config is None:
+        material_config = {"name": "BasicMaterial"}
+    points = []
+    path_indices = []
+    num_points = 0
+    for mob in OpenGLMathTex(tex_string).family_members_with_points():
+        for path in mob.get_subpaths():
+            path_indices.append(num_points)
+            points.append(path)
+            num_points += len(path)
+    return get_three_mesh(
+        context,
+        geometry_config={
+            "name": "ExtrudeGeometry",
+            "points": np.concatenate(points).ravel(),
+            "path_indices": path_indices,
+            "depth": 0.01,
+        },
+        material_config={**material_config, "billboard": True},
     )
 
-    line3.normal_matrix = opengl.rotation_matrix(z=PI / 2) @ line3.normal_matrix
-    line4.normal_matrix = opengl.rotation_matrix(z=PI / 2) @ line4.normal_matrix
 
-    return Object3D(line, line2, line3, line4)
+# Rotations taking the y axis, along which three.js' cylinders lie, to each axis.
+EDGE_ROTATIONS = {
+    "x": opengl.rotation_matrix(z=PI / 2),
+    "y": np.eye(4),
+    "z": opengl.rotation_matrix(x=PI / 2),
+}
 
 
-def get_3d_box(width, height, depth, material, radius):
-    # Top.
-    manim_space_top = get_2d_box(width, depth, material, radius)
-    manim_space_top.model_matrix = (
-        opengl.translation_matrix(y=height / 2)
-        @ opengl.rotation_matrix(x=PI / 2)
-        @ manim_space_top.model_matrix
-    )
-    manim_space_top.normal_matrix = (
-        opengl.translation_matrix(y=height / 2)
-        @ opengl.rotation_matrix(x=PI / 2)
-        @ manim_space_top.normal_matrix
+def get_edge_geometry(radius):
+    # A cylinder of length 1, which is scaled to the length of each edge.
+    return get_geometry(
+        "CylinderGeometry",
+        {"radius_top": radius, "radius_bottom": radius, "height": 1},
     )
 
-    # Bottom.
-    manim_space_bottom = get_2d_box(width, depth, material, radius)
-    manim_space_bottom.model_matrix = (
-        opengl.translation_matrix(y=-height / 2)
-        @ opengl.rotation_matrix(x=PI / 2)
-        @ manim_space_bottom.model_matrix
-    )
-    manim_space_bottom.normal_matrix = (
-        opengl.translation_matrix(y=-height / 2)
-        @ opengl.rotation_matrix(x=PI / 2)
-        @ manim_space_bottom.normal_matrix
-    )
 
-    # Front.
-    manim_space_front = get_2d_box(width, height, material, radius)
-    manim_space_front.model_matrix = (
-        opengl.translation_matrix(z=depth / 2) @ manim_space_front.model_matrix
-    )
-    manim_space_front.normal_matrix = (
-        opengl.translation_matrix(z=depth / 2) @ manim_space_front.normal_matrix
+def get_edge_matrix(center, axis, length):
+    return (
+        opengl.translation_matrix(*center)
+        @ EDGE_ROTATIONS[axis]
+        @ np.diag([1, length, 1, 1])
     )
 
-    # Back.
-    manim_space_back = get_2d_box(width, height, material, radius)
-    manim_space_back.model_matrix = (
-        opengl.translation_matrix(z=-depth / 2) @ manim_space_back.model_matrix
-    )
-    manim_space_back.normal_matrix = (
-        opengl.translation_matrix(z=-depth / 2) @ manim_space_back.normal_matrix
-    )
 
-    return Object3D(
-        manim_space_top,
-        manim_space_bottom,
-        manim_space_front,
-        manim_space_back,
+def get_2d_box(width, height, material, radius):
+    """The edges of a width by height rectangle in the xy plane, drawn in a
+    single call. The material has to be created with instancing."""
+    return InstancedThreeMesh(
+        [get_edge_matrix((x * width / 2, 0, 0), "y", height) for x in (1, -1)]
+        + [get_edge_matrix((0, y * height / 2, 0), "x", width) for y in (1, -1)],
+        geometry=get_edge_geometry(radius),
+        material=material,
     )
 
 
-def get_axes(context, length):
-    # x axis.
-    x_axis_material = get_material(
-        context,
-        "PhongMaterial",
-        {
-            "diffuse": [1.0, 0, 0],
-            "emissive": [0, 0, 0],
-            "specular": [1 / 3.0, 1 / 3.0, 1 / 3.0],
-            "shininess": 5.0,
-            "opacity": 1,
-        },
-    )
-    x_axis = Mesh(
-        geometry=get_geometry(
-            "CylinderGeometry",
-            {
-                "radius_top": 0.05,
-                "radius_bottom": 0.05,
-                "height": length,
-            },
-        ),
-        material=x_axis_material,
-    )
-    x_axis.model_matrix = (
-        opengl.translation_matrix(x=length / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ x_axis.model_matrix
+def get_3d_box(width, height, depth, material, radius):
+    """The 12 edges of a width by height by depth box, drawn in a single call.
+    The material has to be created with instancing."""
+    matrices = []
+    for a in (1, -1):
+        for b in (1, -1):
+            matrices += [
+                get_edge_matrix((0, a * height / 2, b * depth / 2), "x", width),
+                get_edge_matrix((a * width / 2, 0, b * depth / 2), "y", height),
+                get_edge_matrix((a * width / 2, b * height / 2, 0), "z", depth),
+            ]
+    return InstancedThreeMesh(
+        matrices, geometry=get_edge_geometry(radius), material=material
     )
-    x_axis.normal_matrix = opengl.rotation_matrix(z=PI / 2) @ x_axis.normal_matrix
 
-    # y axis.
-    y_axis_material = get_material(
-        context,
-        "PhongMaterial",
-        {
-            "diffuse": [0, 1.0, 0],
-            "emissive": [0, 0, 0],
-            "specular": [1 / 3.0, 1 / 3.0, 1 / 3.0],
-            "shininess": 5.0,
-            "opacity": 1,
-        },
-    )
-    y_axis = Mesh(
-        geometry=get_geometry(
-            "CylinderGeometry",
-            {
-                "radius_top": 0.05,
-                "radius_bottom": 0.05,
-                "height": length,
-            },
-        ),
-        material=y_axis_material,
-    )
-    y_axis.model_matrix = (
-        opengl.rotation_matrix(z=PI / 2)
-        @ opengl.translation_matrix(x=length / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ y_axis.model_matrix
-    )
-    y_axis.normal_matrix = opengl.rotation_matrix(z=PI / 2) @ y_axis.normal_matrix
 
-    # z axis.
-    z_axis_material = get_material(
+def get_axes(context, length):
+    # The axes share a material, and each is colored by its instance color.
+    material = get_material(
         context,
         "PhongMaterial",
         {
-            "diffuse": [0, 0, 1.0],
+            "diffuse": [1.0, 1.0, 1.0],
             "emissive": [0, 0, 0],
             "specular": [1 / 3.0, 1 / 3.0, 1 / 3.0],
             "shininess": 5.0,
             "opacity": 1,
+            "instance_colors": True,
         },
     )
-    z_axis = Mesh(
-        geometry=get_geometry(
-            "CylinderGeometry",
-            {
-                "radius_top": 0.05,
-                "radius_bottom": 0.05,
-                "height": length,
-            },
-        ),
-        material=z_axis_material,
-    )
-    z_axis.model_matrix = (
-        opengl.rotation_matrix(x=PI / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ opengl.translation_matrix(x=length / 2)
-        @ opengl.rotation_matrix(z=PI / 2)
-        @ z_axis.model_matrix
+    return InstancedThreeMesh(
+        [
+            get_edge_matrix((length / 2, 0, 0), "x", length),
+            get_edge_matrix((0, length / 2, 0), "y", length),
+            get_edge_matrix((0, 0, length / 2), "z", length),
+        ],
+        geometry=get_edge_geometry(0.05),
+        material=material,
+        instance_colors=[[1.0, 0, 0], [0, 1.0, 0], [0, 0, 1.0]],
     )
-    z_axis.normal_matrix = opengl.rotation_matrix(z=PI / 2) @ z_axis.normal_matrix
-
-    return Object3D(x_axis, y_axis, z_axis)
 
 
 def get_camera(context):
@@ -267,80 +448,126 @@ def get_camera(context):
             "opacity": 1,
         },
     )
-    camera_body = ThreeMesh(
-        geometry=get_geometry("BoxGeometry", {"width": camera_width}),
-        material=phong_material,
-    )
-    camera_lens = ThreeMesh(
-        geometry=get_geometry("ConeGeometry", {"radius": 0.5, "height": lens_height}),
-        material=phong_material,
+    body_geometry, lens_geometry = get_geometries(
+        [
+            ("BoxGeometry", {"width": camera_width}),
+            ("ConeGeometry", {"radius": 0.5, "height": lens_height}),
+        ]
     )
+    camera_body = ThreeMesh(geometry=body_geometry, material=phong_material)
+    camera_lens = ThreeMesh(geometry=lens_geometry, material=phong_material)
     camera_lens.model_matrix = (
         opengl.translation_matrix(x=camera_width / 2 + lens_height / 2)
         @ opengl.rotation_matrix(z=PI / 2)
         @ camera_lens.model_matrix
     )
-    return Object3D(camera_body, camera_lens)
+    return ThreeObject3D(camera_body, camera_lens)
 
 
-def look_at(camera, target, up_vector=OUT, looking_axis="-z"):
-    # Rotate the camera so that it points toward the target.
+def look_at_matrices(model_matrices, targets, up_vector=OUT, looking_axis="-z"):
+    """Return copies of the (n, 4, 4) model matrices rotated in place so that
+    their looking axis points toward the targets and their y axis is as close to
+    up_vector as possible, along with the (n, 3, 3) rotations which were applied.
+
+    The basis is built directly from the forward, up and right vectors, and the
+    scale along each axis is kept.
+    """
     if looking_axis == "-z":
-        camera_front_dir = -camera.model_matrix[:3, 2]
+        sign = -1
     elif looking_axis == "z":
-        camera_front_dir = camera.model_matrix[:3, 2]
+        sign = 1
     else:
         raise RuntimeError(f"Unknown looking axis {looking_axis}")
 
-    camera_to_target = normalize(target - camera.model_matrix[:, 3][:3])
-    rotation_axis = np.cross(camera_to_target, camera_front_dir)
-    angle = 2 * np.arctan2(
-        np.linalg.norm(camera_to_target - normalize(camera_front_dir)),
-        np.linalg.norm(camera_to_target + normalize(camera_front_dir)),
-    )
-    rotation_matrix = space_ops.rotation_matrix(
-        -angle,
-        rotation_axis,
-        homogeneous=True,
-    )
+    model_matrices = np.array(model_matrices, dtype=np.float64)
+    positions = model_matrices[:, :3, 3]
+    axes = model_matrices[:, :3, :3]
+    scales = np.sqrt(np.sum(axes * axes, axis=1))
+    current_basis = axes / np.where(scales == 0, 1, scales)[:, None, :]
+
+    def normalized(vectors):
+        lengths = np.sqrt(np.sum(vectors * vectors, axis=-1, keepdims=True))
+        return vectors / np.where(lengths == 0, 1, lengths), lengths[..., 0]
+
+    forward, _ = normalized(np.broadcast_to(targets, positions.shape) - positions)
+
+    # The y axis is the up vector projected onto the plane facing the target.
+    # When looking straight up or down, keep the current y axis instead.
+    up = np.broadcast_to(np.asarray(up_vector, dtype=np.float64), forward.shape)
+    y_axis, y_lengths = normalized(
+        up - np.sum(up * forward, axis=-1, keepdims=True) * forward
+    )
+    degenerate = y_lengths < 1e-8
+    if np.any(degenerate):
+        current_y = current_basis[degenerate, :, 1]
+        y_axis[degenerate], _ = normalized(
+            current_y
+            - np.sum(current_y * forward[degenerate], axis=-1, keepdims=True)
+            * forward[degenerate]
+        )
 
-    camera_position = camera.model_matrix[:, 3][:3]
-    camera.model_matrix = (
-        opengl.translation_matrix(*camera_position)
-        @ rotation_matrix
-        @ opengl.translation_matrix(*-camera_position)
-        @ camera.model_matrix
+    basis = np.empty_like(axes)
+    basis[:, :, 2] = sign * forward
+    basis[:, :, 1] = y_axis
+    # x = y × z, written out since np.cross is slow for small arrays.
+    z_axis = basis[:, :, 2]
+    basis[:, :, 0] = (
+        y_axis[:, [1, 2, 0]] * z_axis[:, [2, 0, 1]]
+        - y_axis[:, [2, 0, 1]] * z_axis[:, [1, 2, 0]]
     )
-    if isinstance(camera, Mesh):
-        camera.normal_matrix = rotation_matrix @ camera.normal_matrix
 
-    # Rotate the camera so that it's right-side-up.
-    # Project the z-axis onto the plane defined by the camera->target vector.
-    projected_z_axis = normalize(
-        up_vector - np.dot(up_vector, camera_to_target) * camera_to_target
-    )
+    model_matrices[:, :3, :3] = basis * scales[:, None, :]
+    rotations = basis @ np.swapaxes(current_basis, 1, 2)
+    return model_matrices, rotations
 
-    # Rotate the camera so that its y-axis is aligned with the z-axis.
-    camera_y_vec = camera.model_matrix[:3, 1]
-    rotation_axis = np.cross(projected_z_axis, camera_y_vec)
-    angle = 2 * np.arctan2(
-        np.linalg.norm(projected_z_axis - normalize(camera_y_vec)),
-        np.linalg.norm(projected_z_axis + normalize(camera_y_vec)),
-    )
-    rotation_matrix = space_ops.rotation_matrix(
-        -angle,
-        rotation_axis,
-        homogeneous=True,
-    )
 
-    camera.model_matrix = (
-        opengl.translation_matrix(*-camera_position)
-        @ rotation_matrix
-        @ opengl.translation_matrix(*camera_position)
-        @ camera.model_matrix
-    )
-    if isinstance(camera, Mesh):
-        camera.normal_matrix = rotation_matrix @ camera.normal_matrix
+def look_at(camera, target, up_vector=OUT, looking_axis="-z"):
+    # Rotate the camera about its position so that it points toward the target
+    # and is right-side-up.
+    look_at_many([camera], target, up_vector, looking_axis)
+
+
+def look_at_many(objects, targets, up_vector=OUT, looking_axis="-z"):
+    """Like look_at, for many objects (and one target, or one per object) at
+    once."""
+    if not objects:
+        return
+    model_matrices, rotations = look_at_matrices(
+        [obj.model_matrix for obj in objects], targets, up_vector, looking_axis
+    )
+    stores = {getattr(obj, "_transform_store", None) for obj in objects}
+    if len(stores) == 1 and None not in stores:
+        # Objects in the same TransformStore are updated with a single write.
+        (store,) = stores
+        indices = store.indices(objects)
+        store.model_matrices[indices] = model_matrices
+        store.invalidate()
+    else:
+        for obj, model_matrix in zip(objects, model_matrices):
+            obj.model_matrix = model_matrix
+    for obj, rotation in zip(objects, rotations):
+        if isinstance(obj, Mesh) and not isinstance(obj, CachedTransform):
+            normal_rotation = np.eye(4)
+            normal_rotation[:3, :3] = rotation
+            obj.normal_matrix = normal_rotation @ obj.normal_matrix
+
+
+def get_mouse_ray(scene):
+    """Return the world space ray through the mouse point as (origin, direction),
+    with direction a unit vector, for passing to threejs.pick()."""
+    camera = scene.camera
+    x, y = scene.mouse_point.get_center()[:2]
+    # The projection matrix is stored as the shader takes it, in column-major
+    # order.
+    projection_matrix = np.reshape(camera.projection_matrix, (4, 4)).T
+    clip_to_world = np.linalg.inv(
+        projection_matrix @ camera.get_view_matrix(format=False)
+    )
+    ndc = np.array([x / config["frame_x_radius"], y / config["frame_y_radius"]])
+    near, far = (clip_to_world @ [*ndc, z, 1] for z in (-1, 1))
+    near = near[:3] / near[3]
+    far = far[:3] / far[3]
+    return near, normalize(far - near)
 
 
 def mouse_over_camera_frame_mob(scene, mob):
@@ -372,6 +599,149 @@ def mouse_over_camera_frame_mob(scene, mob):
     return x_condition and y_condition
 
 
+class HitTestRegistry:
+    """Finds the widget (e.g. a get_button()) in front of the camera which is
+    under the mouse, like mouse_over_camera_frame_mob does for one widget.
+
+    The mouse point, scaled by scale, is placed on the plane near units in front
+    of the camera, so a widget is hit when the point, in the widget's model
+    space, lies within its bounding box. For each widget the registry keeps the
+    inverse of its transform relative to the camera (restricted to that plane)
+    and the region of the plane it covers, and only recomputes them when one of
+    the model matrices they depend on changes. The regions are kept in a uniform
+    grid, so a query only tests the widgets in the grid cell of the mouse point.
+    """
+
+    def __init__(self, scene, near=2, scale=1 / 6, cell_size=0.25, max_cells=256):
+        self.scene = scene
+        self.near = near
+        self.scale = scale
+        self.cell_size = cell_size
+        # Widgets covering more cells than this (e.g. ones seen almost edge on)
+        # are tested for every query instead.
+        self.max_cells = max_cells
+        self.widgets = []
+        self.click_callbacks = {}
+        # id(widget) -> (matrices key, camera, A, b, bounding box, region), where
+        # the widget's model space x, y for plane point p are A @ p + b.
+        self.cache = {}
+        # Grid cell -> widgets whose region overlaps it, topmost first.
+        self.grid = None
+        self.unindexed = []
+
+    def add(self, widget, on_click=None):
+        self.widgets.append(widget)
+        if on_click is not None:
+            self.click_callbacks[id(widget)] = on_click
+        self.grid = None
+
+    def remove(self, widget):
+        self.widgets = [w for w in self.widgets if w is not widget]
+        self.click_callbacks.pop(id(widget), None)
+        self.cache.pop(id(widget), None)
+        self.grid = None
+
+    def refresh(self, widget):
+        """Recompute the bounding box of a widget whose points have changed."""
+        self.cache.pop(id(widget), None)
+        self.grid = None
+
+    def transform_chain(self, widget, camera):
+        # The model matrices from the widget up to the camera, or to the root
+        # followed by the camera's when the widget isn't attached to it.
+        matrices = []
+        node = widget
+        while node is not None and node is not camera:
+            matrices.append(node.model_matrix)
+            node = getattr(node, "parent", None)
+        if node is None:
+            matrices.append(camera.model_matrix)
+        return matrices, node is None
+
+    def update_widget(self, widget, camera):
+        matrices, detached = self.transform_chain(widget, camera)
+        key = b"".join(np.asarray(m, dtype=np.float64).tobytes() for m in matrices)
+        cached = self.cache.get(id(widget))
+        if cached is not None and cached[0] == key and cached[1] is camera:
+            return False
+
+        relative = np.eye(4)
+        for matrix in matrices[:-1] if detached else matrices:
+            relative = matrix @ relative
+        if detached:
+            relative = np.linalg.inv(matrices[-1]) @ relative
+        model_inv = np.linalg.inv(relative)
+        a = model_inv[:2, :2]
+        b = model_inv[:2, 3] - model_inv[:2, 2] * self.near
+
+        if cached is not None:
+            bounding_box = cached[4]
+        else:
+            bounding_box = widget.get_bounding_box()[[0, 2], :2]
+        region = None
+        if np.linalg.det(a) != 0:
+            # The box's corners, back on the plane.
+            corners = np.array(
+                [[x, y] for x in bounding_box[:, 0] for y in bounding_box[:, 1]]
+            )
+            plane_corners = np.linalg.solve(a, (corners - b).T).T
+            region = np.array([plane_corners.min(axis=0), plane_corners.max(axis=0)])
+        self.cache[id(widget)] = (key, camera, a, b, bounding_box, region)
+        return True
+
+    def build_grid(self):
+        self.grid = collections.defaultdict(list)
+        self.unindexed = []
+        for widget in reversed(self.widgets):
+            region = self.cache[id(widget)][5]
+            if region is None:
+                continue
+            (x0, y0), (x1, y1) = np.floor(region / self.cell_size)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+                self.unindexed.append(widget)
+                continue
+            for i in range(int(x0), int(x1) + 1):
+                for j in range(int(y0), int(y1) + 1):
+                    self.grid[(i, j)].append(widget)
+
+    def widget_at(self, point):
+        """The topmost (last added) widget under a mouse point, or None."""
+        camera = self.scene.camera
+        changed = False
+        for widget in self.widgets:
+            changed |= self.update_widget(widget, camera)
+        if changed or self.grid is None:
+            self.build_grid()
+
+        plane_point = np.asarray(point[:2]) * self.scale
+        cell = tuple(np.floor(plane_point / self.cell_size).astype(int))
+        candidates = self.grid.get(cell, [])
+        if self.unindexed:
+            candidates = sorted(
+                candidates + self.unindexed,
+                key=lambda widget: -self.widgets.index(widget),
+            )
+        for widget in candidates:
+            _, _, a, b, bounding_box, _ = self.cache[id(widget)]
+            x, y = a @ plane_point + b
+            if (
+                bounding_box[0, 0] <= x <= bounding_box[1, 0]
+                and bounding_box[0, 1] <= y <= bounding_box[1, 1]
+            ):
+                return widget
+        return None
+
+    def hovered(self):
+        return self.widget_at(self.scene.mouse_point.get_center())
+
+    def click(self):
+        """Call the click callback of the widget under the mouse."""
+        widget = self.hovered()
+        if widget is not None and id(widget) in self.click_callbacks:
+            self.click_callbacks[id(widget)]()
+        return widget
+
+
 def get_button(scene, text):
     # Add a button.
     camera_button = OpenGLVGroup()
@@ -1,3 +1,4 @@
+const os = require('os');
 const puppeteer = require('puppeteer');
 THREE = require('three')
 var grpc = require("@grpc/grpc-js");
@@ -38,6 +39,7 @@ function getServer() {
     circleGeometry: circleGeometry,
     planeGeometry: planeGeometry,
     extrudeGeometry: extrudeGeometry,
+    batchGeometry: batchGeometry,
   });
   server.addService(testservice.MaterialService.service, {
     basicMaterial: basicMaterial,
@@ -147,12 +149,12 @@ function icosahedronGeometry(call, callback) {
   (async () => {
     const puppetResponse = await page.evaluate((call) => {
       const geometry = new THREE.IcosahedronGeometry(
-        call.request.raius || 1,
+        call.request.radius || 1,
         call.request.detail || 0,
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -169,7 +171,7 @@ function torusKnotGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -186,7 +188,7 @@ function boxGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -204,7 +206,7 @@ function sphereGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -217,7 +219,7 @@ function tetrahedronGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -236,7 +238,7 @@ function cylinderGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -254,7 +256,7 @@ function coneGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -269,7 +271,7 @@ function circleGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -284,7 +286,7 @@ function planeGeometry(call, callback) {
       );
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
@@ -325,42 +327,38 @@ function extrudeGeometry(call, callback) {
       // Assume a path is a hole if its first point is inside the previous shape. Assumes each shape
       // is followed by all of its holes.
       let shapes = [];
-      let holes = [];
       for (let i = 0; i < shapePoints.length; i++) {
-        let isHole = (shapes.length > 0 && pointInsidePolygon(shapePoints[i][0], shapes[shapes.length-1]));
+        let isHole = (shapes.length > 0 && pointInsidePolygon(shapePoints[i][0], shapes[shapes.length-1].points));
         if (isHole) {
-          holes.push(shapePoints[i]);
+          shapes[shapes.length-1].holes.push(shapePoints[i]);
         } else {
-          shapes.push(shapePoints[i]);
+          shapes.push({ points: shapePoints[i], holes: [] });
         }
       }
 
-      // Construct the final shape.
-      let shape = new THREE.Shape();
-      for (let i = 0; i < shapes.length; i++) {
+      function tracePath(path, points) {
         /**
           [p00, p01, p02]
           [p10, p11, p12]
           [p20, p21, p22]
         **/
-        for (let j = 0; j < shapes[i].length; j+=3) {
+        for (let j = 0; j < points.length; j+=3) {
           if (j == 0) {
-            shape.moveTo(shapes[i][j][0], shapes[i][j][1]);
+            path.moveTo(points[j][0], points[j][1]);
           }
-          shape.quadraticCurveTo(shapes[i][j+1][0], shapes[i][j+1][1], shapes[i][j+2][0], shapes[i][j+2][1]);
+          path.quadraticCurveTo(points[j+1][0], points[j+1][1], points[j+2][0], points[j+2][1]);
         }
+        return path;
       }
 
-      for (let i = 0; i < holes.length; i++) {
-        let hole = new THREE.Path();
-        for (let j = 0; j < holes[i].length; j+=3) {
-          if (j == 0) {
-            hole.moveTo(holes[i][j][0], holes[i][j][1]);
-          }
-          hole.quadraticCurveTo(holes[i][j+1][0], holes[i][j+1][1], holes[i][j+2][0], holes[i][j+2][1]);
+      // Construct the final shapes, each with its own holes.
+      let threeShapes = shapes.map((shape) => {
+        let threeShape = tracePath(new THREE.Shape(), shape.points);
+        for (let i = 0; i < shape.holes.length; i++) {
+          threeShape.holes.push(tracePath(new THREE.Path(), shape.holes[i]));
         }
-        shape.holes.push(hole);
-      }
+        return threeShape;
+      });
 
       const extrudeSettings = {
         steps: call.request.steps || 1,
@@ -372,25 +370,78 @@ function extrudeGeometry(call, callback) {
         bevelSegments: call.request.bevel_segments || 8
       };
 
-      const geometry = new THREE.ExtrudeGeometry(shape, extrudeSettings);
+      const geometry = new THREE.ExtrudeGeometry(threeShapes, extrudeSettings);
       return { geometry };
     }, call);
-    callback(null, serializePuppetGeometry(puppetResponse.geometry));
+    callback(null, serializePuppetGeometry(puppetResponse.geometry, wantsPackedGeometry(call)));
   })();
 }
 
-function serializePuppetGeometry(geometry) {
+const geometryHandlers = {
+  box_geometry: boxGeometry,
+  sphere_geometry: sphereGeometry,
+  torus_knot_geometry: torusKnotGeometry,
+  icosahedron_geometry: icosahedronGeometry,
+  tetrahedron_geometry: tetrahedronGeometry,
+  cylinder_geometry: cylinderGeometry,
+  cone_geometry: coneGeometry,
+  circle_geometry: circleGeometry,
+  plane_geometry: planeGeometry,
+  extrude_geometry: extrudeGeometry,
+};
+
+function batchGeometry(call, callback) {
+  (async () => {
+    const responses = await Promise.all(call.request.requests.map((request) => {
+      const handler = geometryHandlers[request.geometry];
+      const subcall = { request: request[request.geometry], metadata: call.metadata };
+      return new Promise((resolve, reject) => {
+        handler(subcall, (error, response) => error ? reject(error) : resolve(response));
+      });
+    }));
+    callback(null, { responses: responses });
+  })().catch((error) => callback(error));
+}
+
+function wantsPackedGeometry(call) {
+  return call.metadata.get('geometry-encoding').includes('packed');
+}
+
+function serializePuppetGeometry(geometry, packed) {
+  let position = puppetObjectToArray(geometry.attributes.position.array);
+  let normal = puppetObjectToArray(geometry.attributes.normal.array);
+  let uv = puppetObjectToArray(geometry.attributes.uv.array);
+  let index = geometry.index !== null ? puppetObjectToArray(geometry.index.array) : [];
+  if (packed) {
+    return {
+      vertex_count: position.length / 3,
+      index_count: index.length,
+      packed_position: packLittleEndian(new Float32Array(position)),
+      packed_normal: packLittleEndian(new Float32Array(normal)),
+      packed_uv: packLittleEndian(new Float32Array(uv)),
+      packed_index: packLittleEndian(new Uint32Array(index)),
+    };
+  }
+
   let response = {
-    position: puppetObjectToArray(geometry.attributes.position.array),
-    normal: puppetObjectToArray(geometry.attributes.normal.array),
-    uv: puppetObjectToArray(geometry.attributes.uv.array),
+    position: position,
+    normal: normal,
+    uv: uv,
   };
   if (geometry.index !== null) {
-    response.index = puppetObjectToArray(geometry.index.array);
+    response.index = index;
   }
 	return response;
 }
 
+function packLittleEndian(typedArray) {
+  let buffer = Buffer.from(typedArray.buffer, typedArray.byteOffset, typedArray.byteLength);
+  if (os.endianness() !== 'LE') {
+    buffer.swap32();
+  }
+  return buffer;
+}
+
 function puppetObjectToArray(obj) {
   let ret = [];
   let i = 0;